@@ -7,9 +7,295 @@ Periyodik Tablo Şifreleme Uygulaması - Animasyon Modülü
 import tkinter as tk
 import time
 from tkinter import Canvas
+from array import array
 import random
 import math
 
+from frame_scheduler import FrameScheduler
+
+
+class _ParticleOverlay:
+    """
+    Tek bir patlamanın parçacıklarını çizen, patlama bölgesi kadar küçük katman
+
+    Canvas patlama merkezinin çevresindeki 2 × YARICAP'lik kareye yerleştirilir;
+    böylece aynı anda süren patlamalar aralarındaki düğmeleri örtmez. Ovaller
+    ilk ihtiyaçta oluşturulur ve katman yeniden kullanıldıkça korunur.
+    Parçacık durumu düz dizilerde tutulur; canlı parçacıklar dizilerin
+    başındadır ve ölen parçacığın yerine son canlı parçacık taşınır.
+    """
+
+    def __init__(self, system):
+        self.system = system
+        boyut = 2 * system.YARICAP
+        self.canvas = Canvas(system.parent, width=boyut, height=boyut, highlightthickness=0)
+        # Katmana gelen tıklamalar altında kalan düğmeye iletilir
+        self.canvas.bind("<Button-1>", system._forward_click)
+        self.canvas.bind("<Destroy>", lambda event: system._discard(self))
+
+        self._ids = []
+        self._x = array('d')
+        self._y = array('d')
+        self._dx = array('d')
+        self._dy = array('d')
+        self._boyut = array('d')
+        self._olum = array('d')
+        self.canli = 0
+        self.bitis = 0.0
+        self._sol = 0
+        self._ust = 0
+
+    def start(self, x, y, sayi, saat, duration, colors, size_range):
+        """
+        Katmanı (x, y) merkezine yerleştirir ve sayi parçacıkla patlamayı başlatır
+        """
+        r = self.system.YARICAP
+        self._sol = int(x) - r
+        self._ust = int(y) - r
+        self.bitis = saat + duration
+        self.canvas.place(x=self._sol, y=self._ust)
+
+        while len(self._ids) < sayi:
+            self._ids.append(self.canvas.create_oval(0, 0, 0, 0, outline="", state="hidden"))
+            for dizi in (self._x, self._y, self._dx, self._dy, self._boyut, self._olum):
+                dizi.append(0.0)
+
+        for i in range(sayi):
+            # Rastgele yön ve hız
+            angle = random.uniform(0, 2 * math.pi)
+            speed = random.uniform(1, 3)
+            self._x[i] = x - self._sol
+            self._y[i] = y - self._ust
+            self._dx[i] = math.cos(angle) * speed
+            self._dy[i] = math.sin(angle) * speed
+
+            # Rastgele boyut ve yaşam süresi çarpanı
+            self._boyut[i] = random.uniform(size_range[0], size_range[1])
+            self._olum[i] = saat + duration * random.uniform(0.7, 1.0)
+            self.canvas.itemconfigure(self._ids[i], fill=random.choice(colors), state="normal")
+        self.canli = sayi
+        ParticleSystem._toplam_canli += sayi
+        self.draw()
+
+    def draw(self):
+        coords = self.canvas.coords
+        ids, xs, ys, boyutlar = self._ids, self._x, self._y, self._boyut
+        for i in range(self.canli):
+            x = xs[i]
+            y = ys[i]
+            boyut = boyutlar[i]
+            coords(ids[i], x - boyut, y - boyut, x + boyut, y + boyut)
+
+    def _kill(self, i):
+        """
+        i. parçacığı öldürür; yerine son canlı parçacık taşınır
+        """
+        son = self.canli - 1
+        self.canvas.itemconfigure(self._ids[i], state="hidden")
+        if i != son:
+            self._ids[i], self._ids[son] = self._ids[son], self._ids[i]
+            for dizi in (self._x, self._y, self._dx, self._dy, self._boyut, self._olum):
+                dizi[i] = dizi[son]
+        self.canli = son
+        ParticleSystem._toplam_canli -= 1
+
+    def update(self, saat, carpan, yol):
+        """
+        Canlı parçacıkları bir kare ilerletir; patlama sürüyorsa True döndürür
+        """
+        i = 0
+        while i < self.canli:
+            if saat >= self._olum[i]:
+                self._kill(i)
+                continue
+            self._x[i] += self._dx[i] * yol
+            self._y[i] += self._dy[i] * yol
+            self._dx[i] *= carpan
+            self._dy[i] *= carpan
+            i += 1
+
+        if not self.canli or saat >= self.bitis:
+            self.release()
+            return False
+        self.draw()
+        return True
+
+    def release(self):
+        """
+        Kalan parçacıkları genel sayıdan düşer ve katmanı gizler
+        """
+        ParticleSystem._toplam_canli -= self.canli
+        try:
+            for i in range(self.canli):
+                self.canvas.itemconfigure(self._ids[i], state="hidden")
+            self.canvas.place_forget()
+        except tk.TclError:
+            pass
+        self.canli = 0
+
+
+class ParticleSystem:
+    """
+    Bir parent widget'ın tüm parçacık efektlerini yöneten havuzlu parçacık sistemi
+
+    Her patlama, yalnızca kendi bölgesini kaplayan küçük bir katmanda çizilir;
+    katmanlar ve ovalleri havuzda tutulup yeniden kullanılır ve tüm katmanlar
+    tek bir zamanlayıcı animasyonuyla ilerletilir. Katmanlara gelen
+    tıklamalar altlarındaki düğmeye iletilir. Tüm sistemlerdeki canlı parçacık
+    sayısı MAX_LIVE_PARTICLES ile sınırlıdır; sınır dolduğunda yeni
+    patlamalar yalnızca sığan kadar parçacık üretir. Katman ya da parent yok
+    edildiğinde veya sistem iptal edildiğinde canlı parçacıklar sınırdan düşülür.
+    """
+
+    # Parent başına sistem
+    _sistemler = {}
+    # Tüm sistemlerdeki canlı parçacıklar için üst sınır
+    MAX_LIVE_PARTICLES = 300
+    _toplam_canli = 0
+
+    # Parçacık hareketi 20 ms'lik kareler için tanımlıdır
+    KARE_SURESI = 20
+    SONUM = 0.95
+    # Patlama merkezinin çevresinde katmanın kapladığı yarı genişlik
+    YARICAP = 50
+
+    def __init__(self, parent, pool_size=150):
+        """
+        Parameters:
+        -----------
+        parent : tk.Widget
+            Efektlerin gösterileceği widget
+        pool_size : int, optional
+            Bu sistemdeki en fazla canlı parçacık sayısı
+        """
+        self.parent = parent
+        self.pool_size = pool_size
+        self._aktif = []
+        self._bos = []
+        self._saat = 0.0
+        self._animasyon = None
+
+    @classmethod
+    def for_parent(cls, parent):
+        """
+        Parent widget'ın parçacık sistemini döndürür (yoksa oluşturur)
+        """
+        anahtar = str(parent)
+        sistem = cls._sistemler.get(anahtar)
+        if sistem is None or not sistem.parent.winfo_exists():
+            if sistem is not None:
+                sistem.cancel()
+            sistem = cls(parent)
+            cls._sistemler[anahtar] = sistem
+        return sistem
+
+    def burst(self, x, y, particle_count, duration, colors, size_range):
+        """
+        Verilen noktadan parçacık patlaması başlatır
+
+        Parameters:
+        -----------
+        x, y : int
+            Patlama merkezinin parent içindeki koordinatları
+        particle_count : int
+            İstenen parçacık sayısı (havuz ve genel sınıra göre kırpılır)
+        duration : int
+            Efekt süresi (milisaniye)
+        colors : list
+            Parçacık renkleri listesi
+        size_range : tuple
+            Parçacık boyut aralığı (min, max)
+        """
+        canli = sum(katman.canli for katman in self._aktif)
+        bos = min(self.pool_size - canli,
+                  ParticleSystem.MAX_LIVE_PARTICLES - ParticleSystem._toplam_canli)
+        sayi = max(0, min(particle_count, bos))
+        if not sayi:
+            return
+
+        katman = self._bos.pop() if self._bos else _ParticleOverlay(self)
+        self._aktif.append(katman)
+        katman.start(x, y, sayi, self._saat, duration, colors, size_range)
+
+        if self._animasyon is None:
+            self._animasyon = FrameScheduler.for_widget(self.parent).add(
+                self._update, self.parent, self.KARE_SURESI)
+
+    def cancel(self):
+        """
+        Tüm patlamaları durdurur ve canlı parçacıkları genel sınırdan düşer
+        """
+        if self._animasyon is not None:
+            self._animasyon.cancel()
+            self._animasyon = None
+        for katman in self._aktif:
+            katman.release()
+        self._bos.extend(self._aktif)
+        self._aktif = []
+
+    def _discard(self, katman):
+        """
+        Yok edilen katmanı havuzdan çıkarır (<Destroy> ile çağrılır)
+        """
+        katman.release()
+        if katman in self._aktif:
+            self._aktif.remove(katman)
+        if katman in self._bos:
+            self._bos.remove(katman)
+
+    def _forward_click(self, event):
+        """
+        Katmana gelen tıklamayı katmanın altında kalan düğmeye iletir
+        """
+        katmanlar = {str(katman.canvas) for katman in self._aktif + self._bos}
+        widget = self.parent
+        while True:
+            for child in reversed(widget.winfo_children()):
+                if str(child) in katmanlar or not child.winfo_ismapped():
+                    continue
+                if child.winfo_toplevel() is not widget.winfo_toplevel():
+                    continue
+                x, y = child.winfo_rootx(), child.winfo_rooty()
+                if x <= event.x_root < x + child.winfo_width() and y <= event.y_root < y + child.winfo_height():
+                    widget = child
+                    break
+            else:
+                break
+
+        invoke = getattr(widget, 'invoke', None)
+        if invoke is not None:
+            invoke()
+        return "break"
+
+    def _update(self, gecen):
+        """
+        Tüm patlamaları bir kare ilerletir
+        """
+        self._saat += gecen
+
+        # Geride kalınan kareler hız sönümü kapalı biçimde hesaplanarak
+        # tek karede uygulanır
+        carpan = self.SONUM ** (gecen / self.KARE_SURESI)
+        yol = (1 - carpan) / (1 - self.SONUM)
+
+        try:
+            suren = []
+            for katman in self._aktif:
+                if katman.update(self._saat, carpan, yol):
+                    suren.append(katman)
+                else:
+                    self._bos.append(katman)
+            self._aktif = suren
+        except tk.TclError:
+            # Çizim sırasında widget kapatıldıysa parçacıklar sınırdan düşülür
+            self.cancel()
+            raise
+
+        if not self._aktif:
+            self._animasyon = None
+            return False
+        return True
+
 
 class AnimationEffects:
     """
@@ -37,11 +323,21 @@ class AnimationEffects:
         # Orijinal renge geri dön
         button.after(duration, lambda: button.config(background=original_bg))
 
+    # Widget başına çalışan daktilo efektinin zamanlayıcısı
+    _typewriter_jobs = {}
+
     @staticmethod
-    def typewriter_effect(text_widget, text, delay=50):
+    def typewriter_effect(text_widget, text, delay=50, frame_ms=16, frame_budget_ms=8,
+                          max_duration_ms=1000, instant_threshold=100000):
         """
         Daktilo efekti ile metin yazma
 
+        Her karede, geçen süreye göre yazılmış olması gereken karakterler
+        parçalar halinde ve kare bütçesi dolana kadar tek seferde eklenir;
+        update() çağrılmaz. Uzun metinlerde karakter gecikmesi toplam süre
+        max_duration_ms'yi aşmayacak şekilde kısaltılır, instant_threshold'dan
+        uzun metinler ise doğrudan yazılır.
+
         Parameters:
         -----------
         text_widget : tk.Text
@@ -50,17 +346,54 @@ class AnimationEffects:
             Yazılacak metin
         delay : int
             Karakterler arası gecikme (milisaniye)
+        frame_ms : int
+            Kareler arası süre (milisaniye)
+        frame_budget_ms : int
+            Bir karede metin eklemeye ayrılan en uzun süre (milisaniye)
+        max_duration_ms : int
+            Efektin toplam süresi için üst sınır (milisaniye)
+        instant_threshold : int
+            Bu uzunluktan uzun metinler efektsiz, tek seferde yazılır
         """
-        text_widget.delete("1.0", "end")
+        jobs = AnimationEffects._typewriter_jobs
+        anahtar = str(text_widget)
 
-        def add_char(index=0):
-            if index < len(text):
-                text_widget.insert("end", text[index])
-                text_widget.see("end")
-                text_widget.update()
-                text_widget.after(delay, lambda: add_char(index + 1))
+        # Aynı widget'ta süren önceki efekt durdurulur
+        onceki = jobs.pop(anahtar, None)
+        if onceki is not None:
+            onceki.cancel()
 
-        add_char()
+        text_widget.delete("1.0", "end")
+        if not text or len(text) > instant_threshold or delay <= 0:
+            text_widget.insert("end", text)
+            text_widget.see("end")
+            return
+
+        delay = min(delay, max_duration_ms / len(text))
+        parca_boyutu = 1024
+        gecen_sure = 0.0
+        yazilan = 0
+
+        def add_frame(gecen):
+            nonlocal yazilan, gecen_sure
+            gecen_sure += gecen
+            hedef = min(len(text), int(gecen_sure / delay) + 1)
+            bitis = time.perf_counter() + frame_budget_ms / 1000
+
+            while yazilan < hedef:
+                son = min(hedef, yazilan + parca_boyutu)
+                text_widget.insert("end", text[yazilan:son])
+                yazilan = son
+                if time.perf_counter() >= bitis:
+                    break
+            text_widget.see("end")
+            if yazilan < len(text):
+                return True
+            jobs.pop(anahtar, None)
+            return False
+
+        # Widget kapatılırsa zamanlayıcı efekti sessizce bitirir
+        jobs[anahtar] = FrameScheduler.for_widget(text_widget).add(add_frame, text_widget, frame_ms)
 
     @staticmethod
     def path_animation(canvas, start_x, start_y, end_x, end_y, duration=500, color='red', steps=20, width=2):
@@ -84,31 +417,27 @@ class AnimationEffects:
         width : int
             Çizgi kalınlığı
         """
-        dx = (end_x - start_x) / steps
-        dy = (end_y - start_y) / steps
         step_delay = duration / steps
-
-        def draw_step(step=0, last_line=None):
-            if step < steps:
-                if last_line:
-                    canvas.delete(last_line)
-
-                x = start_x + dx * step
-                y = start_y + dy * step
-                line = canvas.create_line(start_x, start_y, x, y, fill=color, width=width, arrow=tk.LAST)
-
-                canvas.update()
-                canvas.after(int(step_delay), lambda: draw_step(step + 1, line))
-            else:
-                # Son çizgiyi çiz ve bırak
-                if last_line:
-                    canvas.delete(last_line)
-                final_line = canvas.create_line(start_x, start_y, end_x, end_y, fill=color, width=width, arrow=tk.LAST)
-
-                # Bir süre sonra çizgiyi sil (opsiyonel)
-                canvas.after(1000, lambda: canvas.delete(final_line))
-
-        draw_step()
+        line = canvas.create_line(start_x, start_y, start_x, start_y, fill=color, width=width, arrow=tk.LAST)
+        gecen_sure = 0.0
+
+        def draw_step(gecen):
+            nonlocal gecen_sure
+            gecen_sure += gecen
+            if gecen_sure >= duration + 1000:
+                # Son çizgi bir süre gösterildikten sonra silinir
+                canvas.delete(line)
+                return False
+
+            # Çizgi yeniden oluşturulmaz, yalnızca ucu taşınır; geride kalınan
+            # adımlar tek karede atlanır
+            step = min(steps, int(gecen_sure / step_delay))
+            oran = step / steps
+            canvas.coords(line, start_x, start_y,
+                          start_x + (end_x - start_x) * oran, start_y + (end_y - start_y) * oran)
+            return True
+
+        FrameScheduler.for_widget(canvas).add(draw_step, canvas, step_delay)
 
     @staticmethod
     def create_particle_effect(parent, x, y, particle_count=20, duration=1000, colors=None, size_range=(2, 5)):
@@ -133,64 +462,8 @@ class AnimationEffects:
         if colors is None:
             colors = ['#ff0000', '#00ff00', '#0000ff', '#ffff00', '#ff00ff', '#00ffff']
 
-        # Canvas oluştur
-        canvas = Canvas(parent, highlightthickness=0)
-        canvas.place(x=x - 50, y=y - 50, width=100, height=100)
-
-        particles = []
-
-        # Parçacıkları oluştur
-        for _ in range(particle_count):
-            # Rastgele yön ve hız
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            dx = math.cos(angle) * speed
-            dy = math.sin(angle) * speed
-
-            # Rastgele renk ve boyut
-            color = random.choice(colors)
-            size = random.uniform(size_range[0], size_range[1])
-
-            # Parçacığı çiz
-            particle = canvas.create_oval(50 - size, 50 - size, 50 + size, 50 + size, fill=color, outline="")
-
-            particles.append({
-                'id': particle,
-                'dx': dx,
-                'dy': dy,
-                'life': random.uniform(0.7, 1.0)  # Yaşam süresi çarpanı
-            })
-
-        start_time = time.time()
-
-        def update_particles():
-            nonlocal particles
-
-            current_time = time.time()
-            elapsed = (current_time - start_time) * 1000  # ms cinsinden
-
-            if elapsed > duration or not particles:
-                canvas.destroy()
-                return
-
-            for particle in particles[:]:
-                # Parçacığı güncelle
-                canvas.move(particle['id'], particle['dx'], particle['dy'])
-
-                # Zamanla saydamlaştır
-                life_factor = 1.0 - (elapsed / duration / particle['life'])
-                if life_factor <= 0:
-                    canvas.delete(particle['id'])
-                    particles.remove(particle)
-                    continue
-
-                # Hızı azalt
-                particle['dx'] *= 0.95
-                particle['dy'] *= 0.95
-
-            canvas.after(20, update_particles)
-
-        update_particles()
+        # Parent başına havuzlu, patlama başına küçük katmanlı sistem kullanılır
+        ParticleSystem.for_parent(parent).burst(x, y, particle_count, duration, colors, size_range)
 
     @staticmethod
     def highlight_text(text_widget, start_index, end_index, tag_name="highlight",
@@ -282,8 +555,14 @@ class AnimationEffects:
         # Dönüşüm animasyonu adımları
         steps = 10
         delay = 100  # ms
+        gecen_sure = 0.0
+        element_id = None
+
+        def transform_step(gecen):
+            nonlocal gecen_sure, element_id
+            gecen_sure += gecen
+            step = int(gecen_sure / delay)
 
-        def transform_step(step=0):
             if step < steps:
                 # Opaklık azaltma
                 opacity = 1.0 - (step / steps)
@@ -298,15 +577,18 @@ class AnimationEffects:
                 font_size = int(size * size_factor)
 
                 canvas.itemconfig(text_id, fill=color, font=("Arial", font_size))
-                canvas.update()
+                return True
 
-                canvas.after(delay, lambda: transform_step(step + 1))
-            else:
+            if element_id is None:
                 # Eski metni sil ve yeni elementi göster
                 canvas.delete(text_id)
                 element_id = canvas.create_text(x, y, text=element, font=("Arial", size), fill="red")
 
-                # Element görünümünü iyileştir
-                canvas.after(500, lambda: canvas.itemconfig(element_id, font=("Arial", size, "bold")))
+            if gecen_sure < (steps * delay) + 500:
+                return True
+
+            # Element görünümünü iyileştir
+            canvas.itemconfig(element_id, font=("Arial", size, "bold"))
+            return False
 
-        transform_step()
\ No newline at end of file
+        FrameScheduler.for_widget(canvas).add(transform_step, canvas, delay)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Arka Plan İşleri
+
+Uzun süren şifreleme/deşifreleme işlerini Tk ana iş parçacığı dışında
+çalıştırır. İş parçacığı log mesajlarını, ilerleme bilgisini ve sonucu bir
+kuyruğa yazar; ana iş parçacığı kuyruğu root.after ile kısa aralıklarla ve
+her seferinde sınırlı bir süre boyunca okur, böylece arayüz yanıt vermeye
+devam eder.
+"""
+
+import queue
+import threading
+import time
+
+
+class JobCancelled(Exception):
+    """
+    İş iptal edildiğinde iş parçacığında yükseltilen istisna
+    """
+
+
+class _JobLog:
+    """
+    İş parçacığındaki log mesajlarını toplayıp kuyruğa gruplar halinde yazar
+
+    Cipher geri çağırma sözleşmesine uyar: log(mesaj) ve log.extend(mesajlar).
+    Her grup gönderiminde iptal durumu kontrol edilir.
+    """
+
+    def __init__(self, job, batch_size):
+        self._job = job
+        self._batch_size = batch_size
+        self._tampon = []
+
+    def __call__(self, message):
+        self._tampon.append(message)
+        if len(self._tampon) >= self._batch_size:
+            self.flush()
+
+    def extend(self, messages):
+        self._tampon.extend(messages)
+        if len(self._tampon) >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Biriken mesajları kuyruğa gönderir
+        """
+        if self._tampon:
+            tampon, self._tampon = self._tampon, []
+            self._job._put(("log", tampon))
+        self._job.check_cancelled()
+
+
+class BackgroundJob:
+    """
+    Bir işi arka plan iş parçacığında çalıştırıp sonuçlarını Tk'ye aktarır
+
+    İş fonksiyonu work(log, progress, check_cancelled) biçimindedir: log bir
+    cipher geri çağırması gibi kullanılır, progress(oran) 0-1 arası ilerleme
+    bildirir, check_cancelled() iş iptal edildiyse JobCancelled yükseltir.
+    Tüm bildirim fonksiyonları (on_*) Tk ana iş parçacığında çağrılır.
+    """
+
+    def __init__(self, root, work, on_done, on_log=None, on_progress=None,
+                 on_error=None, on_cancelled=None, poll_ms=20, poll_budget_ms=15,
+                 log_batch_size=1000, max_pending=64):
+        """
+        Parameters:
+        -----------
+        root : tk.Tk
+            Kuyruğun okunacağı Tk kök penceresi
+        work : callable
+            Arka planda çalışacak iş fonksiyonu
+        on_done : callable
+            İş bitince sonuçla çağrılır
+        on_log : callable, optional
+            Her log grubu (mesaj listesi) için çağrılır
+        on_progress : callable, optional
+            İlerleme oranı (0-1) ile çağrılır
+        on_error : callable, optional
+            İş bir istisna ile biterse istisna ile çağrılır
+        on_cancelled : callable, optional
+            İş iptal edilince çağrılır
+        poll_ms : int, optional
+            Kuyruğun okunma aralığı
+        poll_budget_ms : int, optional
+            Bir okumada kuyruk işlemeye ayrılan en uzun süre
+        log_batch_size : int, optional
+            Bir log grubundaki en fazla mesaj sayısı
+        max_pending : int, optional
+            Kuyrukta bekleyebilecek en fazla kayıt; dolunca iş parçacığı bekler
+        """
+        self.root = root
+        self.work = work
+        self.on_done = on_done
+        self.on_log = on_log
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.on_cancelled = on_cancelled
+        self.poll_ms = poll_ms
+        self.poll_budget_ms = poll_budget_ms
+
+        self._kuyruk = queue.Queue(maxsize=max_pending)
+        self._iptal = threading.Event()
+        self._log = _JobLog(self, log_batch_size)
+        self._thread = None
+        self.running = False
+
+    def start(self):
+        """
+        İşi başlatır ve kuyruğu okumaya başlar
+        """
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.root.after(self.poll_ms, self._poll)
+
+    def cancel(self):
+        """
+        İşin iptalini ister; iş bir sonraki kontrol noktasında durur
+        """
+        self._iptal.set()
+
+    def check_cancelled(self):
+        """
+        İş iptal edildiyse JobCancelled yükseltir (iş parçacığında çağrılır)
+        """
+        if self._iptal.is_set():
+            raise JobCancelled()
+
+    def _progress(self, oran):
+        self._put(("progress", oran))
+        self.check_cancelled()
+
+    def _put(self, kayit):
+        """
+        Kuyruğa kayıt yazar; kuyruk doluysa iptal edilene kadar bekler
+        """
+        while True:
+            try:
+                self._kuyruk.put(kayit, timeout=0.1)
+                return
+            except queue.Full:
+                if self._iptal.is_set() and kayit[0] in ("log", "progress"):
+                    raise JobCancelled()
+
+    def _run(self):
+        try:
+            result = self.work(self._log, self._progress, self.check_cancelled)
+            self._log.flush()
+        except JobCancelled:
+            self._put(("cancelled", None))
+        except Exception as e:
+            self._put(("error", e))
+        else:
+            self._put(("done", result))
+
+    def _poll(self):
+        """
+        Kuyruktaki kayıtları zaman bütçesi dolana kadar işler
+        """
+        bitis = time.perf_counter() + self.poll_budget_ms / 1000
+        while time.perf_counter() < bitis:
+            try:
+                tur, veri = self._kuyruk.get_nowait()
+            except queue.Empty:
+                break
+
+            if tur == "log":
+                if self.on_log:
+                    self.on_log(veri)
+            elif tur == "progress":
+                if self.on_progress:
+                    self.on_progress(veri)
+            else:
+                self.running = False
+                if tur == "done":
+                    self.on_done(veri)
+                elif tur == "cancelled":
+                    if self.on_cancelled:
+                        self.on_cancelled()
+                elif self.on_error:
+                    self.on_error(veri)
+                return
+
+        self.root.after(self.poll_ms, self._poll)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Ölçeklenme Karşılaştırma Testi
+
+Şifreleme ve deşifreleme işlemlerini farklı girdi boyutlarında çalıştırır ve
+karakter başına süreyi raporlar. Her boyutun süresi en az TEKRAR ölçümün en
+iyisidir (best-of-N). 1M ve üzeri bir boyutta karakter başına süre, önceki
+1M ve üzeri boyutların ortancasını tolerans katından fazla aşıyorsa (doğrusal
+olmayan davranış) sıfırdan farklı çıkış kodu döner; daha küçük boyutlar
+yalnızca raporlanır.
+
+Kullanım:
+    python benchmark.py
+    python benchmark.py --sizes 1K 1M 10M --stream
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import timeit
+
+from cipher import PeriodicCipher
+from data import TURKCE_ALFABE
+
+# Varsayılan girdi boyutları (karakter)
+VARSAYILAN_BOYUTLAR = ["1K", "1M", "10M", "100M"]
+
+# Küçük girdilerde tek ölçümün kapsayacağı en kısa süre (saniye)
+EN_KISA_OLCUM = 0.2
+
+# Her boyut için alınan ölçüm sayısı; en iyisi kullanılır
+TEKRAR = 3
+
+# Ölçeklenme karşılaştırmasına taban olarak katılan en küçük boyut (karakter)
+TABAN_EN_KUCUK_BOYUT = 1000 ** 2
+
+# Akış modunda kullanılan parça boyutu
+AKIS_PARCA_BOYUTU = 1 << 20
+
+
+def parse_size(value):
+    """
+    "1K", "10M" gibi boyut ifadelerini karakter sayısına çevirir
+    """
+    carpanlar = {'K': 1000, 'M': 1000 ** 2, 'G': 1000 ** 3}
+    value = value.strip().upper()
+    if value and value[-1] in carpanlar:
+        return int(float(value[:-1]) * carpanlar[value[-1]])
+    return int(value)
+
+
+def make_text(size, seed=0):
+    """
+    Türkçe harfler, boşluk ve noktalama içeren rastgele metin üretir
+
+    1 MB'lık bir taban blok üretilip tekrarlanır; böylece 100 MB'lık girdi
+    de birkaç saniyede hazırlanır.
+    """
+    rnd = random.Random(seed)
+    havuz = TURKCE_ALFABE + TURKCE_ALFABE.lower() + "     .,"
+    taban = "".join(rnd.choices(havuz, k=min(size, 1 << 20)))
+    tekrar = size // len(taban) + 1 if taban else 0
+    return (taban * tekrar)[:size]
+
+
+def iter_chunks(text, chunk_size=AKIS_PARCA_BOYUTU):
+    """
+    Metni sabit boyutlu parçalar halinde dolaşır
+    """
+    for i in range(0, len(text), chunk_size):
+        yield text[i:i + chunk_size]
+
+
+def measure(func, arg, repeat=TEKRAR):
+    """
+    Fonksiyonun çağrı başına süresini repeat ölçümün en iyisi olarak döndürür
+
+    İlk çağrı sonucu üretir ve döngü sayısını belirler: kısa süren
+    fonksiyonlar her ölçümde en az EN_KISA_OLCUM saniye boyunca tekrar
+    çağrılır, uzun sürenler her ölçümde bir kez.
+    """
+    start = time.perf_counter()
+    sonuc = func(arg)
+    ilk = time.perf_counter() - start
+
+    number = max(1, int(EN_KISA_OLCUM / ilk)) if ilk > 0 else 1
+    olcumler = timeit.repeat(lambda: func(arg), repeat=repeat, number=number)
+    if number == 1:
+        olcumler.append(ilk)
+    return min(olcumler) / number, sonuc
+
+
+def run(sizes, stream=False, tolerance=1.5):
+    """
+    Tüm boyutlar için ölçüm yapar ve ölçeklenme kontrolünün sonucunu döndürür
+
+    Returns:
+    --------
+    bool
+        Karakter başına süre (best-of-N) TABAN_EN_KUCUK_BOYUT ve üzeri hiçbir
+        boyutta önceki taban boyutların ortancasının tolerance katını
+        aşmıyorsa True
+    """
+    cipher = PeriodicCipher()
+
+    if stream:
+        def encrypt(text):
+            return "".join(cipher.encrypt_stream(iter_chunks(text)))
+
+        def decrypt(text):
+            return "".join(cipher.decrypt_stream(iter_chunks(text)))
+    else:
+        def encrypt(text):
+            return cipher.encrypt(text, trace=False)[0]
+
+        def decrypt(text):
+            return cipher.decrypt(text, trace=False)[0]
+
+    print(f"{'Boyut':>10} {'Şifreleme ns/kar':>18} {'Deşifreleme ns/kar':>20}")
+    gecmis = {'encrypt': [], 'decrypt': []}
+    basarili = True
+
+    for size in sizes:
+        text = make_text(size)
+        sure, sifreli = measure(encrypt, text)
+        enc_ns = sure / max(len(text), 1) * 1e9
+        sure, cozulmus = measure(decrypt, sifreli)
+        dec_ns = sure / max(len(sifreli), 1) * 1e9
+
+        if cozulmus.upper() != cozulmus or len(cozulmus) != len(text):
+            print(f"Hata: {size} karakterlik girdide deşifre sonucu girdiyle uyuşmuyor.")
+            basarili = False
+
+        print(f"{size:>10} {enc_ns:>18.1f} {dec_ns:>20.1f}")
+
+        if size >= TABAN_EN_KUCUK_BOYUT:
+            for islem, ns in (('encrypt', enc_ns), ('decrypt', dec_ns)):
+                onceki = gecmis[islem]
+                if onceki:
+                    taban = statistics.median(onceki)
+                    if ns > tolerance * taban:
+                        print(f"Uyarı: {islem} karakter başına süre {size} boyutunda "
+                              f"{ns / taban:.2f} kat arttı (izin verilen: {tolerance}).")
+                        basarili = False
+                onceki.append(ns)
+
+        del text, sifreli, cozulmus
+
+    return basarili
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Şifreleme ölçeklenme karşılaştırma testi")
+    parser.add_argument("--sizes", nargs="+", default=VARSAYILAN_BOYUTLAR,
+                        help="Girdi boyutları (örn: 1K 1M 10M 100M)")
+    parser.add_argument("--stream", action="store_true",
+                        help="encrypt_stream/decrypt_stream ile sabit bellekte ölç")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="Karakter başına sürede izin verilen en fazla artış katı")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(size) for size in args.sizes]
+    basarili = run(sizes, stream=args.stream, tolerance=args.tolerance)
+    print("Sonuç: " + ("doğrusal ölçekleniyor." if basarili else "ölçeklenme sorunu bulundu."))
+    return 0 if basarili else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
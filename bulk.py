@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Toplu İşleme Modülü
+
+Bir dizindeki metin dosyalarını veya bir JSONL dosyasındaki kayıtları tüm
+işlemci çekirdeklerini kullanarak şifreler/deşifreler.
+
+Kullanım:
+    python bulk.py encrypt girdiler/ ciktilar/
+    python bulk.py decrypt kayitlar.jsonl cozulmus.jsonl --field text
+    python bulk.py encrypt buyuk_metin.txt sifreli.txt --single
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from cipher import PeriodicCipher
+from element_tables import CompactElementTables
+
+# Her işçi süreçte bir kez oluşturulan şifreleyici
+_worker_cipher = None
+
+
+def _tables_blob():
+    """
+    İşçilere gönderilecek sıkıştırılmış element tablolarını ana süreçte bir kez üretir
+    """
+    return CompactElementTables.from_cipher(PeriodicCipher()).to_bytes()
+
+
+def _init_worker(tables_blob=None):
+    """
+    İşçi süreçte şifreleyiciyi hazırlar
+
+    Ana süreçten sıkıştırılmış tablolar geldiyse şifreleyici bunlara salt
+    okunur olarak bağlanır; element kayıt defteri içe aktarılmaz ve katman
+    sözlüklerinden tablo derlenmez.
+    """
+    global _worker_cipher
+    if tables_blob is None:
+        _worker_cipher = PeriodicCipher()
+    else:
+        _worker_cipher = PeriodicCipher(tables=CompactElementTables.from_bytes(tables_blob))
+
+
+def _process_batch(mode, texts):
+    """
+    Bir kayıt grubunu işçi süreçte şifreler veya deşifreler
+
+    Parameters:
+    -----------
+    mode : str
+        "encrypt" veya "decrypt"
+    texts : list
+        İşlenecek metinler
+
+    Returns:
+    --------
+    list
+        Sonuç metinleri (girdi sırasıyla)
+    """
+    if mode == "encrypt":
+        return [_worker_cipher.encrypt(text, trace=False)[0] for text in texts]
+    return [_worker_cipher.decrypt(text, trace=False)[0] for text in texts]
+
+
+def _count_chunk(chunk):
+    """
+    Büyük harfe çevrilmiş bir metin parçasındaki harf sayılarını işçi süreçte sayar
+    """
+    return _worker_cipher.count_letters(chunk)
+
+
+def _encrypt_chunk(chunk, letter_counts):
+    """
+    Bir metin parçasını verilen başlangıç harf sayılarından itibaren şifreler
+    """
+    return _worker_cipher.encrypt(chunk, trace=False, start_counts=letter_counts)[0]
+
+
+def encrypt_large_text(text, workers=None, chunk_size=None):
+    """
+    Tek bir büyük metni süreç havuzunda iki geçişte şifreler
+
+    Her harfin katmanı o harfin daha önceki kullanım sayısına bağlı olduğundan
+    metin doğrudan bölünemez. İlk geçişte her parçadaki harfler paralel
+    sayılır; ardından her parçanın başlangıç sayıları önceki parçaların
+    toplamından (mod 3) çıkarılır ve ikinci geçişte parçalar
+    encrypt(..., start_counts=...) ile paralel şifrelenir. Sonuç seri encrypt
+    ile birebir aynıdır.
+
+    Parameters:
+    -----------
+    text : str
+        Şifrelenecek metin
+    workers : int, optional
+        İşçi süreç sayısı (varsayılan: çekirdek sayısı)
+    chunk_size : int, optional
+        Parça boyutu (varsayılan: her işçiye dört parça düşecek boyut)
+
+    Returns:
+    --------
+    str
+        Şifrelenmiş metin
+    """
+    text = text.upper()
+    workers = workers or os.cpu_count() or 1
+    if not chunk_size:
+        chunk_size = max(1 << 16, -(-len(text) // (workers * 4)))
+    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    if not chunks:
+        return ""
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(_tables_blob(),)) as executor:
+        # 1. geçiş: parça başına harf sayıları
+        chunk_counts = list(executor.map(_count_chunk, chunks))
+
+        # Önek toplamları: her parçanın başlangıç katman durumu
+        starts = []
+        running = {}
+        for counts in chunk_counts:
+            starts.append(dict(running))
+            for harf, adet in counts.items():
+                running[harf] = (running.get(harf, 0) + adet) % 3
+
+        # 2. geçiş: parçaları doğru durumdan başlayarak şifrele
+        return "".join(executor.map(_encrypt_chunk, chunks, starts))
+
+
+def _iter_batches(items, batch_size):
+    """
+    Öğeleri en fazla batch_size uzunluğunda listeler halinde dolaşır
+    """
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def process_records(texts, mode="encrypt", workers=None, batch_size=16, max_pending=None):
+    """
+    Metinleri süreç havuzunda işler ve sonuçları girdi sırasıyla üretir
+
+    Kayıtlar batch_size'lık gruplar halinde işçilere dağıtılır. Gönderilmiş
+    ama henüz üretilmemiş grup sayısı max_pending ile sınırlıdır; sırası
+    gelmeyen tamamlanmış gruplar bu sınırlı yeniden sıralama tamponunda
+    bekler. Böylece bellek kullanımı girdi boyutundan bağımsız kalır.
+
+    Parameters:
+    -----------
+    texts : iterable of str
+        İşlenecek metinler
+    mode : str
+        "encrypt" veya "decrypt"
+    workers : int, optional
+        İşçi süreç sayısı (varsayılan: çekirdek sayısı)
+    batch_size : int
+        Bir işçi görevine verilecek kayıt sayısı
+    max_pending : int, optional
+        Aynı anda bekleyebilecek en fazla grup sayısı (varsayılan: 4 × işçi)
+
+    Yields:
+    -------
+    str
+        Sonuç metinleri (girdi sırasıyla)
+    """
+    if mode not in ("encrypt", "decrypt"):
+        raise ValueError(f"Geçersiz işlem: {mode}")
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+    batches = _iter_batches(texts, batch_size)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(_tables_blob(),)) as executor:
+        pending = {}
+        submitted = 0
+        next_index = 0
+        exhausted = False
+
+        while True:
+            # Tampon dolana kadar yeni grup gönder
+            while not exhausted and submitted - next_index < max_pending:
+                batch = next(batches, None)
+                if batch is None:
+                    exhausted = True
+                    break
+                pending[submitted] = executor.submit(_process_batch, mode, batch)
+                submitted += 1
+
+            if next_index == submitted:
+                break
+
+            # Sıradaki grubu bekle; sonra gelenler tamponda kalır
+            for result in pending.pop(next_index).result():
+                yield result
+            next_index += 1
+
+
+def iter_directory(path):
+    """
+    Dizindeki metin dosyalarını ad sırasıyla (dosya adı, içerik) olarak dolaşır
+    """
+    for name in sorted(os.listdir(path)):
+        file_path = os.path.join(path, name)
+        if os.path.isfile(file_path):
+            with open(file_path, "r", encoding="utf-8") as f:
+                yield name, f.read()
+
+
+def run_directory(src, dst, mode, workers=None, batch_size=16):
+    """
+    Dizindeki her dosyayı işler ve aynı adla çıktı dizinine yazar
+
+    Returns:
+    --------
+    int
+        İşlenen dosya sayısı
+    """
+    os.makedirs(dst, exist_ok=True)
+    names = deque()
+
+    def texts():
+        for name, text in iter_directory(src):
+            names.append(name)
+            yield text
+
+    count = 0
+    for count, result in enumerate(process_records(texts(), mode, workers, batch_size), start=1):
+        with open(os.path.join(dst, names.popleft()), "w", encoding="utf-8") as f:
+            f.write(result)
+    return count
+
+
+def run_jsonl(src, dst, mode, field="text", workers=None, batch_size=16):
+    """
+    JSONL dosyasındaki her kaydın field alanını işler ve aynı sırayla yazar
+
+    Kayıt bir JSON nesnesi ise field alanı sonuçla değiştirilir; kayıt düz bir
+    JSON dizgisi ise sonuç dizgisi yazılır. Boş satırlar atlanır.
+
+    Returns:
+    --------
+    int
+        İşlenen kayıt sayısı
+    """
+    records = deque()
+
+    def texts():
+        with open(src, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if isinstance(record, str):
+                    text = record
+                elif isinstance(record, dict) and isinstance(record.get(field), str):
+                    text = record[field]
+                else:
+                    raise ValueError(f"{src}:{line_no}: '{field}' alanı bulunamadı")
+                records.append(record)
+                yield text
+
+    count = 0
+    with open(dst, "w", encoding="utf-8") as out:
+        for count, result in enumerate(process_records(texts(), mode, workers, batch_size), start=1):
+            record = records.popleft()
+            if isinstance(record, dict):
+                record[field] = result
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            else:
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Periyodik tablo şifrelemesiyle toplu işlem")
+    parser.add_argument("mode", choices=["encrypt", "decrypt"], help="Yapılacak işlem")
+    parser.add_argument("input", help="Girdi dizini veya JSONL dosyası")
+    parser.add_argument("output", help="Çıktı dizini veya JSONL dosyası")
+    parser.add_argument("--field", default="text", help="JSONL kayıtlarında işlenecek alan")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı")
+    parser.add_argument("--batch-size", type=int, default=16, help="Görev başına kayıt sayısı")
+    parser.add_argument("--single", action="store_true",
+                        help="Girdiyi tek bir büyük metin olarak parçalara bölüp şifrele")
+    args = parser.parse_args(argv)
+
+    if args.single and args.mode != "encrypt":
+        parser.error("--single yalnızca encrypt ile kullanılabilir")
+
+    start = time.perf_counter()
+    if args.single:
+        with open(args.input, "r", encoding="utf-8") as f:
+            text = f.read()
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(encrypt_large_text(text, args.workers))
+        count = 1
+    elif os.path.isdir(args.input):
+        count = run_directory(args.input, args.output, args.mode, args.workers, args.batch_size)
+    else:
+        count = run_jsonl(args.input, args.output, args.mode, args.field, args.workers, args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"{count} kayıt {elapsed:.2f} saniyede işlendi ({rate:.1f} kayıt/sn)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,19 +5,369 @@ Periyodik Tablo Şifreleme Uygulaması - Şifreleme Algoritmaları
 """
 
 import re
+import heapq
+from array import array
+from itertools import cycle
 from data import TURKCE_ALFABE, KATMAN1_ELEMENTLER, KATMAN2_ELEMENTLER, KATMAN3_ELEMENTLER
 
+# Toplu şifreleme için NumPy isteğe bağlıdır; yoksa skaler motor kullanılır
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Log üretmeyen şifreleme/deşifrelemede bir seferde işlenen karakter sayısı
+_BLOK_BOYUTU = 1 << 20
+
+# ASCII şifreli metinde koordinatları ayıran desen (yakalama grubu koordinatları korur)
+_KOORDINAT_DESENI = re.compile(r"([0-9]{4})")
+
+# Işın aramasında tutarlı adayı kalmayan koordinatı aynen aktarmanın puan cezası
+_GECIS_CEZASI = 50.0
+
+# Işın aramasında ilerleme bildirilen koordinat, deşifre sonuçlarını
+# dolaşırken ilerleme bildirilen düğüm aralığı
+_ILERLEME_ARALIGI = 1024
+
+# Deşifre sonuçlarını dolaşırken bir seçimden sonra kontrol edilen koordinat sayısı
+_ILERI_BAKIS = 32
+
+
+def _batch_callback(callback):
+    """
+    Geri çağırmanın mesaj listesi alan biçimini döndürür
+
+    Geri çağırma extend(messages) metodu sunuyorsa (örn. tamponlu log
+    aktarımı) mesajlar tek çağrıda, aksi halde tek tek iletilir.
+    """
+    extend = getattr(callback, 'extend', None)
+    if extend is not None:
+        return extend
+
+    def tek_tek(messages):
+        for message in messages:
+            callback(message)
+
+    return tek_tek
+
+
+def _to_codes(text):
+    """
+    Metni Unicode kod noktası dizisine çevirir
+    """
+    return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+
+
+def _from_codes(codes):
+    """
+    Unicode kod noktası dizisini metne çevirir
+    """
+    return codes.astype('<u4', copy=False).tobytes().decode('utf-32-le', 'surrogatepass')
+
+
+class MatchTable:
+    """
+    Harf-element eşleşmelerinin sıkıştırılmış listesi
+
+    Her eşleşme için yalnızca (katman, harf) hücre numarası bir array('H')
+    içinde tutulur. Satırlar liste gibi len() ve indeksle okunur; her satır
+    (harf, element, orbital, son_katman, oteleme) demetidir ve şifreleyicinin
+    eşleşme tablosundan bir kez oluşturulan demetlerden biridir. encrypt_stream
+    ve log üreten şifreleme, eşleşme listesi yerine bu tabloyu da kabul eder.
+    """
+
+    def __init__(self, cipher):
+        cipher.ensure_traced_tables()
+        self._harf_indeksi = cipher._harf_indeksi
+        self._alfabe_boyu = len(cipher.turkce_alfabe)
+        self._satirlar = tuple(
+            (match['harf'], match['element'], match['orbital'], match['son_katman'], match['oteleme'])
+            if match else None
+            for eslesmeler in cipher._eslesme_tablosu for match in eslesmeler
+        )
+        self._hucreler = array('H')
+
+    def __len__(self):
+        return len(self._hucreler)
+
+    def __getitem__(self, index):
+        return self._satirlar[self._hucreler[index]]
+
+    def append_cell(self, katman_indeksi, harf_indeksi):
+        """
+        (katman, harf) hücresinin eşleşmesini ekler
+        """
+        self._hucreler.append(katman_indeksi * self._alfabe_boyu + harf_indeksi)
+
+    def extend_text(self, text, letter_counts):
+        """
+        Büyük harfe çevrilmiş metnin eşleşmelerini şifreleme yapmadan ekler
+
+        Parameters:
+        -----------
+        text : str
+            Büyük harfe çevrilmiş metin
+        letter_counts : dict
+            Metinden önceki harf kullanım sayıları (değiştirilmez)
+        """
+        harf_indeksi = self._harf_indeksi
+        alfabe_boyu = self._alfabe_boyu
+        satirlar = self._satirlar
+        katmanlar = {harf: letter_counts.get(harf, 0) % 3 for harf in harf_indeksi}
+        hucreler = array('H')
+        for letter in text:
+            index = harf_indeksi.get(letter)
+            if index is None:
+                continue
+            katman_indeksi = katmanlar[letter]
+            katmanlar[letter] = (katman_indeksi + 1) % 3
+            hucre = katman_indeksi * alfabe_boyu + index
+            if satirlar[hucre] is not None:
+                hucreler.append(hucre)
+        self._hucreler.extend(hucreler)
+
 
 class PeriodicCipher:
     """
     Periyodik tablo tabanlı şifreleme algoritmaları sınıfı
     """
 
-    def __init__(self):
+    def __init__(self, tables=None):
+        """
+        Parameters:
+        -----------
+        tables : CompactElementTables, optional
+            Verilirse yalnızca log üretmeyen şifreleme ve deşifreleme tabloları
+            bu dizilerden türetilir; element kayıt defteri içe aktarılmaz ve
+            diğer tablolar ensure_traced_tables ile derlenir (toplu işleme
+            süreçleri için)
+        """
         self.turkce_alfabe = TURKCE_ALFABE
         self.katman1_elementler = KATMAN1_ELEMENTLER
         self.katman2_elementler = KATMAN2_ELEMENTLER
         self.katman3_elementler = KATMAN3_ELEMENTLER
+        self.registry = None
+        self._izleme_tablolari_hazir = False
+
+        # Harf indeksleri ve katman bazlı arama tabloları bir kez derlenir
+        self._harf_indeksi = {harf: i for i, harf in enumerate(self.turkce_alfabe)}
+        if tables is not None:
+            self._attach_tables(tables)
+        else:
+            self.ensure_traced_tables()
+
+    def ensure_traced_tables(self):
+        """
+        Log üreten yolların tablolarını henüz derlenmediyse derler
+
+        Element, öteleme, log ve eşleşme tabloları ile koordinat ve ters
+        tablolar element kayıt defterinden derlenir; kayıt defteri de ilk
+        kez burada içe aktarılır. Bu tabloları okuyan metodlar önce bunu
+        çağırır; sıkıştırılmış tablolarla oluşturulan şifreleyicide log
+        üretmeyen yollar bu maliyete hiç girmez.
+        """
+        if self._izleme_tablolari_hazir:
+            return
+        from element_registry import REGISTRY
+
+        self.registry = REGISTRY
+        self._build_lookup_tables()
+        self._build_coordinate_index()
+        self._build_inverse_table()
+        self._izleme_tablolari_hazir = True
+
+    def _attach_tables(self, tables):
+        """
+        Log üretmeyen yolların tablolarını sıkıştırılmış dizilerden türetir
+
+        Çıktı, harf çözüm ve koordinat çözüm tabloları _build_lookup_tables ve
+        _build_inverse_table ile aynı içerikte oluşturulur; element kayıtları,
+        log ve eşleşme tabloları oluşturulmaz.
+
+        Parameters:
+        -----------
+        tables : CompactElementTables
+            Bu şifreleyiciyle aynı alfabeyle üretilmiş tablolar
+
+        Raises:
+        -------
+        ValueError
+            Tabloların alfabesi farklıysa
+        """
+        if tables.alphabet != self.turkce_alfabe:
+            raise ValueError("Element tablolarının alfabesi şifreleyiciyle uyuşmuyor")
+
+        alfabe_boyu = len(self.turkce_alfabe)
+        otelenmis = tables.fields['otelenmis']
+
+        self._cikti_tablosu = [
+            [tables.output(katman_indeksi, index) for index in range(alfabe_boyu)]
+            for katman_indeksi in range(tables.layer_count)
+        ]
+
+        # Ötelenmiş harf → alfabe sırasında (orijinal harf, harf indeksi, katman indeksi)
+        adaylar = [[] for _ in self.turkce_alfabe]
+        for katman_indeksi in range(tables.layer_count):
+            for index in range(alfabe_boyu):
+                hedef = otelenmis[tables.cell(katman_indeksi, index)]
+                if hedef >= 0:
+                    adaylar[hedef].append((index, self.turkce_alfabe[index], katman_indeksi))
+        self._harf_cozum = {
+            shifted_letter: tuple((harf, index, katman_indeksi)
+                                  for index, harf, katman_indeksi in sorted(adaylar[shifted_index]))
+            for shifted_index, shifted_letter in enumerate(self.turkce_alfabe)
+        }
+
+        # Koordinat dizgisi → (ötelenmiş harf, adaylar); aynı konumda ilk katman geçerlidir
+        self._koordinat_cozum = {}
+        for katman_indeksi in range(tables.layer_count):
+            for index, letter in enumerate(self.turkce_alfabe):
+                coord = tables.coordinate(tables.cell(katman_indeksi, index))
+                if coord is not None and coord not in self._koordinat_cozum:
+                    self._koordinat_cozum[coord] = (letter, self._harf_cozum[letter])
+
+    def _build_lookup_tables(self):
+        """
+        Katman sözlüklerini (harf, katman) ikilisine göre yoğun arama tablolarına derler
+
+        Öteleme ve çıktı koordinatı yalnızca harfe ve katmana bağlı olduğundan
+        şifreleme sırasında her harf için sadece tablo okuması yapılır. Tablolardaki
+        element bilgileri kayıt defterindeki ElementRecord nesneleridir.
+        """
+        registry = self.registry
+        katmanlar = range(1, registry.layer_count() + 1)
+
+        # Ötelenmiş harfin koordinatı: öncelik sırasıyla ilk bulunduğu katman
+        harf_koordinatlari = {}
+        for katman_no in katmanlar:
+            for kayit in registry.layer(katman_no):
+                if kayit.harf not in harf_koordinatlari:
+                    harf_koordinatlari[kayit.harf] = (kayit.koordinat, katman_no)
+
+        # Her tablo katman sırasına göre (0, 1, 2) harf indeksiyle adreslenir
+        self._element_tablosu = []
+        self._oteleme_tablosu = []
+        self._otelenmis_indeks_tablosu = []
+        self._cikti_tablosu = []
+        self._koordinat_katman_tablosu = []
+        self._log_tablosu = []
+        self._eslesme_tablosu = []
+
+        for katman_no in katmanlar:
+            elementler = []
+            otelemeler = []
+            otelenmis_indeksler = []
+            ciktilar = []
+            koordinat_katmanlari = []
+            loglar = []
+            eslesmeler = []
+            for harf in self.turkce_alfabe:
+                element_info = registry.by_letter(harf, katman_no)
+                elementler.append(element_info)
+                if not element_info:
+                    # Element yoksa harf aynen bırakılır
+                    otelemeler.append(None)
+                    otelenmis_indeksler.append(None)
+                    ciktilar.append(harf)
+                    koordinat_katmanlari.append(None)
+                    loglar.append(("Element bulunamadı, harf aynen bırakılıyor.",))
+                    eslesmeler.append(None)
+                    continue
+
+                shift = self.orbital_to_shift(element_info['orbital'], element_info['son_katman'])
+                shifted_letter = self.shift_letter(harf, shift)
+                coord, found_katman = harf_koordinatlari.get(shifted_letter, (shifted_letter, None))
+
+                if found_katman:
+                    koordinat_log = f"Periyodik tablo koordinatları (Katman {found_katman}): {coord}"
+                else:
+                    koordinat_log = f"Koordinat bulunamadı, ötelenmiş harf kullanılıyor: {shifted_letter}"
+
+                otelemeler.append(shift)
+                otelenmis_indeksler.append(self._harf_indeksi[shifted_letter])
+                ciktilar.append(coord)
+                koordinat_katmanlari.append(found_katman)
+                loglar.append((
+                    f"Eşleşen element: {element_info['element']}",
+                    f"Orbital dizilimi: {element_info['orbital']}",
+                    f"Hesaplanan öteleme: {shift}",
+                    f"Ötelenmiş harf: {shifted_letter}",
+                    koordinat_log,
+                    "-" * 50
+                ))
+                eslesmeler.append({
+                    'harf': harf,
+                    'element': element_info['element'],
+                    'orbital': element_info['orbital'],
+                    'son_katman': element_info['son_katman'],
+                    'oteleme': shift
+                })
+
+            self._element_tablosu.append(elementler)
+            self._oteleme_tablosu.append(otelemeler)
+            self._otelenmis_indeks_tablosu.append(otelenmis_indeksler)
+            self._cikti_tablosu.append(ciktilar)
+            self._koordinat_katman_tablosu.append(koordinat_katmanlari)
+            self._log_tablosu.append(loglar)
+            self._eslesme_tablosu.append(eslesmeler)
+
+    def _build_coordinate_index(self):
+        """
+        Koordinat → (harf, katman, element bilgisi) ters indeksini oluşturur
+
+        Her konum hem (satır, sütun) demeti hem de şifreli metindeki 4 haneli
+        "SSSS" dizgisi ile anahtarlanır; böylece deşifrelemede sayı ayrıştırma
+        adımı da atlanır. Aynı konum birden fazla katmanda varsa tarama
+        sırasındaki gibi ilk bulunan kayıt geçerlidir.
+        """
+        self._koordinat_indeksi = {
+            anahtar: (kayit.harf, kayit.katman, kayit)
+            for anahtar, kayit in self.registry.coordinate_items()
+        }
+
+    def _build_inverse_table(self):
+        """
+        (ötelenmiş harf, katman) → orijinal harf adayları ters tablosunu oluşturur
+
+        Her aday, alfabe sırasını korumak için (harf indeksi, aday bilgisi)
+        ikilisi olarak saklanır; aday bilgisi deşifrelemedeki aday sözlüğüyle
+        aynı alanları içerir.
+        """
+        self._ters_tablo = []
+        for katman_indeksi in range(3):
+            adaylar = [[] for _ in self.turkce_alfabe]
+            for index, harf in enumerate(self.turkce_alfabe):
+                element_info = self._element_tablosu[katman_indeksi][index]
+                if not element_info:
+                    continue
+                adaylar[self._otelenmis_indeks_tablosu[katman_indeksi][index]].append((index, {
+                    'harf': harf,
+                    'katman': katman_indeksi + 1,
+                    'element': element_info['element'],
+                    'orbital': element_info['orbital'],
+                    'son_katman': element_info['son_katman'],
+                    'oteleme': self._oteleme_tablosu[katman_indeksi][index]
+                }))
+            self._ters_tablo.append(adaylar)
+
+        # Log üretmeyen deşifreleme için: ötelenmiş harf → alfabe sırasında
+        # (orijinal harf, harf indeksi, katman indeksi) adayları
+        self._harf_cozum = {}
+        for shifted_index, shifted_letter in enumerate(self.turkce_alfabe):
+            adaylar = sorted((index, aday['harf'], katman_indeksi)
+                             for katman_indeksi in range(3)
+                             for index, aday in self._ters_tablo[katman_indeksi][shifted_index])
+            self._harf_cozum[shifted_letter] = tuple((harf, index, katman_indeksi)
+                                                     for index, harf, katman_indeksi in adaylar)
+
+        # Koordinat dizgisi → (ötelenmiş harf, adaylar)
+        self._koordinat_cozum = {}
+        for anahtar, (letter, _, _) in self._koordinat_indeksi.items():
+            if isinstance(anahtar, str):
+                self._koordinat_cozum[anahtar] = (letter, self._harf_cozum.get(letter, ()))
 
     def orbital_to_shift(self, orbital, son_katman):
         """
@@ -38,9 +388,9 @@ class PeriodicCipher:
         """
         Harfi belirli bir değer kadar öteler
         """
-        if letter not in self.turkce_alfabe:
+        index = self._harf_indeksi.get(letter)
+        if index is None:
             return letter
-        index = self.turkce_alfabe.index(letter)
         new_index = (index + shift) % len(self.turkce_alfabe)
         return self.turkce_alfabe[new_index]
 
@@ -48,9 +398,9 @@ class PeriodicCipher:
         """
         Harfi belirli bir değer kadar geriye öteler (deşifreleme için)
         """
-        if letter not in self.turkce_alfabe:
+        index = self._harf_indeksi.get(letter)
+        if index is None:
             return letter
-        index = self.turkce_alfabe.index(letter)
         new_index = (index - shift) % len(self.turkce_alfabe)
         return self.turkce_alfabe[new_index]
 
@@ -59,34 +409,461 @@ class PeriodicCipher:
         Harf ve kullanım sayısına göre uygun elementi döndürür
         """
         # Kullanım sırasına göre: 1 → 2 → 3 → tekrar 1 ...
+        self.ensure_traced_tables()
         katman = ((count - 1) % 3) + 1
-        if katman == 1:
-            return self.katman1_elementler.get(letter)
-        elif katman == 2:
-            return self.katman2_elementler.get(letter)
-        else:
-            return self.katman3_elementler.get(letter)
+        return self.registry.by_letter(letter, katman)
 
-    def get_letter_from_coordinates(self, coord):
+    def find_by_coordinates(self, coord):
         """
-        Periyodik tablo koordinatlarına göre harfi bulur
+        Koordinata karşılık gelen (harf, katman, element bilgisi) kaydını döndürür
 
-        DÜZELTİLDİ: Artık tüm katmanlarda arama yapıyor
+        Parameters:
+        -----------
+        coord : str
+            4 haneli koordinat (örn: "0213")
+
+        Returns:
+        --------
+        tuple or None
+            (harf, katman, element bilgisi) veya bulunamazsa None
         """
+        self.ensure_traced_tables()
+        kayit = self._koordinat_indeksi.get(coord)
+        if kayit is not None:
+            return kayit
+
+        # Doğrudan anahtar yoksa sayısal ayrıştırmayla tekrar dene
         try:
             row = int(coord[0:2])
             col = int(coord[2:4])
         except ValueError:
             return None
+        return self._koordinat_indeksi.get((row, col))
+
+    def get_original_candidates(self, shifted_letter, katman=None):
+        """
+        Ötelendiğinde verilen harfe dönüşen orijinal harf adaylarını döndürür
+
+        Parameters:
+        -----------
+        shifted_letter : str
+            Ötelenmiş harf
+        katman : int, optional
+            Sadece bu katmandaki (1, 2, 3) adaylar; verilmezse tüm katmanlar
+
+        Returns:
+        --------
+        list
+            Alfabe ve katman sırasına göre aday bilgileri
+        """
+        shifted_index = self._harf_indeksi.get(shifted_letter)
+        if shifted_index is None:
+            return []
+
+        self.ensure_traced_tables()
+        katman_indeksleri = range(3) if katman is None else [katman - 1]
+        adaylar = []
+        for katman_indeksi in katman_indeksleri:
+            adaylar.extend(self._ters_tablo[katman_indeksi][shifted_index])
+        adaylar.sort(key=lambda aday: aday[0])
+        return [dict(aday) for _, aday in adaylar]
+
+    def get_letter_from_coordinates(self, coord):
+        """
+        Periyodik tablo koordinatlarına göre harfi bulur
+
+        DÜZELTİLDİ: Artık tüm katmanlarda arama yapıyor
+        """
+        kayit = self.find_by_coordinates(coord)
+        if kayit is None:
+            return None
+        return kayit[0]
+
+    def _encrypt_untraced(self, text, letter_counts):
+        """
+        Büyük harfe çevrilmiş metni log ve eşleşme üretmeden şifreler
+
+        Her harfin üç katmanlı çıktısı, harfin o ana kadarki kullanım sayısından
+        başlayan bir döngüye bağlanır; böylece karakter başına yalnızca bir
+        sözlük okuması ve bir çağrı yapılır. Metin sabit boyutlu bloklar
+        halinde işlenir.
+
+        Parameters:
+        -----------
+        text : str
+            Büyük harfe çevrilmiş metin
+        letter_counts : dict
+            Harf kullanım sayıları; metindeki harflere göre güncellenir
+
+        Returns:
+        --------
+        str
+            Şifrelenmiş metin
+        """
+        cikti_tablosu = self._cikti_tablosu
+        sonraki_cikti = {}
+        for harf, index in self._harf_indeksi.items():
+            baslangic = letter_counts.get(harf, 0) % 3
+            ciktilar = [cikti_tablosu[(baslangic + k) % 3][index] for k in range(3)]
+            sonraki_cikti[harf] = cycle(ciktilar).__next__
+
+        get = sonraki_cikti.get
+        blocks = []
+        for i in range(0, len(text), _BLOK_BOYUTU):
+            block = text[i:i + _BLOK_BOYUTU]
+            blocks.append("".join([sonraki() if (sonraki := get(letter)) else letter for letter in block]))
+        result = "".join(blocks)
+
+        for harf, adet in self.count_letters(text).items():
+            letter_counts[harf] = letter_counts.get(harf, 0) + adet
+        return result
+
+    def count_letters(self, text):
+        """
+        Büyük harfe çevrilmiş metindeki alfabe harflerinin kullanım sayılarını döndürür
+
+        Parameters:
+        -----------
+        text : str
+            Büyük harfe çevrilmiş metin
+
+        Returns:
+        --------
+        dict
+            Harf -> kullanım sayısı (yalnızca metinde geçen harfler)
+        """
+        counts = {}
+        for harf in self._harf_indeksi:
+            adet = text.count(harf)
+            if adet:
+                counts[harf] = adet
+        return counts
+
+    def _build_array_tables(self):
+        """
+        NumPy tabanlı şifreleme için [katman, harf] çıktı tablolarını oluşturur
+
+        Çıktılar kod noktası dizileri olarak en uzun çıktı genişliğine
+        doldurulur; gerçek uzunluklar ayrı bir tabloda tutulur. Tabloların
+        son satırı alfabe dışı karakterler içindir (uzunluk 1).
+        """
+        alfabe_boyu = len(self.turkce_alfabe)
+
+        # Kod noktası → harf indeksi (alfabe dışı: 255)
+        self._np_harf_tablosu = np.full(max(map(ord, self.turkce_alfabe)) + 2, 255, dtype=np.uint8)
+        for index, harf in enumerate(self.turkce_alfabe):
+            self._np_harf_tablosu[ord(harf)] = index
+
+        genislik = max(len(cikti) for ciktilar in self._cikti_tablosu for cikti in ciktilar)
+        self._np_cikti = np.zeros((3 * alfabe_boyu + 1, genislik), dtype=np.uint32)
+        self._np_uzunluk = np.ones(3 * alfabe_boyu + 1, dtype=np.int64)
+        for katman_indeksi, ciktilar in enumerate(self._cikti_tablosu):
+            for index, cikti in enumerate(ciktilar):
+                satir = katman_indeksi * alfabe_boyu + index
+                self._np_cikti[satir, :len(cikti)] = [ord(c) for c in cikti]
+                self._np_uzunluk[satir] = len(cikti)
+
+    def _letter_indices(self, codes):
+        """
+        Kod noktalarını harf indekslerine çevirir (alfabe dışı: 255)
+        """
+        tablo = self._np_harf_tablosu
+        return tablo[np.minimum(codes, len(tablo) - 1)]
+
+    def _encrypt_codes(self, codes, gruplar, baslangic_sayilari):
+        """
+        Kod noktası dizisini dizi işlemleriyle şifreler
+
+        Her harfin katmanı, aynı gruptaki (metindeki) önceki kullanım
+        sayısının 3'e göre modundan türetilir: harf konumları harfe göre
+        kararlı sıralandığında, aynı (grup, harf) bölümündeki sıra kullanım
+        sayısını verir.
+
+        Parameters:
+        -----------
+        codes : numpy.ndarray
+            Büyük harfe çevrilmiş metnin kod noktaları (uint32)
+        gruplar : numpy.ndarray or None
+            Her konumun ait olduğu metin numarası; tek metin için None
+        baslangic_sayilari : numpy.ndarray
+            [grup, harf] başlangıç kullanım sayıları
+
+        Returns:
+        --------
+        numpy.ndarray
+            Şifreli metnin kod noktaları
+        numpy.ndarray
+            Her konumun çıktı uzunluğu
+        """
+        alfabe_boyu = len(self.turkce_alfabe)
+        indeksler = self._letter_indices(codes)
+        harf_konumlari = np.flatnonzero(indeksler != 255)
+        harfler = indeksler[harf_konumlari]
+
+        # uint8 anahtarla kararlı sıralama (radix) grup sırasını korur
+        sira = np.argsort(harfler, kind='stable')
+        sirali = harfler[sira]
+        yeni_bolum = sirali[1:] != sirali[:-1]
+        if gruplar is not None:
+            harf_gruplari = gruplar[harf_konumlari]
+            sirali_gruplar = harf_gruplari[sira]
+            yeni_bolum |= sirali_gruplar[1:] != sirali_gruplar[:-1]
+        bolum_basi = np.zeros(len(sira), dtype=np.int32)
+        bolum_basi[1:][yeni_bolum] = np.flatnonzero(yeni_bolum) + 1
+        np.maximum.accumulate(bolum_basi, out=bolum_basi)
+
+        # Katmanlar sıralı düzende hesaplanıp tek seferde yerine yazılır
+        baslangic_indeksi = sirali.astype(np.int32)
+        if gruplar is not None:
+            baslangic_indeksi += sirali_gruplar.astype(np.int32) * alfabe_boyu
+        kullanim = np.arange(len(sira), dtype=np.int32) - bolum_basi
+        kullanim += (baslangic_sayilari.ravel() % 3).astype(np.int32)[baslangic_indeksi]
+        satirlar = np.full(len(codes), 3 * alfabe_boyu, dtype=np.int32)
+        satirlar[harf_konumlari[sira]] = (kullanim % 3) * alfabe_boyu + sirali
+
+        hucreler = self._np_cikti.take(satirlar, axis=0)
+        uzunluklar = self._np_uzunluk.take(satirlar)
+        gecis = indeksler == 255
+        hucreler[gecis, 0] = codes[gecis]
+
+        # Satır sırasıyla maskeleme, her konumun çıktısını sırayla birleştirir
+        genislik = hucreler.shape[1]
+        return hucreler[np.arange(genislik) < uzunluklar[:, None]], uzunluklar
+
+    def encrypt_array(self, text, letter_counts=None):
+        """
+        Metni NumPy dizi işlemleriyle şifreler (log ve eşleşme üretmeden)
+
+        Sonuç encrypt(text, trace=False) ile birebir aynıdır. NumPy yüklü
+        değilse skaler motor kullanılır.
+
+        Parameters:
+        -----------
+        text : str
+            Şifrelenecek metin
+        letter_counts : dict, optional
+            Başlangıç harf kullanım sayıları; verilirse metindeki harflere
+            göre güncellenir
+
+        Returns:
+        --------
+        str
+            Şifrelenmiş metin
+        """
+        if letter_counts is None:
+            letter_counts = {}
+        text = text.upper()
+        if not NUMPY_AVAILABLE:
+            return self._encrypt_untraced(text, letter_counts)
+        if not hasattr(self, '_np_cikti'):
+            self._build_array_tables()
+
+        sayilar = np.array([[letter_counts.get(harf, 0) for harf in self.turkce_alfabe]], dtype=np.int64)
+        blocks = []
+        for i in range(0, len(text), _BLOK_BOYUTU):
+            codes = _to_codes(text[i:i + _BLOK_BOYUTU])
+            sifreli, _ = self._encrypt_codes(codes, None, sayilar)
+            blocks.append(_from_codes(sifreli))
+
+            # Sonraki blok bu bloğun bıraktığı katman durumundan devam eder
+            sayilar[0] += np.bincount(self._letter_indices(codes), minlength=256)[:len(self.turkce_alfabe)]
+
+        for index, harf in enumerate(self.turkce_alfabe):
+            if sayilar[0, index]:
+                letter_counts[harf] = int(sayilar[0, index])
+        return "".join(blocks)
+
+    def encrypt_batch(self, texts):
+        """
+        Birbirinden bağımsız metinleri toplu olarak şifreler
+
+        Metinler bloklar halinde birleştirilip tek seferde dizi işlemleriyle
+        şifrelenir; her metin kendi harf sayılarıyla sıfırdan başlar. Sonuçlar
+        her metin için encrypt(text, trace=False) ile birebir aynıdır. NumPy
+        yüklü değilse skaler motor kullanılır.
+
+        Parameters:
+        -----------
+        texts : iterable of str
+            Şifrelenecek metinler
+
+        Returns:
+        --------
+        list
+            Şifrelenmiş metinler (girdi sırasıyla)
+        """
+        if not NUMPY_AVAILABLE:
+            return [self._encrypt_untraced(text.upper(), {}) for text in texts]
+
+        results = []
+        bekleyen = []
+        bekleyen_boyut = 0
+        for text in texts:
+            text = text.upper()
+            if len(text) >= _BLOK_BOYUTU:
+                # Büyük metinler kendi başına bloklar halinde şifrelenir
+                results.extend(self._encrypt_batch_block(bekleyen))
+                bekleyen, bekleyen_boyut = [], 0
+                results.append(self.encrypt_array(text))
+                continue
+            if bekleyen_boyut + len(text) > _BLOK_BOYUTU:
+                results.extend(self._encrypt_batch_block(bekleyen))
+                bekleyen, bekleyen_boyut = [], 0
+            bekleyen.append(text)
+            bekleyen_boyut += len(text)
+
+        results.extend(self._encrypt_batch_block(bekleyen))
+        return results
+
+    def _encrypt_batch_block(self, texts):
+        """
+        Büyük harfe çevrilmiş kısa metin grubunu tek dizi işlemiyle şifreler
+        """
+        if not texts:
+            return []
+        if not hasattr(self, '_np_cikti'):
+            self._build_array_tables()
+
+        uzunluklar = np.array([len(text) for text in texts], dtype=np.int64)
+        codes = _to_codes("".join(texts))
+        gruplar = np.repeat(np.arange(len(texts)), uzunluklar)
+        baslangic = np.zeros((len(texts), len(self.turkce_alfabe)), dtype=np.int64)
+        sifreli, cikti_uzunluklari = self._encrypt_codes(codes, gruplar, baslangic)
+
+        # Her metnin şifreli çıktıdaki sınırları
+        sinirlar = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(cikti_uzunluklari, out=sinirlar[1:])
+        metin_sinirlari = sinirlar[np.concatenate(([0], np.cumsum(uzunluklar)))]
+
+        sonuc = _from_codes(sifreli)
+        return [sonuc[metin_sinirlari[k]:metin_sinirlari[k + 1]] for k in range(len(texts))]
+
+    def _decrypt_untraced(self, text, original_letter_counts, final=True):
+        """
+        Şifreli metni log ve alternatif üretmeden çözer
+
+        Metin sabit boyutlu bloklar halinde işlenir; böylece ara listeler
+        girdi boyutundan bağımsız kalır.
+
+        Parameters:
+        -----------
+        text : str
+            Deşifre edilecek metin
+        original_letter_counts : dict
+            Orijinal harf kullanım sayıları; çözülen harflere göre güncellenir
+        final : bool, optional
+            False ise metnin sonunda devamı gelebilecek yarım koordinat
+            işlenmeden bırakılır
+
+        Returns:
+        --------
+        str
+            Deşifre edilmiş metin
+        int
+            İşlenen karakter sayısı
+        """
+        sayac = [original_letter_counts.get(harf, 0) for harf in self.turkce_alfabe]
+        blocks = []
+        i = 0
+        length = len(text)
+        while i < length:
+            j = min(i + _BLOK_BOYUTU, length)
+            block = text[i:j]
+            son_blok = final and j == length
+            if block.isascii():
+                result, consumed = self._decrypt_ascii_block(block, sayac, son_blok)
+            else:
+                result, consumed = self._decrypt_block(block, sayac, son_blok)
+            blocks.append(result)
+            i += consumed
+            if j == length:
+                break
+
+        for index, harf in enumerate(self.turkce_alfabe):
+            if sayac[index]:
+                original_letter_counts[harf] = sayac[index]
+        return "".join(blocks), i
+
+    def _decrypt_ascii_block(self, block, sayac, final):
+        """
+        Yalnızca ASCII karakter içeren bir bloğu çözer
+
+        ASCII metinde isdigit() yalnızca 0-9 için doğru olduğundan, soldan
+        sağa "4 rakam ise koordinat, değilse tek karakter" taraması tek bir
+        düzenli ifade bölmesiyle aynı sonucu verir.
+        """
+        pieces = _KOORDINAT_DESENI.split(block)
+        consumed = len(block)
+        if not final:
+            # Sondaki 4'ten kısa rakam dizisi sonraki blokla koordinat olabilir
+            son = pieces[-1]
+            kuyruk = len(son) - len(son.rstrip("0123456789"))
+            if kuyruk:
+                pieces[-1] = son[:-kuyruk]
+                consumed -= kuyruk
+
+        cozum = self._koordinat_cozum.get
+        for k in range(1, len(pieces), 2):
+            girdi = cozum(pieces[k])
+            if girdi is None:
+                continue
+            shifted_letter, adaylar = girdi
+            pieces[k] = shifted_letter
+            # Sıradaki kullanım katmanında bu harfe dönüşen alfabetik ilk aday
+            for harf, index, katman_indeksi in adaylar:
+                if sayac[index] % 3 == katman_indeksi:
+                    sayac[index] += 1
+                    pieces[k] = harf
+                    break
+
+        return "".join(pieces), consumed
+
+    def _decrypt_block(self, block, sayac, final):
+        """
+        Bir bloğu karakter karakter tarayarak çözer (ASCII olmayan metinler için)
+        """
+        parts = []
+        append = parts.append
+        cozum = self._koordinat_cozum.get
+
+        i = 0
+        length = len(block)
+        while i < length:
+            coord = block[i:i + 4]
+            if len(coord) < 4 and not final and coord.isdigit():
+                # Koordinatın devamı sonraki blokta olabilir
+                break
+            if len(coord) < 4 or not coord.isdigit():
+                append(block[i])
+                i += 1
+                continue
+            i += 4
 
-        # Tüm katmanlarda arama yap
-        for katman_dict in [self.katman1_elementler, self.katman2_elementler, self.katman3_elementler]:
-            for letter, info in katman_dict.items():
-                if info.get('konum') == (row, col):
-                    return letter
-        return None
+            girdi = cozum(coord)
+            if girdi is None and not coord.isascii():
+                # ASCII olmayan Unicode rakamlarını "RRCC" biçimine getirip
+                # aynı tabloda ara; izlemeli tablolar (ve element_registry)
+                # yüklenmez
+                try:
+                    girdi = cozum(f"{int(coord[:2]):02d}{int(coord[2:]):02d}")
+                except ValueError:
+                    girdi = None
+            if girdi is None:
+                append(coord)
+                continue
+
+            shifted_letter, adaylar = girdi
+            for harf, index, katman_indeksi in adaylar:
+                if sayac[index] % 3 == katman_indeksi:
+                    sayac[index] += 1
+                    append(harf)
+                    break
+            else:
+                append(shifted_letter)
 
-    def encrypt(self, text, callback=None):
+        return "".join(parts), i
+
+    def encrypt(self, text, callback=None, trace=True, start_counts=None):
         """
         Metni şifreler
 
@@ -95,7 +872,16 @@ class PeriodicCipher:
         text : str
             Şifrelenecek metin
         callback : callable, optional
-            Her adımda çağrılacak geri çağırma fonksiyonu
+            Her adımda çağrılacak geri çağırma fonksiyonu; extend(messages)
+            metodu varsa ardışık mesaj grupları tek çağrıda iletilir
+        trace : bool, optional
+            False ise log mesajları ve eşleşmeler hiç oluşturulmaz, callback
+            çağrılmaz ve adım/eşleşme listeleri boş döner
+        start_counts : dict, optional
+            Metinden önce gelen metindeki harf kullanım sayıları (harf → sayı;
+            yalnızca 3'e göre kalanı önemlidir). Bir metnin parçaları, her biri
+            önceki parçaların toplam sayılarıyla şifrelenirse sonuçların
+            birleşimi metnin tamamının şifresine eşittir. Sözlük değiştirilmez.
 
         Returns:
         --------
@@ -107,7 +893,10 @@ class PeriodicCipher:
             Harf-element eşleşmeleri
         """
         text = text.upper()
-        result = ""
+        letter_counts = dict(start_counts) if start_counts else {}
+        if not trace:
+            return self._encrypt_untraced(text, letter_counts), [], []
+
         log_messages = []
         matches = []
 
@@ -115,11 +904,50 @@ class PeriodicCipher:
             callback(f"Girilen metin: {text}")
 
         log_messages.append(f"Girilen metin: {text}")
-        letter_counts = {}
+        result = self._encrypt_traced(text, letter_counts, log_messages, matches, callback)
+
+        log_msg = f"\nSonuç: {result}"
+        log_messages.append(log_msg)
+        if callback:
+            callback(log_msg)
+
+        return result, log_messages, matches
+
+    def _encrypt_traced(self, text, letter_counts, log_messages, matches, callback=None):
+        """
+        Büyük harfe çevrilmiş metni adım adım loglayarak şifreler
+
+        Parameters:
+        -----------
+        text : str
+            Büyük harfe çevrilmiş metin
+        letter_counts : dict
+            Harf kullanım sayıları; metindeki harflere göre güncellenir
+        log_messages : list
+            Log mesajlarının ekleneceği liste
+        matches : list or MatchTable
+            Harf-element eşleşmelerinin ekleneceği liste veya tablo
+        callback : callable, optional
+            Her log mesajı için çağrılacak geri çağırma fonksiyonu
+
+        Returns:
+        --------
+        str
+            Şifrelenmiş metin
+        """
+        self.ensure_traced_tables()
+        parts = []
+        harf_indeksi = self._harf_indeksi
+        cikti_tablosu = self._cikti_tablosu
+        log_tablosu = self._log_tablosu
+        eslesme_tablosu = self._eslesme_tablosu
+        callback_toplu = _batch_callback(callback) if callback else None
+        hucre_ekle = getattr(matches, 'append_cell', None)
 
         for letter in text:
-            if letter not in self.turkce_alfabe:
-                result += letter
+            index = harf_indeksi.get(letter)
+            if index is None:
+                parts.append(letter)
                 log_msg = f"'{letter}' Türkçe alfabede yok, aynen bırakılıyor."
                 log_messages.append(log_msg)
                 if callback:
@@ -133,100 +961,27 @@ class PeriodicCipher:
             if callback:
                 callback(log_msg)
 
-            element_info = self.get_element_for_letter(letter, count)
-            if not element_info:
-                result += letter
-                log_msg = f"Element bulunamadı, harf aynen bırakılıyor."
-                log_messages.append(log_msg)
-                if callback:
-                    callback(log_msg)
-                continue
-
-            log_msg = f"Eşleşen element: {element_info['element']}"
-            log_messages.append(log_msg)
-            if callback:
-                callback(log_msg)
-
-            log_msg = f"Orbital dizilimi: {element_info['orbital']}"
-            log_messages.append(log_msg)
-            if callback:
-                callback(log_msg)
-
-            shift = self.orbital_to_shift(element_info['orbital'], element_info['son_katman'])
-            log_msg = f"Hesaplanan öteleme: {shift}"
-            log_messages.append(log_msg)
-            if callback:
-                callback(log_msg)
+            # Kullanım sırasına göre: 1 → 2 → 3 → tekrar 1 ...
+            katman_indeksi = (count - 1) % 3
+            parts.append(cikti_tablosu[katman_indeksi][index])
 
-            shifted_letter = self.shift_letter(letter, shift)
-            log_msg = f"Ötelenmiş harf: {shifted_letter}"
-            log_messages.append(log_msg)
+            # Harf ve katmana bağlı log satırları derleme sırasında hazırlandı
+            katman_loglari = log_tablosu[katman_indeksi][index]
+            log_messages.extend(katman_loglari)
             if callback:
-                callback(log_msg)
+                callback_toplu(katman_loglari)
 
             # Eşleşmeleri kaydet
-            matches.append({
-                'harf': letter,
-                'element': element_info['element'],
-                'orbital': element_info['orbital'],
-                'son_katman': element_info['son_katman'],
-                'oteleme': shift
-            })
-
-            # Koordinat için tüm katmanlarda arayalım
-            found_element = None
-            found_katman = None
-
-            # Önce katman1'de arayalım (öncelik)
-            for letter_key, element_data in self.katman1_elementler.items():
-                if letter_key == shifted_letter:
-                    found_element = element_data
-                    found_katman = 1
-                    break
-
-            # Bulunamazsa katman2'de arayalım
-            if not found_element:
-                for letter_key, element_data in self.katman2_elementler.items():
-                    if letter_key == shifted_letter:
-                        found_element = element_data
-                        found_katman = 2
-                        break
-
-            # Bulunamazsa katman3'de arayalım
-            if not found_element:
-                for letter_key, element_data in self.katman3_elementler.items():
-                    if letter_key == shifted_letter:
-                        found_element = element_data
-                        found_katman = 3
-                        break
-
-            if found_element:
-                coord = f"{found_element['konum'][0]:02d}{found_element['konum'][1]:02d}"
-                result += coord
-                log_msg = f"Periyodik tablo koordinatları (Katman {found_katman}): {coord}"
-                log_messages.append(log_msg)
-                if callback:
-                    callback(log_msg)
-            else:
-                result += shifted_letter
-                log_msg = f"Koordinat bulunamadı, ötelenmiş harf kullanılıyor: {shifted_letter}"
-                log_messages.append(log_msg)
-                if callback:
-                    callback(log_msg)
-
-            log_msg = "-" * 50
-            log_messages.append(log_msg)
-            if callback:
-                callback(log_msg)
-
-        log_msg = f"\nSonuç: {result}"
-        log_messages.append(log_msg)
-        if callback:
-            callback(log_msg)
+            match = eslesme_tablosu[katman_indeksi][index]
+            if match:
+                if hucre_ekle is not None:
+                    hucre_ekle(katman_indeksi, index)
+                else:
+                    matches.append(match.copy())
 
-        return result, log_messages, matches
+        return "".join(parts)
 
-    def decrypt(self, text, callback=None):
+    def decrypt(self, text, callback=None, trace=True, scorer=None, beam_width=16, progress=None):
         """
         Şifrelenmiş metni çözer
 
@@ -235,7 +990,19 @@ class PeriodicCipher:
         text : str
             Deşifre edilecek metin
         callback : callable, optional
-            Her adımda çağrılacak geri çağırma fonksiyonu
+            Her adımda çağrılacak geri çağırma fonksiyonu; extend(messages)
+            metodu varsa ardışık mesaj grupları tek çağrıda iletilir
+        trace : bool, optional
+            False ise log mesajları ve alternatifler hiç oluşturulmaz, callback
+            çağrılmaz ve adım/alternatif listeleri boş döner
+        scorer : language_model.LanguageScorer, optional
+            Verilirse birden fazla adaylı koordinatlarda alfabetik ilk aday
+            yerine dil modeline göre en olası sonucun harfleri seçilir
+        beam_width : int, optional
+            Dil modeliyle aramada her koordinatta tutulan en fazla yol sayısı
+        progress : callable, optional
+            Dil modeliyle aramada düzenli aralıklarla progress(oran) olarak
+            çağrılır; istisna yükseltirse arama durur (iptal için)
 
         Returns:
         --------
@@ -246,7 +1013,15 @@ class PeriodicCipher:
         list
             Alternatif çözümler
         """
-        result = ""
+        secimler = None
+        if scorer is not None:
+            if not trace:
+                return self.rank_decryptions(text, scorer, beam_width, progress=progress)[0][0], [], []
+            puan, zincir = self._beam_search(text, scorer, beam_width, progress)[2][0]
+            secimler = iter(self._chain_choices(zincir))
+        elif not trace:
+            return self._decrypt_untraced(text, {})[0], [], []
+
         log_messages = []
         alternatives = []
 
@@ -257,12 +1032,69 @@ class PeriodicCipher:
 
         # Her harfin deşifre sırasını takip eden sözlük
         original_letter_counts = {}
+        result = self._decrypt_traced(text, original_letter_counts, log_messages, alternatives, callback,
+                                      secimler=secimler)[0]
+
+        if secimler is not None:
+            log_msg = f"\nDil modeli puanı: {puan:.2f}"
+            log_messages.append(log_msg)
+            if callback:
+                callback(log_msg)
+
+        log_msg = f"\nSonuç: {result}"
+        log_messages.append(log_msg)
+        if callback:
+            callback(log_msg)
+
+        return result, log_messages, alternatives
+
+    def _decrypt_traced(self, text, original_letter_counts, log_messages, alternatives,
+                        callback=None, final=True, secimler=None):
+        """
+        Şifreli metni adım adım loglayarak çözer
+
+        Parameters:
+        -----------
+        text : str
+            Deşifre edilecek metin
+        original_letter_counts : dict
+            Orijinal harf kullanım sayıları; çözülen harflere göre güncellenir
+        log_messages : list
+            Log mesajlarının ekleneceği liste
+        alternatives : list
+            Birden fazla adaylı koordinatların ekleneceği liste
+        callback : callable, optional
+            Her log mesajı için çağrılacak geri çağırma fonksiyonu
+        final : bool, optional
+            False ise metnin sonunda devamı gelebilecek yarım koordinat
+            işlenmeden bırakılır
+        secimler : iterator, optional
+            Aday gerektiren her koordinat için sırayla seçilecek harf (None:
+            varsayılan seçim); verilmezse alfabetik ilk aday seçilir
+
+        Returns:
+        --------
+        str
+            Deşifre edilmiş metin
+        int
+            İşlenen karakter sayısı
+        """
+        self.ensure_traced_tables()
+        parts = []
+        koordinat_indeksi = self._koordinat_indeksi
+        harf_indeksi = self._harf_indeksi
+        ters_tablo = self._ters_tablo
 
         i = 0
         while i < len(text):
+            if not final and i + 3 >= len(text) and text[i:].isdigit():
+                # Koordinatın devamı sonraki parçada olabilir
+                break
+
             if i + 3 < len(text) and text[i:i + 4].isdigit():
                 coord = text[i:i + 4]
-                shifted_letter = self.get_letter_from_coordinates(coord)
+                kayit = koordinat_indeksi.get(coord) or self.find_by_coordinates(coord)
+                shifted_letter = kayit[0] if kayit else None
                 log_msg = f"\nKoordinat {coord} -> Ötelenmiş harf: {shifted_letter}"
                 log_messages.append(log_msg)
                 if callback:
@@ -273,62 +1105,51 @@ class PeriodicCipher:
                     log_messages.append(log_msg)
                     if callback:
                         callback(log_msg)
-                    result += coord
+                    parts.append(coord)
                     i += 4
                     continue
 
+                # Her aday harf yalnızca sıradaki kullanım katmanında değerlendirilir
                 candidate_list = []
-                for candidate in self.turkce_alfabe:
-                    # Her bir katmanı dene (1, 2, 3)
-                    for katman in range(1, 4):
-                        count = original_letter_counts.get(candidate, 0) % 3 + 1
-                        if count != katman:
-                            # Son kullanılan katmanı belirle ve sıradaki katmanı hesapla
-                            last_count = original_letter_counts.get(candidate, 0)
-                            next_count = last_count + 1
-                            next_katman = (next_count - 1) % 3 + 1
-                            if next_katman != katman:
-                                continue
-
-                        # İlgili katmandan element bilgisini al
-                        if katman == 1:
-                            element_info = self.katman1_elementler.get(candidate)
-                        elif katman == 2:
-                            element_info = self.katman2_elementler.get(candidate)
-                        else:
-                            element_info = self.katman3_elementler.get(candidate)
-
-                        if not element_info:
-                            continue
-
-                        shift = self.orbital_to_shift(element_info['orbital'], element_info['son_katman'])
-                        if self.shift_letter(candidate, shift) == shifted_letter:
-                            candidate_list.append({
-                                'harf': candidate,
-                                'katman': katman,
-                                'element': element_info['element'],
-                                'orbital': element_info['orbital'],
-                                'son_katman': element_info['son_katman'],
-                                'oteleme': shift
-                            })
+                shifted_index = harf_indeksi.get(shifted_letter)
+                if shifted_index is not None:
+                    for katman_indeksi in range(3):
+                        for aday in ters_tablo[katman_indeksi][shifted_index]:
+                            if original_letter_counts.get(aday[1]['harf'], 0) % 3 == katman_indeksi:
+                                candidate_list.append(aday)
+                    if len(candidate_list) > 1:
+                        candidate_list.sort(key=lambda aday: aday[0])
+                    candidate_list = [aday for _, aday in candidate_list]
+
+                secim = None
+                if secimler is not None and self._harf_cozum.get(shifted_letter):
+                    secim = next(secimler, None)
 
                 if not candidate_list:
                     log_msg = "Uyarı: Orijinal harf bulunamadı, direkt aktarılıyor."
                     log_messages.append(log_msg)
                     if callback:
                         callback(log_msg)
-                    result += shifted_letter
+                    parts.append(shifted_letter)
                 else:
+                    # En uygun adayı seç (verilmişse dil modelinin seçtiği, yoksa ilk eleman)
+                    selected_candidate = candidate_list[0]
+                    for aday in candidate_list:
+                        if aday['harf'] == secim:
+                            selected_candidate = aday
+                            break
+                    original_letter = selected_candidate['harf']
+
                     # Eğer birden fazla aday varsa, seçim bilgisi kaydedilsin
                     if len(candidate_list) > 1:
                         # Katman sırasına göre sıralayalım, mevcut bağlamda en olası aday ilk eleman olsun
-                        sorted_candidates = sorted(candidate_list, key=lambda x: x['katman'])
+                        sorted_candidates = [dict(c) for c in sorted(candidate_list, key=lambda x: x['katman'])]
 
                         # Tüm adayları detaylarıyla kaydedelim
                         alternatives.append({
                             'koordinat': coord,
                             'adaylar': sorted_candidates,
-                            'secilen': sorted_candidates[0]['harf']
+                            'secilen': original_letter
                         })
 
                         log_msg = f"Birden fazla olası harf bulundu: {', '.join([c['harf'] for c in sorted_candidates])}"
@@ -336,10 +1157,7 @@ class PeriodicCipher:
                         if callback:
                             callback(log_msg)
 
-                    # En uygun adayı seç (ilk eleman)
-                    selected_candidate = candidate_list[0]
-                    original_letter = selected_candidate['harf']
-                    result += original_letter
+                    parts.append(original_letter)
 
                     # Kullanım sayısını güncelle
                     original_letter_counts[original_letter] = original_letter_counts.get(original_letter, 0) + 1
@@ -355,7 +1173,7 @@ class PeriodicCipher:
                 log_messages.append(log_msg)
                 if callback:
                     callback(log_msg)
-                result += text[i]
+                parts.append(text[i])
                 i += 1
 
             log_msg = "-" * 50
@@ -363,9 +1181,400 @@ class PeriodicCipher:
             if callback:
                 callback(log_msg)
 
-        log_msg = f"\nSonuç: {result}"
-        log_messages.append(log_msg)
-        if callback:
-            callback(log_msg)
+        return "".join(parts), i
+
+    def encrypt_stream(self, source, callback=None, matches=None, chunk_size=65536):
+        """
+        Metni parça parça şifreler ve şifreli parçaları üretir
+
+        Harf kullanım sayıları parçalar arasında taşındığından, parçaların
+        birleşimi tek seferde encrypt çağrısıyla aynı sonucu verir. Bellek
+        kullanımı parça boyutuyla sınırlıdır.
+
+        Parameters:
+        -----------
+        source : iterable of str veya metin dosyası
+            Şifrelenecek metin parçaları; read() metodu olan nesneler
+            chunk_size karakterlik parçalar halinde okunur
+        callback : callable, optional
+            Her log mesajı için çağrılacak geri çağırma fonksiyonu
+            ("Girilen metin" ve "Sonuç" satırları üretilmez)
+        matches : list or MatchTable, optional
+            Verilirse harf-element eşleşmeleri bu listeye eklenir; callback
+            verilmemişse MatchTable eşleşmeleri log üretmeyen yolla doldurulur
+        chunk_size : int, optional
+            Dosya nesnelerinden bir seferde okunacak karakter sayısı
+
+        Yields:
+        -------
+        str
+            Şifrelenmiş metin parçaları
+        """
+        letter_counts = {}
+        metin_ekle = getattr(matches, 'extend_text', None)
+        trace = callback is not None or (matches is not None and metin_ekle is None)
+
+        for chunk in self._iter_chunks(source, chunk_size):
+            chunk = chunk.upper()
+            if metin_ekle is not None and not trace:
+                metin_ekle(chunk, letter_counts)
+            if trace:
+                result = self._encrypt_traced(chunk, letter_counts, [],
+                                              matches if matches is not None else [], callback)
+            else:
+                result = self._encrypt_untraced(chunk, letter_counts)
+            if result:
+                yield result
+
+    def decrypt_stream(self, source, callback=None, alternatives=None, chunk_size=65536):
+        """
+        Şifreli metni parça parça çözer ve çözülmüş parçaları üretir
+
+        Harf kullanım sayıları ve parça sınırında bölünmüş 4 haneli
+        koordinatlar bir sonraki parçaya taşınır; parçaların birleşimi tek
+        seferde decrypt çağrısıyla aynı sonucu verir.
+
+        Parameters:
+        -----------
+        source : iterable of str veya metin dosyası
+            Şifreli metin parçaları; read() metodu olan nesneler chunk_size
+            karakterlik parçalar halinde okunur
+        callback : callable, optional
+            Her log mesajı için çağrılacak geri çağırma fonksiyonu
+            ("Şifreli metin" ve "Sonuç" satırları üretilmez)
+        alternatives : list, optional
+            Verilirse birden fazla adaylı koordinatlar bu listeye eklenir
+        chunk_size : int, optional
+            Dosya nesnelerinden bir seferde okunacak karakter sayısı
+
+        Yields:
+        -------
+        str
+            Deşifre edilmiş metin parçaları
+        """
+        original_letter_counts = {}
+        trace = callback is not None or alternatives is not None
+        pending = ""
+
+        def decrypt_part(text, final):
+            if trace:
+                return self._decrypt_traced(text, original_letter_counts, [],
+                                            alternatives if alternatives is not None else [],
+                                            callback, final)
+            return self._decrypt_untraced(text, original_letter_counts, final)
+
+        for chunk in self._iter_chunks(source, chunk_size):
+            text = pending + chunk if pending else chunk
+            result, consumed = decrypt_part(text, False)
+            pending = text[consumed:]
+            if result:
+                yield result
+
+        if pending:
+            result, _ = decrypt_part(pending, True)
+            if result:
+                yield result
+
+    def _decryption_slots(self, text):
+        """
+        Şifreli metni sabit parçalara ve aday seçimi gerektiren koordinatlara ayırır
+
+        Returns:
+        --------
+        list
+            Metin parçaları; koordinat konumları None ile ayrılır
+        list
+            Her koordinat için (parça konumu, adaylar, ötelenmiş harf)
+            üçlüleri; adaylar alfabe sırasında (harf, harf indeksi, katman
+            indeksi) üçlüleridir
+        """
+        parts = []
+        slots = []
+        koordinat_cozum = self._koordinat_cozum
+        literal_start = 0
+        i = 0
+        while i < len(text):
+            if i + 3 < len(text) and text[i:i + 4].isdigit():
+                coord = text[i:i + 4]
+                cozum = koordinat_cozum.get(coord)
+                if cozum is None:
+                    kayit = self.find_by_coordinates(coord)
+                    if kayit is not None:
+                        cozum = (kayit[0], self._harf_cozum.get(kayit[0], ()))
+                if cozum is not None:
+                    if literal_start < i:
+                        parts.append(text[literal_start:i])
+                    if cozum[1]:
+                        slots.append((len(parts), cozum[1], cozum[0]))
+                        parts.append(None)
+                    else:
+                        # Hiçbir katmanda adayı yoksa deşifrede olduğu gibi aktarılır
+                        parts.append(cozum[0])
+                    literal_start = i + 4
+                i += 4
+            else:
+                i += 1
+        if literal_start < len(text):
+            parts.append(text[literal_start:])
+        return parts, slots
+
+    def iter_decryptions(self, text, progress=None):
+        """
+        Şifreli metnin tutarlı tüm deşifre sonuçlarını tembel olarak üretir
+
+        Her koordinatta yalnızca o ana kadar seçilen harflerin kullanım
+        sayılarıyla tutarlı katmandaki adaylar denenir; her seçimden sonra
+        katman durumu yeniden hesaplanır. Sonuçlar, her koordinatta adayların
+        alfabe sırasına göre sözlük sırasıyla üretilir; yani ilk sonuç, çıkmaza
+        girmediği sürece decrypt'in seçtiği sonuçtur.
+
+        Arama iki yolla budanır: bir seçim, sonraki _ILERI_BAKIS koordinattan
+        birini tutarlı adaysız bırakacaksa denenmez (_lookahead_feasible), ve
+        hiçbir tamamlanmış sonuca ulaşamayan düğümler yalnızca sonraki
+        koordinatların kullanabileceği harflerin katman durumuyla hatırlanıp
+        bir daha denenmez. Yine de bazı metinlerde arama uzun sürebilir;
+        çağıran progress ile işi sınırlamalıdır.
+
+        Parameters:
+        -----------
+        text : str
+            Deşifre edilecek metin
+        progress : callable, optional
+            Her _ILERLEME_ARALIGI düğümde o ana kadar ziyaret edilen düğüm
+            sayısıyla çağrılır; istisna yükseltirse arama durur (iptal veya
+            iş sınırı için)
+
+        Yields:
+        -------
+        str
+            Olası deşifre sonuçları
+        """
+        parts, slots = self._decryption_slots(text)
+        if not slots:
+            yield "".join(parts)
+            return
+
+        # Her koordinattan itibaren adaylarda geçen harf indeksleri
+        kalan_harfler = [()] * len(slots)
+        kume = set()
+        for j in range(len(slots) - 1, -1, -1):
+            kume.update(index for _, index, _ in slots[j][1])
+            kalan_harfler[j] = tuple(sorted(kume))
+
+        # Harf kullanım sayıları (mod 3)
+        sayac = bytearray(len(self.turkce_alfabe))
+        son = len(slots) - 1
+        secim = [-1] * len(slots)
+        basarili = [False] * len(slots)
+        anahtarlar = [None] * len(slots)
+        cikmazlar = set()
+        ziyaret = 0
+
+        if not self._lookahead_feasible(slots, sayac, 0):
+            return
+
+        j = 0
+        anahtarlar[0] = (0, bytes(sayac[i] for i in kalan_harfler[0]))
+        while j >= 0:
+            pozisyon, adaylar, _ = slots[j]
+            k = secim[j]
+            if k >= 0:
+                # Önceki seçimi geri al
+                index = adaylar[k][1]
+                sayac[index] = (sayac[index] + 2) % 3
+            else:
+                ziyaret += 1
+                if progress is not None and ziyaret % _ILERLEME_ARALIGI == 0:
+                    progress(ziyaret)
+                if anahtarlar[j] in cikmazlar:
+                    k = len(adaylar)
+
+            # Sıradaki tutarlı ve ileriye bakışta çıkmaz olmayan adayı bul
+            while True:
+                k += 1
+                while k < len(adaylar) and sayac[adaylar[k][1]] != adaylar[k][2]:
+                    k += 1
+                if k >= len(adaylar):
+                    break
+                index = adaylar[k][1]
+                sayac[index] = (sayac[index] + 1) % 3
+                if j == son or self._lookahead_feasible(slots, sayac, j + 1):
+                    break
+                sayac[index] = (sayac[index] + 2) % 3
+
+            if k < len(adaylar):
+                secim[j] = k
+                parts[pozisyon] = adaylar[k][0]
+                if j == son:
+                    basarili[j] = True
+                    yield "".join(parts)
+                else:
+                    j += 1
+                    secim[j] = -1
+                    basarili[j] = False
+                    anahtarlar[j] = (j, bytes(sayac[i] for i in kalan_harfler[j]))
+                continue
+
+            # Bu düğümün tüm dalları denendi
+            if not basarili[j]:
+                cikmazlar.add(anahtarlar[j])
+            elif j:
+                basarili[j - 1] = True
+            j -= 1
+
+    @staticmethod
+    def _lookahead_feasible(slots, sayac, baslangic):
+        """
+        Sonraki _ILERI_BAKIS koordinatın her birinde tutarlı bir aday kalıp kalamayacağını kontrol eder
+
+        Her harf için ulaşılabilecek katman durumları bit maskesi olarak
+        ileri taşınır: tek olası adaylı koordinat o harfin durumunu kesinleştirir,
+        birden fazla olası adayda her adayın sonraki durumu eklenir. Kontrol
+        gevşektir; False dönerse baslangic'tan itibaren tamamlanmış bir sonuç
+        yoktur, True dönmesi ise sonuç olduğunu garanti etmez.
+        """
+        olasi = bytearray(1 << durum for durum in sayac)
+        for m in range(baslangic, min(len(slots), baslangic + _ILERI_BAKIS)):
+            adaylar = slots[m][1]
+            tek = None
+            sayi = 0
+            for aday in adaylar:
+                if olasi[aday[1]] >> aday[2] & 1:
+                    sayi += 1
+                    tek = aday
+            if sayi == 0:
+                return False
+            if sayi == 1:
+                olasi[tek[1]] = 1 << (tek[2] + 1) % 3
+            else:
+                for _, index, katman_indeksi in adaylar:
+                    if olasi[index] >> katman_indeksi & 1:
+                        olasi[index] |= 1 << (katman_indeksi + 1) % 3
+        return True
+
+    def _beam_search(self, text, scorer, beam_width, progress=None):
+        """
+        Aday kafesinde dil modeli puanına göre ışın araması yapar
+
+        Her koordinatta ışındaki her yol yalnızca kendi katman durumuyla
+        tutarlı adaylarla genişletilir. Aynı (katman durumu, puanlama durumu)
+        ikilisine ulaşan yollardan yalnızca en yüksek puanlısı tutulur, ardından
+        en iyi beam_width yol bırakılır; böylece süre metin uzunluğuyla
+        doğrusal kalır. progress verilmişse her _ILERLEME_ARALIGI koordinatta
+        işlenen koordinat oranıyla çağrılır.
+
+        Returns:
+        --------
+        list
+            Metin parçaları (koordinat konumları None)
+        list
+            _decryption_slots koordinat listesi
+        list
+            Puana göre azalan (puan, seçim zinciri) ikilileri; zincir
+            (harf, önceki zincir) biçiminde sondan başa bağlı listedir ve
+            aynen aktarılan koordinatlar için harf None'dır
+        """
+        parts, slots = self._decryption_slots(text)
+        isin = {(bytes(len(self.turkce_alfabe)), scorer.start_state()): (0.0, None)}
+
+        def ekle(hedef, anahtar, puan, zincir):
+            mevcut = hedef.get(anahtar)
+            if mevcut is None or mevcut[0] < puan:
+                hedef[anahtar] = (puan, zincir)
+
+        slot_no = 0
+        for parca in parts:
+            yeni = {}
+            if parca is not None:
+                for (sayac, durum), (puan, zincir) in isin.items():
+                    durum, katki = scorer.score_text(durum, parca)
+                    ekle(yeni, (sayac, durum), puan + katki, zincir)
+                isin = yeni
+                continue
+
+            _, adaylar, shifted_letter = slots[slot_no]
+            slot_no += 1
+            if progress is not None and slot_no % _ILERLEME_ARALIGI == 0:
+                progress(slot_no / len(slots))
+            for (sayac, durum), (puan, zincir) in isin.items():
+                genisledi = False
+                for harf, index, katman_indeksi in adaylar:
+                    if sayac[index] != katman_indeksi:
+                        continue
+                    genisledi = True
+                    yeni_sayac = bytearray(sayac)
+                    yeni_sayac[index] = (katman_indeksi + 1) % 3
+                    yeni_durum, katki = scorer.advance(durum, harf)
+                    ekle(yeni, (bytes(yeni_sayac), yeni_durum), puan + katki, (harf, zincir))
+                if not genisledi:
+                    # decrypt'te olduğu gibi ötelenmiş harf aynen aktarılır
+                    yeni_durum, katki = scorer.advance(durum, shifted_letter)
+                    ekle(yeni, (sayac, yeni_durum), puan + katki - _GECIS_CEZASI, (None, zincir))
+            isin = dict(heapq.nlargest(beam_width, yeni.items(), key=lambda kayit: kayit[1][0]))
+
+        sonuclar = [(puan + scorer.finish(durum), zincir) for (_, durum), (puan, zincir) in isin.items()]
+        sonuclar.sort(key=lambda sonuc: -sonuc[0])
+        return parts, slots, sonuclar
+
+    @staticmethod
+    def _chain_choices(zincir):
+        """
+        Sondan başa bağlı seçim zincirini baştan sona seçim listesine çevirir
+        """
+        secimler = []
+        while zincir is not None:
+            harf, zincir = zincir
+            secimler.append(harf)
+        secimler.reverse()
+        return secimler
+
+    def rank_decryptions(self, text, scorer, beam_width=16, count=1, progress=None):
+        """
+        Şifreli metnin deşifre sonuçlarını dil modeli puanına göre sıralar
+
+        Tüm kombinasyonları denemek yerine aday kafesinde ışın araması yapılır;
+        en iyi sonuç metin uzunluğuyla doğrusal sürede bulunur.
+
+        Parameters:
+        -----------
+        text : str
+            Deşifre edilecek metin
+        scorer : language_model.LanguageScorer
+            Deşifre adaylarını puanlayan dil modeli
+        beam_width : int, optional
+            Her koordinatta tutulan en fazla yol sayısı
+        count : int, optional
+            Döndürülecek en fazla sonuç sayısı (en fazla beam_width)
+        progress : callable, optional
+            Arama sırasında düzenli aralıklarla progress(oran) olarak çağrılır;
+            istisna yükseltirse arama durur
+
+        Returns:
+        --------
+        list
+            Puana göre azalan (deşifre sonucu, puan) ikilileri
+        """
+        parts, slots, sonuclar = self._beam_search(text, scorer, beam_width, progress)
+        ranked = []
+        for puan, zincir in sonuclar[:count]:
+            metin = list(parts)
+            for (pozisyon, _, shifted_letter), harf in zip(slots, self._chain_choices(zincir)):
+                metin[pozisyon] = harf or shifted_letter
+            ranked.append(("".join(metin), puan))
+        return ranked
+
+    @staticmethod
+    def _iter_chunks(source, chunk_size):
+        """
+        Metin kaynağını boş olmayan parçalar halinde dolaşır
+        """
+        if isinstance(source, str):
+            chunks = [source]
+        elif hasattr(source, 'read'):
+            chunks = iter(lambda: source.read(chunk_size), "")
+        else:
+            chunks = source
 
-        return result, log_messages, alternatives
\ No newline at end of file
+        for chunk in chunks:
+            if chunk:
+                yield chunk
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Element Kayıt Defteri
+
+Katman sözlükleri (KATMAN1/2/3_ELEMENTLER) ile ELEMENT_INFO içindeki
+ayrıntılar içe aktarma sırasında bir kez birleştirilir. Her element için
+değiştirilemez bir kayıt oluşturulur ve kayıtlara (harf, katman), sembol,
+atom numarası ve koordinat ile doğrudan erişilir.
+"""
+
+from data import KATMAN1_ELEMENTLER, KATMAN2_ELEMENTLER, KATMAN3_ELEMENTLER
+
+try:
+    from element_info import ELEMENT_INFO
+except ImportError as e:
+    print(f"Element bilgileri yüklenemedi: {e}")
+    ELEMENT_INFO = {}
+
+
+class ElementRecord:
+    """
+    Bir elementin katman ve ayrıntı bilgilerini birleştiren değiştirilemez kayıt
+
+    Alanlar sözlük anahtarlarıyla da okunabilir (kayit['orbital'],
+    kayit.get('kategori', ...)); 'element' anahtarı sembolü döndürür. Böylece
+    katman sözlüğü veya ELEMENT_INFO girdisi bekleyen kodlar kaydı doğrudan
+    kullanabilir. Katmanlarda bulunmayan elementlerin katman alanları, ayrıntısı
+    olmayan elementlerin de ayrıntı alanları None'dır.
+    """
+
+    __slots__ = ('harf', 'katman', 'sembol', 'orbital', 'son_katman', 'konum', 'koordinat',
+                 'ad', 'atom_numarasi', 'atom_agirligi', 'kategori', 'bilgi')
+
+    def __init__(self, sembol, harf=None, katman=None, layer_info=None, details=None):
+        layer_info = layer_info or {}
+        details = details or {}
+        konum = layer_info.get('konum')
+        konum = tuple(konum) if konum is not None else None
+
+        degerler = {
+            'harf': harf,
+            'katman': katman,
+            'sembol': sembol,
+            'orbital': layer_info.get('orbital'),
+            'son_katman': layer_info.get('son_katman'),
+            'konum': konum,
+            'koordinat': f"{konum[0]:02d}{konum[1]:02d}" if konum is not None else None,
+            'ad': details.get('ad'),
+            'atom_numarasi': details.get('atom_numarasi'),
+            'atom_agirligi': details.get('atom_agirligi'),
+            'kategori': details.get('kategori'),
+            'bilgi': details.get('bilgi')
+        }
+        for alan, deger in degerler.items():
+            object.__setattr__(self, alan, deger)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ElementRecord değiştirilemez")
+
+    def __delattr__(self, name):
+        raise AttributeError("ElementRecord değiştirilemez")
+
+    def __getitem__(self, key):
+        if key == 'element':
+            return self.sembol
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        """
+        Alanı döndürür; alan yoksa veya değeri None ise default döner
+        """
+        try:
+            deger = self[key]
+        except KeyError:
+            return default
+        return default if deger is None else deger
+
+    @property
+    def has_details(self):
+        """
+        ELEMENT_INFO'da ayrıntısı olup olmadığını döndürür
+        """
+        return self.ad is not None
+
+    def __repr__(self):
+        return f"ElementRecord({self.sembol!r}, harf={self.harf!r}, katman={self.katman!r})"
+
+
+class ElementRegistry:
+    """
+    Element kayıtları ve çoklu anahtar indeksleri
+
+    Aynı koordinat birden fazla katmanda varsa katman sırasındaki ilk kayıt
+    geçerlidir. Koordinat indeksi hem (satır, sütun) demeti hem de 4 haneli
+    "SSSS" dizgisiyle anahtarlanır.
+    """
+
+    def __init__(self, layers=None, details=None):
+        """
+        Parameters:
+        -----------
+        layers : list of dict, optional
+            Katman sırasıyla harf → element sözlükleri
+        details : dict, optional
+            Sembol → ayrıntı sözlüğü (ELEMENT_INFO biçiminde)
+        """
+        if layers is None:
+            layers = [KATMAN1_ELEMENTLER, KATMAN2_ELEMENTLER, KATMAN3_ELEMENTLER]
+        if details is None:
+            details = ELEMENT_INFO
+
+        self._harf_katman = {}
+        self._sembol = {}
+        self._atom_numarasi = {}
+        self._koordinat = {}
+        self._katmanlar = []
+
+        for katman, katman_dict in enumerate(layers, start=1):
+            kayitlar = []
+            for harf, info in katman_dict.items():
+                sembol = info['element']
+                kayit = ElementRecord(sembol, harf, katman, info, details.get(sembol))
+                kayitlar.append(kayit)
+                self._harf_katman[(harf, katman)] = kayit
+                self._sembol.setdefault(sembol, kayit)
+                if kayit.konum is not None:
+                    self._koordinat.setdefault(kayit.konum, kayit)
+                    self._koordinat.setdefault(kayit.koordinat, kayit)
+            self._katmanlar.append(tuple(kayitlar))
+
+        # Katmanlarda olmayan ama ayrıntısı bulunan elementler
+        for sembol, info in details.items():
+            if sembol not in self._sembol:
+                self._sembol[sembol] = ElementRecord(sembol, details=info)
+
+        for kayit in self._sembol.values():
+            if kayit.atom_numarasi is not None:
+                self._atom_numarasi.setdefault(kayit.atom_numarasi, kayit)
+
+    def __len__(self):
+        return len(self._sembol)
+
+    def __iter__(self):
+        return iter(self._sembol.values())
+
+    def layer_count(self):
+        return len(self._katmanlar)
+
+    def layer(self, katman):
+        """
+        Katmandaki (1, 2, 3) kayıtları katman sözlüğündeki sırayla döndürür
+        """
+        return self._katmanlar[katman - 1]
+
+    def by_letter(self, harf, katman):
+        """
+        Harfin verilen katmandaki kaydını döndürür (yoksa None)
+        """
+        return self._harf_katman.get((harf, katman))
+
+    def by_symbol(self, sembol):
+        """
+        Sembolün kaydını döndürür (yoksa None)
+        """
+        return self._sembol.get(sembol)
+
+    def by_atomic_number(self, atom_numarasi):
+        """
+        Atom numarasının kaydını döndürür (ayrıntısı olmayan elementler için None)
+        """
+        return self._atom_numarasi.get(atom_numarasi)
+
+    def by_coordinate(self, coord):
+        """
+        Koordinattaki kaydı döndürür
+
+        Parameters:
+        -----------
+        coord : tuple or str
+            (satır, sütun) demeti veya 4 haneli koordinat (örn: "0213")
+
+        Returns:
+        --------
+        ElementRecord or None
+            Koordinattaki ilk katmanın kaydı
+        """
+        kayit = self._koordinat.get(coord)
+        if kayit is not None or not isinstance(coord, str):
+            return kayit
+
+        # Doğrudan anahtar yoksa sayısal ayrıştırmayla tekrar dene
+        try:
+            return self._koordinat.get((int(coord[0:2]), int(coord[2:4])))
+        except ValueError:
+            return None
+
+    def coordinate_items(self):
+        """
+        (koordinat anahtarı, kayıt) ikililerini döndürür
+        """
+        return self._koordinat.items()
+
+
+# Uygulama verisinden içe aktarmada oluşturulan ortak kayıt defteri
+REGISTRY = ElementRegistry()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Sıkıştırılmış Element Tabloları
+
+Şifreleyicinin (katman, harf) tablolarını sabit genişlikli dizilerden oluşan
+bir yapı olarak tutar: her dizi 3 × alfabe boyu uzunluğundadır ve
+katman_indeksi * alfabe_boyu + harf_indeksi ile adreslenir. Semboller ve
+orbital dizgileri tek kez saklanıp indeksle gösterilir. Tablolar bir kez
+oluşturulup bayt dizisine çevrilebilir; işçi süreçler bu baytları kopyalamadan,
+salt okunur memoryview'lar olarak bağlar.
+"""
+
+import struct
+import sys
+from array import array
+
+# Biçim: sihirli sayı, sürüm, bayt sırası (0: küçük, 1: büyük), harf ve katman sayısı
+_BASLIK = struct.Struct("<4sBBHH")
+_SIHIRLI = b"PTAB"
+_SURUM = 1
+
+# Boş hücre değerleri
+_SEMBOL_YOK = 0xFFFF
+_YOK = -1
+
+# Hücre dizileri: (alan adı, array tip kodu)
+_ALANLAR = (
+    ('sembol', 'H'),      # semboller tablosundaki indeks
+    ('orbital', 'H'),     # orbitaller tablosundaki indeks
+    ('son_katman', 'B'),
+    ('satir', 'B'),       # elementin periyodik tablo konumu
+    ('sutun', 'B'),
+    ('oteleme', 'h'),
+    ('otelenmis', 'b'),   # ötelenmiş harfin alfabe indeksi
+)
+
+
+class CompactElementTables:
+    """
+    (katman, harf) hücreli element tablolarının dizi tabanlı gösterimi
+
+    Her hücre alanı ayrı bir dizidedir (sembol, orbital, son_katman, satir,
+    sutun, oteleme, otelenmis); boş hücrelerde sembol _SEMBOL_YOK, öteleme ve
+    ötelenmiş harf -1'dir. letter_layers dizisi, her harfin çıktı koordinatı
+    olarak kullanılan ilk katmanını (yoksa -1) tutar.
+    """
+
+    def __init__(self, alphabet, layer_count, fields, letter_layers, symbols, orbitals):
+        self.alphabet = alphabet
+        self.layer_count = layer_count
+        self.fields = fields
+        self.letter_layers = letter_layers
+        self.symbols = symbols
+        self.orbitals = orbitals
+
+    @classmethod
+    def from_cipher(cls, cipher):
+        """
+        Şifreleyicinin derlenmiş tablolarından sıkıştırılmış tabloları oluşturur
+
+        Parameters:
+        -----------
+        cipher : PeriodicCipher
+            Tabloları derlenmiş şifreleyici
+
+        Returns:
+        --------
+        CompactElementTables
+            Dizi tabanlı tablolar
+        """
+        cipher.ensure_traced_tables()
+        alphabet = cipher.turkce_alfabe
+        layer_count = len(cipher._element_tablosu)
+        hucre_sayisi = layer_count * len(alphabet)
+
+        fields = {ad: array(kod, [0]) * hucre_sayisi for ad, kod in _ALANLAR}
+        symbols = []
+        orbitals = []
+        sembol_indeksi = {}
+        orbital_indeksi = {}
+
+        for katman_indeksi in range(layer_count):
+            for index in range(len(alphabet)):
+                hucre = katman_indeksi * len(alphabet) + index
+                info = cipher._element_tablosu[katman_indeksi][index]
+                if not info:
+                    fields['sembol'][hucre] = _SEMBOL_YOK
+                    fields['oteleme'][hucre] = _YOK
+                    fields['otelenmis'][hucre] = _YOK
+                    continue
+
+                # Aynı sembol ve orbital dizgileri tek kez saklanır
+                if info['element'] not in sembol_indeksi:
+                    sembol_indeksi[info['element']] = len(symbols)
+                    symbols.append(info['element'])
+                if info['orbital'] not in orbital_indeksi:
+                    orbital_indeksi[info['orbital']] = len(orbitals)
+                    orbitals.append(info['orbital'])
+
+                fields['sembol'][hucre] = sembol_indeksi[info['element']]
+                fields['orbital'][hucre] = orbital_indeksi[info['orbital']]
+                fields['son_katman'][hucre] = info['son_katman']
+                fields['satir'][hucre], fields['sutun'][hucre] = info['konum']
+                fields['oteleme'][hucre] = cipher._oteleme_tablosu[katman_indeksi][index]
+                fields['otelenmis'][hucre] = cipher._otelenmis_indeks_tablosu[katman_indeksi][index]
+
+        # Her harfin koordinatı, harfin bulunduğu ilk katmandaki konumdur
+        letter_layers = array('b', [_YOK]) * len(alphabet)
+        for index in range(len(alphabet)):
+            for katman_indeksi in range(layer_count):
+                if cipher._element_tablosu[katman_indeksi][index]:
+                    letter_layers[index] = katman_indeksi
+                    break
+
+        return cls(alphabet, layer_count, fields, letter_layers, tuple(symbols), tuple(orbitals))
+
+    def to_bytes(self):
+        """
+        Tabloları işçi süreçlere gönderilebilecek bayt dizisine çevirir
+        """
+        parcalar = [_BASLIK.pack(_SIHIRLI, _SURUM, sys.byteorder == "big",
+                                 len(self.alphabet), self.layer_count)]
+        for ad, _ in _ALANLAR:
+            parcalar.append(self.fields[ad].tobytes())
+        parcalar.append(self.letter_layers.tobytes())
+
+        metin = "\n".join((self.alphabet, "\t".join(self.symbols), "\t".join(self.orbitals))).encode("utf-8")
+        parcalar.append(struct.pack("<I", len(metin)))
+        parcalar.append(metin)
+        return b"".join(parcalar)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        to_bytes ile üretilmiş baytları kopyalamadan salt okunur olarak bağlar
+
+        Parameters:
+        -----------
+        data : bytes
+            Sıkıştırılmış tablolar
+
+        Returns:
+        --------
+        CompactElementTables
+            Hücre dizileri data üzerindeki memoryview'lar olan tablolar
+
+        Raises:
+        -------
+        ValueError
+            Baytlar geçerli bir tablo değilse veya farklı bayt sırasıyla üretildiyse
+        """
+        gorunum = memoryview(data).toreadonly()
+        if len(gorunum) < _BASLIK.size:
+            raise ValueError("Geçersiz element tablosu verisi")
+        sihirli, surum, buyuk_uclu, harf_sayisi, layer_count = _BASLIK.unpack_from(gorunum)
+        if sihirli != _SIHIRLI or surum != _SURUM:
+            raise ValueError("Geçersiz element tablosu verisi")
+        if bool(buyuk_uclu) != (sys.byteorder == "big"):
+            raise ValueError("Element tablosu farklı bayt sırasıyla üretilmiş")
+
+        hucre_sayisi = harf_sayisi * layer_count
+        konum = _BASLIK.size
+        fields = {}
+        for ad, kod in _ALANLAR:
+            uzunluk = hucre_sayisi * array(kod).itemsize
+            fields[ad] = gorunum[konum:konum + uzunluk].cast(kod)
+            konum += uzunluk
+        letter_layers = gorunum[konum:konum + harf_sayisi].cast('b')
+        konum += harf_sayisi
+
+        (metin_uzunlugu,) = struct.unpack_from("<I", gorunum, konum)
+        konum += 4
+        alphabet, symbols, orbitals = bytes(gorunum[konum:konum + metin_uzunlugu]).decode("utf-8").split("\n")
+        if len(alphabet) != harf_sayisi:
+            raise ValueError("Geçersiz element tablosu verisi")
+
+        return cls(alphabet, layer_count, fields, letter_layers,
+                   tuple(symbols.split("\t")) if symbols else (),
+                   tuple(orbitals.split("\t")) if orbitals else ())
+
+    def cell(self, katman_indeksi, harf_indeksi):
+        """
+        (katman, harf) hücresinin dizi indeksini döndürür
+        """
+        return katman_indeksi * len(self.alphabet) + harf_indeksi
+
+    def symbol(self, hucre):
+        """
+        Hücredeki elementin sembolünü döndürür (boş hücre için None)
+        """
+        index = self.fields['sembol'][hucre]
+        return None if index == _SEMBOL_YOK else self.symbols[index]
+
+    def coordinate(self, hucre):
+        """
+        Hücredeki elementin 4 haneli koordinatını döndürür (boş hücre için None)
+        """
+        if self.fields['sembol'][hucre] == _SEMBOL_YOK:
+            return None
+        return f"{self.fields['satir'][hucre]:02d}{self.fields['sutun'][hucre]:02d}"
+
+    def output(self, katman_indeksi, harf_indeksi):
+        """
+        Harfin verilen katmandaki şifreli çıktısını döndürür
+
+        Element yoksa harf aynen, ötelenmiş harfin koordinatı yoksa ötelenmiş
+        harf döner.
+        """
+        hucre = self.cell(katman_indeksi, harf_indeksi)
+        otelenmis = self.fields['otelenmis'][hucre]
+        if otelenmis == _YOK:
+            return self.alphabet[harf_indeksi]
+        katman = self.letter_layers[otelenmis]
+        if katman == _YOK:
+            return self.alphabet[otelenmis]
+        return self.coordinate(self.cell(katman, otelenmis))
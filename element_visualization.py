@@ -7,6 +7,10 @@ Periyodik Tablo Şifreleme Uygulaması - Element Görselleştirme Modülü
 import tkinter as tk
 from tkinter import Canvas, PhotoImage
 import math
+import time
+from collections import OrderedDict
+
+from frame_scheduler import FrameScheduler
 
 
 class ElementVisualizer:
@@ -14,6 +18,16 @@ class ElementVisualizer:
     Element görselleştirme ve animasyonlu bilgi gösterimi için sınıf
     """
 
+    # Önbellekte sahne verisi tutulan en fazla element sayısı
+    SCENE_CACHE_SIZE = 32
+    # Elektron yörünge tablolarının adım uzunluğu (piksel)
+    ELECTRON_STEP_PX = 2
+    # Elektron animasyonu kare aralığı sınırları (milisaniye)
+    ELECTRON_MIN_INTERVAL_MS = 40
+    ELECTRON_MAX_INTERVAL_MS = 250
+    # Bu süreyi aşan elektron kareleri kare aralığını uzatır (milisaniye)
+    ELECTRON_FRAME_BUDGET_MS = 4
+
     def __init__(self, root):
         """
         ElementVisualizer sınıfını başlatır
@@ -26,9 +40,17 @@ class ElementVisualizer:
         self.root = root
         self.popup_window = None
         self.electron_canvas = None
-        self.electrons = []
+        self.electron_shells = []
         self.animation_speed = 0.05
         self.is_running = False
+        self._electron_animation = None
+
+        # Sembole göre hazırlanmış sahne verileri (en son kullanılan sonda)
+        self._scene_cache = OrderedDict()
+
+        # Tekrar kullanılan atom modeli öğeleri
+        self._shell_items = []
+        self._electron_items = []
 
         # Renk paleti
         self.color_scheme = {
@@ -48,118 +70,188 @@ class ElementVisualizer:
         """
         Element detaylarını animasyonlu pencerede gösterir
 
+        Pencere ilk kullanımda bir kez oluşturulur; sonraki çağrılarda yalnızca
+        içeriği önbellekteki sahne verisiyle güncellenir.
+
         Parameters:
         -----------
         element_data : dict
             Element bilgilerini içeren sözlük
         """
-        # Eğer önceki popup açıksa kapat
-        if self.popup_window and self.popup_window.winfo_exists():
-            self.popup_window.destroy()
-            self.is_running = False
+        scene = self._scene_data(element_data)
+
+        if self.popup_window is None or not self.popup_window.winfo_exists():
+            self._build_popup()
+        else:
+            self._stop_animation()
+
+        # Pencere içeriğini güncelle
+        self.popup_window.title(scene['title'])
+        bg_color = scene['bg_color']
+        for widget in self._bg_widgets:
+            widget.configure(bg=bg_color)
+        self._symbol_label.configure(text=scene['symbol'])
+        self._atomic_num_label.configure(text=scene['atomic_number_text'])
+        self._atomic_weight_label.configure(text=scene['atomic_weight_text'])
+        self._category_label.configure(text=scene['category_text'])
+        self._info_title.configure(text=scene['info_title'])
+
+        self._info_text.config(state="normal")
+        self._info_text.delete("1.0", "end")
+        self._info_text.insert("1.0", scene['info'])
+        self._info_text.config(state="disabled")  # Salt okunur yap
+
+        # Atom modelini çiz
+        self._draw_atom_model(scene['shells'])
+
+        self.popup_window.deiconify()
+        self.popup_window.lift()
+        self.popup_window.focus_set()
+
+        # Animasyonu ortak kare zamanlayıcısında, en hızlı kabuğun bir tablo
+        # adımı ilerlediği sıklıkta başlat
+        self.is_running = True
+        self._electron_interval = self._base_electron_interval()
+        self._electron_animation = FrameScheduler.for_widget(self.electron_canvas).add(
+            self._animate_electrons, self.electron_canvas, interval_ms=self._electron_interval)
+
+    def _scene_data(self, element_data):
+        """
+        Elementin sahne verisini önbellekten döndürür (yoksa hazırlar)
+
+        Parameters:
+        -----------
+        element_data : dict
+            Element bilgilerini içeren sözlük
+
+        Returns:
+        --------
+        dict
+            Pencere metinleri, renk ve kabuk düzeni
+        """
+        symbol = element_data['sembol']
+        scene = self._scene_cache.get(symbol)
+        if scene is not None:
+            self._scene_cache.move_to_end(symbol)
+            return scene
+
+        kategori = element_data.get('kategori', 'Bilinmeyen')
+        scene = {
+            'title': f"{element_data['ad']} Detayları",
+            'bg_color': self.color_scheme.get(kategori, self.color_scheme['Bilinmeyen']),
+            'symbol': symbol,
+            'atomic_number_text': f"Atom Numarası: {element_data['atom_numarasi']}",
+            'atomic_weight_text': f"Atom Ağırlığı: {element_data['atom_agirligi']}",
+            'category_text': f"Kategori: {kategori}",
+            'info_title': f"{element_data['ad']} Kullanım Alanları",
+            'info': element_data['bilgi'],
+            'shells': self._prepare_atom_model(element_data['atom_numarasi'])
+        }
 
-        # Yeni popup pencere oluştur
+        self._scene_cache[symbol] = scene
+        if len(self._scene_cache) > self.SCENE_CACHE_SIZE:
+            self._scene_cache.popitem(last=False)
+        return scene
+
+    def _build_popup(self):
+        """
+        Detay penceresini ve widget'larını bir kez oluşturur
+        """
         self.popup_window = tk.Toplevel(self.root)
-        self.popup_window.title(f"{element_data['ad']} Detayları")
         self.popup_window.geometry("600x450")
         self.popup_window.resizable(False, False)
         self.popup_window.transient(self.root)
-        self.popup_window.focus_set()
 
-        # Pencere kapatıldığında animasyonu durdur
+        # Pencere kapatıldığında animasyonu durdur ve pencereyi gizle
         self.popup_window.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        # Arkaplan rengini kategori rengine göre ayarla
-        kategori = element_data.get('kategori', 'Bilinmeyen')
-        bg_color = self.color_scheme.get(kategori, self.color_scheme['Bilinmeyen'])
-
         # Ana çerçeve
-        main_frame = tk.Frame(self.popup_window, bg=bg_color)
+        main_frame = tk.Frame(self.popup_window)
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Sol panel - Element sembolü ve temel bilgiler
-        left_panel = tk.Frame(main_frame, bg=bg_color, width=200, height=430)
+        left_panel = tk.Frame(main_frame, width=200, height=430)
         left_panel.pack(side="left", fill="both", padx=10, pady=10)
         left_panel.pack_propagate(False)  # Boyutu sabit tut
 
         # Element sembolü, büyük boyutlu
-        symbol_label = tk.Label(left_panel, text=element_data['sembol'],
-                                font=("Arial", 72, "bold"), bg=bg_color)
-        symbol_label.pack(pady=(40, 10))
+        self._symbol_label = tk.Label(left_panel, font=("Arial", 72, "bold"))
+        self._symbol_label.pack(pady=(40, 10))
 
         # Atom numarası
-        atomic_num_label = tk.Label(left_panel, text=f"Atom Numarası: {element_data['atom_numarasi']}",
-                                    font=("Arial", 12), bg=bg_color)
-        atomic_num_label.pack(pady=5, anchor="w")
+        self._atomic_num_label = tk.Label(left_panel, font=("Arial", 12))
+        self._atomic_num_label.pack(pady=5, anchor="w")
 
         # Atom ağırlığı
-        atomic_weight_label = tk.Label(left_panel, text=f"Atom Ağırlığı: {element_data['atom_agirligi']}",
-                                       font=("Arial", 12), bg=bg_color)
-        atomic_weight_label.pack(pady=5, anchor="w")
+        self._atomic_weight_label = tk.Label(left_panel, font=("Arial", 12))
+        self._atomic_weight_label.pack(pady=5, anchor="w")
 
         # Kategori
-        category_label = tk.Label(left_panel, text=f"Kategori: {kategori}",
-                                  font=("Arial", 12), bg=bg_color)
-        category_label.pack(pady=5, anchor="w")
+        self._category_label = tk.Label(left_panel, font=("Arial", 12))
+        self._category_label.pack(pady=5, anchor="w")
+
+        # Arkaplanı kategori rengine göre değişen widget'lar
+        self._bg_widgets = [main_frame, left_panel, self._symbol_label, self._atomic_num_label,
+                            self._atomic_weight_label, self._category_label]
 
         # Sağ panel - Atom modeli ve bilgiler
         right_panel = tk.Frame(main_frame, bg="white", width=350, height=430)
         right_panel.pack(side="right", fill="both", expand=True, padx=10, pady=10)
 
         # Bilgi etiketi başlığı
-        info_title = tk.Label(right_panel, text=f"{element_data['ad']} Kullanım Alanları",
-                              font=("Arial", 14, "bold"), bg="white")
-        info_title.pack(pady=(10, 5))
+        self._info_title = tk.Label(right_panel, font=("Arial", 14, "bold"), bg="white")
+        self._info_title.pack(pady=(10, 5))
 
         # Bilgi içeriği
-        info_text = tk.Text(right_panel, height=8, width=40, font=("Arial", 10),
-                            wrap="word", bd=0, bg="white")
-        info_text.insert("1.0", element_data['bilgi'])
-        info_text.config(state="disabled")  # Salt okunur yap
-        info_text.pack(pady=5, padx=10, fill="x")
+        self._info_text = tk.Text(right_panel, height=8, width=40, font=("Arial", 10),
+                                  wrap="word", bd=0, bg="white")
+        self._info_text.pack(pady=5, padx=10, fill="x")
 
         # Bohr atom modeli animasyonu için canvas
         self.electron_canvas = Canvas(right_panel, width=300, height=200,
                                       bg="white", highlightthickness=0)
         self.electron_canvas.pack(pady=10)
 
-        # Atom modeli oluştur
-        self._create_atom_model(element_data['atom_numarasi'])
+        # Çekirdek
+        center_x = 150
+        center_y = 100
+        nucleus_size = 20
+        self.electron_canvas.create_oval(
+            center_x - nucleus_size / 2, center_y - nucleus_size / 2,
+            center_x + nucleus_size / 2, center_y + nucleus_size / 2,
+            fill="#ff4444", outline="#cc0000", width=2, tags="nucleus"
+        )
 
-        # Animasyonu başlat
-        self.is_running = True
-        self._animate_electrons()
+        # Kabuk ve elektron öğeleri gerektikçe oluşturulup tekrar kullanılır
+        self._shell_items = []
+        self._electron_items = []
 
-    def _create_atom_model(self, atom_number):
+    def _prepare_atom_model(self, atom_number):
         """
-        Bohr atom modeli oluşturur
+        Bohr atom modelinin kabuk düzenini hazırlar
 
         Parameters:
         -----------
         atom_number : int
             Atomun numarası (proton/elektron sayısı)
-        """
-        # Elektronları sıfırla
-        self.electrons = []
 
-        # Canvas merkezini bul
+        Returns:
+        --------
+        tuple
+            Her kabuk için (yarıçap, konum tablosu, elektron başlangıç adımları,
+            ms başına tablo adımı) demetleri
+        """
+        # Canvas merkezi
         center_x = 150
         center_y = 100
 
-        # Çekirdek
-        nucleus_size = 20
-        self.electron_canvas.create_oval(
-            center_x - nucleus_size / 2, center_y - nucleus_size / 2,
-            center_x + nucleus_size / 2, center_y + nucleus_size / 2,
-            fill="#ff4444", outline="#cc0000", width=2, tags="nucleus"
-        )
-
         # Elektron katmanları hesaplaması (basitleştirilmiş)
         # Gerçek fiziksel model yerine görsel çekiciliği artırmak için uyarlanmıştır
         shells = [2, 8, 8, 18, 18, 32]  # Kabuk kapasiteleri
 
         electrons_left = atom_number
         current_shell = 0
+        duzen = []
 
         while electrons_left > 0 and current_shell < len(shells):
             # Bu kabuktaki elektron sayısı
@@ -169,80 +261,164 @@ class ElementVisualizer:
             # Kabuk yarıçapı
             radius = 30 + current_shell * 25
 
-            # Kabuğu çiz
-            self.electron_canvas.create_oval(
-                center_x - radius, center_y - radius,
-                center_x + radius, center_y + radius,
-                outline="#aaaaaa", dash=(2, 4), tags=f"shell{current_shell}"
-            )
+            # Yörünge konumları bir kez, yörünge çevresinde ELECTRON_STEP_PX
+            # piksellik adımlarla hesaplanır; animasyonda sin/cos çağrılmaz
+            adim_sayisi = max(electrons_in_shell, round(2 * math.pi * radius / self.ELECTRON_STEP_PX))
+            konumlar = []
+            for k in range(adim_sayisi):
+                angle = k / adim_sayisi * 2 * math.pi
+                electron_x = round(center_x + radius * math.cos(angle))
+                electron_y = round(center_y + radius * math.sin(angle))
+                konumlar.append((electron_x - 4, electron_y - 4, electron_x + 4, electron_y + 4))
+
+            # Elektronların başlangıç konumları tablodaki eşit aralıklı adımlardır
+            offsets = tuple(i * adim_sayisi // electrons_in_shell for i in range(electrons_in_shell))
 
-            # Elektronları yerleştir
-            for i in range(electrons_in_shell):
-                # Elektronun başlangıç açısı
-                angle = (i / electrons_in_shell) * 2 * math.pi
-
-                # Elektron konumlarını hesapla (başlangıç pozisyonu)
-                electron_x = center_x + radius * math.cos(angle)
-                electron_y = center_y + radius * math.sin(angle)
-
-                # Elektron objesini oluştur ve listede sakla
-                electron_id = self.electron_canvas.create_oval(
-                    electron_x - 4, electron_y - 4,
-                    electron_x + 4, electron_y + 4,
-                    fill="#3366ff", outline="#0033cc", tags=f"electron{current_shell}_{i}"
-                )
-
-                # Elektron bilgilerini kaydet
-                self.electrons.append({
-                    'id': electron_id,
-                    'shell': current_shell,
-                    'radius': radius,
-                    'angle': angle,
-                    'speed': 0.02 - current_shell * 0.003  # Dış katmanlar daha yavaş
-                })
+            # Açısal hız 50 ms'lik kareler için tanımlıdır; dış katmanlar daha yavaş
+            speed = 0.02 - current_shell * 0.003
+            adim_hizi = speed / 50 * adim_sayisi / (2 * math.pi)
 
+            duzen.append((radius, tuple(konumlar), offsets, adim_hizi))
             current_shell += 1
 
-    def _animate_electrons(self):
+        return tuple(duzen)
+
+    def _draw_atom_model(self, shells):
+        """
+        Hazırlanmış kabuk düzenini canvas'taki mevcut öğelerle çizer
+
+        Kabuk ve elektron ovalleri yalnızca ilk kez gerektiğinde oluşturulur;
+        sonraki elementlerde taşınır, kullanılmayanlar gizlenir.
+
+        Parameters:
+        -----------
+        shells : tuple
+            _prepare_atom_model ile hazırlanmış kabuk düzeni
+        """
+        canvas = self.electron_canvas
+        center_x = 150
+        center_y = 100
+        self.electron_shells = []
+        kullanilan = 0
+
+        for current_shell, (radius, konumlar, offsets, adim_hizi) in enumerate(shells):
+            # Kabuğu çiz
+            yorunge = (center_x - radius, center_y - radius, center_x + radius, center_y + radius)
+            if current_shell < len(self._shell_items):
+                canvas.coords(self._shell_items[current_shell], *yorunge)
+                canvas.itemconfigure(self._shell_items[current_shell], state="normal")
+            else:
+                self._shell_items.append(canvas.create_oval(
+                    *yorunge, outline="#aaaaaa", dash=(2, 4), tags=f"shell{current_shell}"
+                ))
+
+            # Elektronları yerleştir; kabuk etiketi tüm kabuğu birlikte adresler
+            ids = []
+            for i, offset in enumerate(offsets):
+                if kullanilan < len(self._electron_items):
+                    electron_id = self._electron_items[kullanilan]
+                    canvas.coords(electron_id, *konumlar[offset])
+                    canvas.itemconfigure(electron_id, state="normal",
+                                         tags=(f"electron{current_shell}_{i}", f"electrons{current_shell}"))
+                else:
+                    electron_id = canvas.create_oval(
+                        *konumlar[offset],
+                        fill="#3366ff", outline="#0033cc",
+                        tags=(f"electron{current_shell}_{i}", f"electrons{current_shell}")
+                    )
+                    self._electron_items.append(electron_id)
+                ids.append(electron_id)
+                kullanilan += 1
+
+            # Kabuğun animasyon durumu
+            self.electron_shells.append({
+                'ids': ids,
+                'offsets': offsets,
+                'positions': konumlar,
+                'step': 0.0,
+                'drawn_step': 0,
+                'steps_per_ms': adim_hizi
+            })
+
+        # Bu elementte kullanılmayan öğeleri gizle
+        for item in self._shell_items[len(shells):] + self._electron_items[kullanilan:]:
+            canvas.itemconfigure(item, state="hidden")
+
+    def _base_electron_interval(self):
+        """
+        En hızlı kabuğun bir tablo adımı ilerlediği süreyi döndürür
+        """
+        en_hizli = max((shell['steps_per_ms'] for shell in self.electron_shells), default=0)
+        if en_hizli <= 0:
+            return self.ELECTRON_MAX_INTERVAL_MS
+        return min(self.ELECTRON_MAX_INTERVAL_MS, max(self.ELECTRON_MIN_INTERVAL_MS, 1 / en_hizli))
+
+    def _animate_electrons(self, gecen_ms):
         """
         Elektronların yörünge hareketini animasyonla gösterir
+
+        Konumlar önceden hesaplanmış kabuk tablolarından okunur; tablo adımı
+        değişmeyen kabuklar için hiç çizim yapılmaz. Kare süresi çizim
+        maliyetine göre uyarlanır: pahalı karelerden sonra aralık uzatılır,
+        ucuz karelerden sonra yeniden kısaltılır.
+
+        Parameters:
+        -----------
+        gecen_ms : float
+            Önceki kareden bu yana geçen süre (milisaniye)
+
+        Returns:
+        --------
+        bool
+            Animasyonun sürüp sürmeyeceği
         """
         if not self.is_running or not self.electron_canvas:
-            return
+            return False
+
+        baslangic = time.perf_counter()
+        coords = self.electron_canvas.coords
+        for shell in self.electron_shells:
+            konumlar = shell['positions']
+            adim_sayisi = len(konumlar)
+            shell['step'] = (shell['step'] + shell['steps_per_ms'] * gecen_ms) % adim_sayisi
+            adim = int(shell['step'])
+            if adim == shell['drawn_step']:
+                continue
+            shell['drawn_step'] = adim
 
-        center_x = 150
-        center_y = 100
+            # Kabuktaki elektronların konumunu güncelle
+            for electron_id, offset in zip(shell['ids'], shell['offsets']):
+                coords(electron_id, *konumlar[(adim + offset) % adim_sayisi])
 
-        # Tüm elektronları güncelle
-        for electron in self.electrons:
-            # Yeni açı hesapla
-            electron['angle'] += electron['speed']
-            if electron['angle'] > 2 * math.pi:
-                electron['angle'] -= 2 * math.pi
-
-            # Yeni konumu hesapla
-            new_x = center_x + electron['radius'] * math.cos(electron['angle'])
-            new_y = center_y + electron['radius'] * math.sin(electron['angle'])
-
-            # Elektronun konumunu güncelle
-            self.electron_canvas.coords(
-                electron['id'],
-                new_x - 4, new_y - 4,
-                new_x + 4, new_y + 4
-            )
+        # Uyarlanabilir kare hızı
+        harcanan = (time.perf_counter() - baslangic) * 1000
+        if harcanan > self.ELECTRON_FRAME_BUDGET_MS:
+            self._electron_interval = min(self.ELECTRON_MAX_INTERVAL_MS, self._electron_interval * 2)
+        elif harcanan < self.ELECTRON_FRAME_BUDGET_MS / 4:
+            self._electron_interval = max(self._base_electron_interval(), self._electron_interval * 0.8)
+        if self._electron_animation is not None:
+            self._electron_animation.interval_ms = self._electron_interval
 
-        # Sonraki animasyon karesi
-        if self.electron_canvas and self.is_running:
-            self.electron_canvas.after(50, self._animate_electrons)
+        return True
+
+    def _stop_animation(self):
+        """
+        Elektron animasyonunu zamanlayıcıdan çıkarır
+        """
+        self.is_running = False
+        if self._electron_animation is not None:
+            self._electron_animation.cancel()
+            self._electron_animation = None
 
     def _on_close(self):
         """
         Popup pencere kapatıldığında çağrılır
+
+        Pencere yok edilmez, bir sonraki element için gizlenir.
         """
-        self.is_running = False
-        if self.popup_window:
-            self.popup_window.destroy()
-            self.popup_window = None
+        self._stop_animation()
+        if self.popup_window and self.popup_window.winfo_exists():
+            self.popup_window.withdraw()
 
     def create_element_card(self, parent, element_data, width=120, height=120):
         """
@@ -6,10 +6,401 @@ Periyodik Tablo Şifreleme Uygulaması - Şifreleme Animasyonu Modülü
 
 import tkinter as tk
 from tkinter import Canvas, Button
+import re
 import time
 import math
+from array import array
+from bisect import bisect_right
 
-import a5
+from frame_scheduler import FrameScheduler
+
+# Adım modellerinin dizilerinin bir seferde doldurulduğu karakter sayısı
+_DOLDURMA_PARCASI = 4096
+
+# Şifreli metinde koordinat ve rakam dizisi desenleri
+_KOORDINAT = re.compile(r"\d{4}")
+_RAKAMLAR = re.compile(r"\d+")
+
+
+class EncryptionSteps:
+    """
+    Şifreleme animasyonu adımlarını istendiğinde üreten sıkıştırılmış model
+
+    Her karakter için yalnızca kullanım sayısı ve ilk adım numarası paralel
+    dizilerde tutulur; element, öteleme ve koordinat bilgileri şifreleyicinin
+    (harf, katman) tablolarından okunur. Adım sözlükleri indeksle erişildiğinde
+    oluşturulur. Toplam adım sayısı harf sayımlarından hesaplanır; diziler ise
+    istenen adıma kadar _DOLDURMA_PARCASI karakterlik parçalar halinde
+    doldurulur, böylece pencere açılırken metnin tamamı dolaşılmaz.
+    """
+
+    __slots__ = ('cipher', 'text', '_sayilar', '_adim_baslangici', '_uzunluk', '_sonuc',
+                 '_sayac', '_adim', '_islenen')
+
+    def __init__(self, cipher, text):
+        """
+        Parameters:
+        -----------
+        cipher : PeriodicCipher
+            Tabloları kullanılacak şifreleyici
+        text : str
+            Büyük harfe çevrilmiş giriş metni
+        """
+        cipher.ensure_traced_tables()
+        self.cipher = cipher
+        self.text = text
+        self._sayilar = array('I')
+        self._adim_baslangici = array('I')
+        self._sonuc = None
+        self._sayac = [0] * len(cipher.turkce_alfabe)
+        self._adim = 1
+        self._islenen = 0
+
+        # Başlangıç ve bitiş adımları, her karakter için bir adım ve elementi
+        # olan her harf kullanımı için dört ek adım. n kez geçen bir harfin
+        # k. katmandaki (0, 1, 2) kullanım sayısı (n + 2 - k) // 3'tür.
+        uzunluk = len(text) + 2
+        for harf, index in cipher._harf_indeksi.items():
+            adet = text.count(harf)
+            for katman_indeksi in range(3):
+                if cipher._element_tablosu[katman_indeksi][index] is not None:
+                    uzunluk += 4 * ((adet + 2 - katman_indeksi) // 3)
+        self._uzunluk = uzunluk
+
+    def __len__(self):
+        return self._uzunluk
+
+    def _fill(self, step_index):
+        """
+        Dizileri step_index adımını içeren karaktere kadar parça parça doldurur
+        """
+        harf_indeksi = self.cipher._harf_indeksi
+        element_tablosu = self.cipher._element_tablosu
+        sayac = self._sayac
+        adim = self._adim
+        while adim <= step_index and self._islenen < len(self.text):
+            son = min(len(self.text), self._islenen + _DOLDURMA_PARCASI)
+            for char in self.text[self._islenen:son]:
+                self._adim_baslangici.append(adim)
+                index = harf_indeksi.get(char)
+                if index is None:
+                    self._sayilar.append(0)
+                    adim += 1
+                    continue
+                sayac[index] += 1
+                if element_tablosu[(sayac[index] - 1) % 3][index] is None:
+                    self._sayilar.append(0)
+                    adim += 1
+                    continue
+                self._sayilar.append(sayac[index])
+                adim += 5
+            self._islenen = son
+        self._adim = adim
+
+    def __getitem__(self, step_index):
+        if step_index < 0:
+            step_index += self._uzunluk
+        if not 0 <= step_index < self._uzunluk:
+            raise IndexError("adım indeksi aralık dışında")
+
+        if step_index == 0:
+            return {
+                'type': 'start',
+                'text': self.text,
+                'message': f"Şifrelenecek metin: {self.text}"
+            }
+        if step_index == self._uzunluk - 1:
+            if self._sonuc is None:
+                self._sonuc = self.cipher.encrypt(self.text, trace=False)[0]
+            return {
+                'type': 'finish',
+                'result': self._sonuc,
+                'message': f"Şifreleme tamamlandı. Sonuç: {self._sonuc}"
+            }
+
+        self._fill(step_index)
+        i = bisect_right(self._adim_baslangici, step_index) - 1
+        alt_adim = step_index - self._adim_baslangici[i]
+        char = self.text[i]
+        count = self._sayilar[i]
+        if not count:
+            return {
+                'type': 'skip',
+                'char': char,
+                'position': i,
+                'message': f"'{char}' harfi şifrelenmeden geçildi"
+            }
+
+        cipher = self.cipher
+        index = cipher._harf_indeksi[char]
+        katman_indeksi = (count - 1) % 3
+        element_info = cipher._element_tablosu[katman_indeksi][index]
+        shift = cipher._oteleme_tablosu[katman_indeksi][index]
+        shifted = cipher.turkce_alfabe[cipher._otelenmis_indeks_tablosu[katman_indeksi][index]]
+
+        if alt_adim == 0:
+            return {
+                'type': 'letter_to_element',
+                'char': char,
+                'position': i,
+                'count': count,
+                'element': element_info['element'],
+                'message': f"'{char}' harfi için {count}. kullanımda '{element_info['element']}' elementi seçildi"
+            }
+        if alt_adim == 1:
+            return {
+                'type': 'orbital',
+                'char': char,
+                'position': i,
+                'element': element_info['element'],
+                'orbital': element_info['orbital'],
+                'message': f"'{element_info['element']}' elementinin orbital dizilimi: {element_info['orbital']}"
+            }
+        if alt_adim == 2:
+            return {
+                'type': 'shift',
+                'char': char,
+                'position': i,
+                'shift': shift,
+                'message': f"Hesaplanan öteleme değeri: {shift}"
+            }
+        if alt_adim == 3:
+            return {
+                'type': 'letter_shift',
+                'char': char,
+                'position': i,
+                'shifted': shifted,
+                'message': f"'{char}' harfi {shift} birim ötelenerek '{shifted}' harfine dönüştürüldü"
+            }
+        result = cipher._cikti_tablosu[katman_indeksi][index]
+        return {
+            'type': 'to_coordinate',
+            'char': shifted,
+            'position': i,
+            'result': result,
+            'message': f"'{shifted}' harfi '{result}' koordinatına dönüştürüldü"
+        }
+
+
+class DecryptionSteps:
+    """
+    Deşifreleme animasyonu adımlarını istendiğinde üreten sıkıştırılmış model
+
+    Her parça (4 haneli koordinat veya tek karakter) için metindeki konumu,
+    ilk adım numarası ve çözülen orijinal harfin indeksi paralel dizilerde
+    tutulur. Orijinal harfler decrypt ile aynı katman durumu takibiyle seçilir.
+    Toplam adım sayısı rakam dizilerinden hesaplanır; diziler istenen adıma
+    kadar parça parça doldurulur.
+    """
+
+    __slots__ = ('cipher', 'text', '_konumlar', '_adim_baslangici', '_orijinaller', '_uzunluk', '_sonuc',
+                 '_sayac', '_adim', '_islenen')
+
+    # Koordinat olmayan parça ve harfi bulunamayan koordinat işaretleri
+    _KOORDINAT_DEGIL = 255
+    _BULUNAMADI = 254
+
+    def __init__(self, cipher, text):
+        """
+        Parameters:
+        -----------
+        cipher : PeriodicCipher
+            Tabloları kullanılacak şifreleyici
+        text : str
+            Şifreli giriş metni
+        """
+        self.cipher = cipher
+        self.text = text
+        self._konumlar = array('I')
+        self._adim_baslangici = array('I')
+        self._orijinaller = bytearray()
+        self._sonuc = None
+        self._sayac = [0] * len(cipher.turkce_alfabe)
+        self._adim = 1
+        self._islenen = 0
+
+        # Rakam dizileri baştan 4'erli koordinatlara bölünür; her koordinat
+        # iki, diğer her karakter bir adımdır (artı başlangıç ve bitiş)
+        koordinat_sayisi = sum(len(rakamlar) // 4 for rakamlar in _RAKAMLAR.findall(text))
+        self._uzunluk = len(text) - 2 * koordinat_sayisi + 2
+
+    def __len__(self):
+        return self._uzunluk
+
+    def _fill(self, step_index):
+        """
+        Dizileri step_index adımını içeren parçaya kadar parça parça doldurur
+        """
+        cipher = self.cipher
+        text = self.text
+        sayac = self._sayac
+        adim = self._adim
+        i = self._islenen
+        while adim <= step_index and i < len(text):
+            son = min(len(text), i + _DOLDURMA_PARCASI)
+            while i < son:
+                self._konumlar.append(i)
+                self._adim_baslangici.append(adim)
+                if _KOORDINAT.match(text, i):
+                    kayit = cipher.find_by_coordinates(text[i:i + 4])
+                    orijinal = self._BULUNAMADI
+                    if kayit is not None:
+                        orijinal = cipher._harf_indeksi[kayit[0]]
+                        for harf, index, katman_indeksi in cipher._harf_cozum.get(kayit[0], ()):
+                            if sayac[index] % 3 == katman_indeksi:
+                                sayac[index] += 1
+                                orijinal = index
+                                break
+                    self._orijinaller.append(orijinal)
+                    adim += 2
+                    i += 4
+                else:
+                    self._orijinaller.append(self._KOORDINAT_DEGIL)
+                    adim += 1
+                    i += 1
+        self._adim = adim
+        self._islenen = i
+
+    def __getitem__(self, step_index):
+        if step_index < 0:
+            step_index += self._uzunluk
+        if not 0 <= step_index < self._uzunluk:
+            raise IndexError("adım indeksi aralık dışında")
+
+        if step_index == 0:
+            return {
+                'type': 'start_decrypt',
+                'text': self.text,
+                'message': f"Deşifrelenecek metin: {self.text}"
+            }
+        if step_index == self._uzunluk - 1:
+            if self._sonuc is None:
+                self._sonuc = self.cipher.decrypt(self.text, trace=False)[0]
+            return {
+                'type': 'finish_decrypt',
+                'result': self._sonuc,
+                'message': f"Deşifreleme tamamlandı. Sonuç: {self._sonuc}"
+            }
+
+        self._fill(step_index)
+        k = bisect_right(self._adim_baslangici, step_index) - 1
+        i = self._konumlar[k]
+        orijinal = self._orijinaller[k]
+        if orijinal == self._KOORDINAT_DEGIL:
+            return {
+                'type': 'skip_decrypt',
+                'char': self.text[i],
+                'position': i,
+                'message': f"'{self.text[i]}' karakteri koordinat olmadığından aynen bırakıldı"
+            }
+
+        coord = self.text[i:i + 4]
+        if orijinal == self._BULUNAMADI:
+            shifted = original = "?"
+        else:
+            shifted = self.cipher.get_letter_from_coordinates(coord)
+            original = self.cipher.turkce_alfabe[orijinal]
+
+        if step_index == self._adim_baslangici[k]:
+            return {
+                'type': 'coordinate_to_letter',
+                'coordinate': coord,
+                'position': i,
+                'shifted': shifted,
+                'message': f"'{coord}' koordinatı '{shifted}' harfine karşılık geliyor"
+            }
+        return {
+            'type': 'find_original',
+            'shifted': shifted,
+            'position': i,
+            'original': original,
+            'message': f"'{shifted}' harfinden geriye ötelemeyle '{original}' harfi bulundu"
+        }
+
+
+class RetainedScene:
+    """
+    Canvas öğelerini adım tipine göre havuzlayan kalıcı sahne
+
+    Çizim kodu create_* çağrılarını sahneye yapar. Her adım tipi kendi öğe
+    grubuna sahiptir: bir tip ilk kez çizildiğinde öğeler oluşturulur,
+    sonraki adımlarda aynı sıradaki öğelerin yalnızca değişen koordinat ve
+    seçenekleri güncellenir. Tip değişince önceki grup gizlenir; bir adımda
+    kullanılmayan havuz öğeleri de gizli kalır.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._havuzlar = {}
+        self._grup = None
+        self._sira = 0
+
+    def begin(self, grup):
+        """
+        Bir adım tipinin çizimine başlar
+        """
+        if self._grup is not None and self._grup != grup:
+            for kayit in self._havuzlar.get(self._grup, ()):
+                self._hide(kayit)
+        self._grup = grup
+        self._sira = 0
+
+    def end(self):
+        """
+        Adım çizimini bitirir; bu adımda kullanılmayan öğeleri gizler
+        """
+        for kayit in self._havuzlar.get(self._grup, [])[self._sira:]:
+            self._hide(kayit)
+
+    def _hide(self, kayit):
+        if not kayit[4]:
+            self.canvas.itemconfigure(kayit[0], state="hidden")
+            kayit[4] = True
+
+    def _item(self, kind, coords, options):
+        havuz = self._havuzlar.setdefault(self._grup, [])
+        kayit = havuz[self._sira] if self._sira < len(havuz) else None
+
+        if kayit is not None and kayit[1] == kind and kayit[3].keys() == options.keys():
+            # Havuzdaki öğe yalnızca değişen özellikleriyle güncellenir
+            if kayit[2] != coords:
+                self.canvas.coords(kayit[0], *coords)
+                kayit[2] = coords
+            degisen = {anahtar: deger for anahtar, deger in options.items() if kayit[3][anahtar] != deger}
+            if kayit[4]:
+                degisen['state'] = "normal"
+                kayit[4] = False
+            if degisen:
+                self.canvas.itemconfigure(kayit[0], **degisen)
+                kayit[3] = dict(options)
+        else:
+            # Çizim sırası farklıysa bu konumdaki öğe yeniden oluşturulur
+            item_id = getattr(self.canvas, "create_" + kind)(*coords, **options)
+            yeni = [item_id, kind, coords, dict(options), False]
+            if kayit is not None:
+                self.canvas.delete(kayit[0])
+                havuz[self._sira] = yeni
+                if self._sira + 1 < len(havuz):
+                    # Yığın sırası çizim sırasıyla aynı kalsın
+                    self.canvas.tag_lower(item_id, havuz[self._sira + 1][0])
+            else:
+                havuz.append(yeni)
+            kayit = yeni
+
+        self._sira += 1
+        return kayit[0]
+
+    def create_text(self, *coords, **options):
+        return self._item("text", coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._item("rectangle", coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._item("line", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._item("oval", coords, options)
 
 
 class EncryptionAnimator:
@@ -29,7 +420,9 @@ class EncryptionAnimator:
         self.root = root
         self.animation_window = None
         self.canvas = None
+        self.scene = None
         self.is_playing = False
+        self._play_job = None
         self.steps = []
         self.current_step = 0
         self.animation_speed = 1.0  # Hız faktörü
@@ -106,6 +499,7 @@ class EncryptionAnimator:
         self.canvas = Canvas(self.animation_window, bg=self.colors['background'],
                              width=800, height=550)
         self.canvas.pack(fill="both", expand=True, padx=10, pady=10)
+        self.scene = RetainedScene(self.canvas)
 
         # İlerleme çubuğu
         self.progress_frame = tk.Frame(self.animation_window, height=20)
@@ -121,179 +515,45 @@ class EncryptionAnimator:
         # Animasyon adımları listesi
         self.steps = []
 
-    def add_encryption_steps(self, input_text, letter_counts, element_infos, shifts,
-                             shifted_letters, results):
+    def add_encryption_steps(self, cipher, input_text):
         """
         Şifreleme adımlarını animasyon için ekler
 
+        Adımlar önceden oluşturulmaz; EncryptionSteps modeli her adımı
+        gösterildiğinde üretir.
+
         Parameters:
         -----------
+        cipher : PeriodicCipher
+            Adımları üretecek şifreleyici
         input_text : str
-            Giriş metni
-        letter_counts : dict
-            Harf kullanım sayıları
-        element_infos : list
-            Her adım için element bilgileri
-        shifts : list
-            Her adım için öteleme değerleri
-        shifted_letters : list
-            Her adım için ötelenmiş harfler
-        results : list
-            Her adım için şifreleme sonuçları
+            Büyük harfe çevrilmiş giriş metni
         """
-        self.steps = []
+        self.steps = EncryptionSteps(cipher, input_text)
         self.current_step = 0
 
-        # Başlangıç adımı
-        self.steps.append({
-            'type': 'start',
-            'text': input_text,
-            'message': f"Şifrelenecek metin: {input_text}"
-        })
-
-        # Her bir karakter için şifreleme adımları
-        for i, char in enumerate(input_text):
-            if char not in letter_counts:
-                self.steps.append({
-                    'type': 'skip',
-                    'char': char,
-                    'position': i,
-                    'message': f"'{char}' harfi şifrelenmeden geçildi"
-                })
-                continue
-
-            # Harf-Element eşleşmesi adımı
-            self.steps.append({
-                'type': 'letter_to_element',
-                'char': char,
-                'position': i,
-                'count': letter_counts[char],
-                'element': element_infos[i]['element'],
-                'message': f"'{char}' harfi için {letter_counts[char]}. kullanımda '{element_infos[i]['element']}' elementi seçildi"
-            })
-
-            # Orbital dizilimi adımı
-            self.steps.append({
-                'type': 'orbital',
-                'char': char,
-                'position': i,
-                'element': element_infos[i]['element'],
-                'orbital': element_infos[i]['orbital'],
-                'message': f"'{element_infos[i]['element']}' elementinin orbital dizilimi: {element_infos[i]['orbital']}"
-            })
-
-            # Öteleme adımı
-            self.steps.append({
-                'type': 'shift',
-                'char': char,
-                'position': i,
-                'shift': shifts[i],
-                'message': f"Hesaplanan öteleme değeri: {shifts[i]}"
-            })
-
-            # Harf öteleme adımı
-            self.steps.append({
-                'type': 'letter_shift',
-                'char': char,
-                'position': i,
-                'shifted': shifted_letters[i],
-                'message': f"'{char}' harfi {shifts[i]} birim ötelenerek '{shifted_letters[i]}' harfine dönüştürüldü"
-            })
-
-            # Koordinat dönüşüm adımı
-            self.steps.append({
-                'type': 'to_coordinate',
-                'char': shifted_letters[i],
-                'position': i,
-                'result': results[i],
-                'message': f"'{shifted_letters[i]}' harfi '{results[i]}' koordinatına dönüştürüldü"
-            })
-
-        # Son adım - şifrelenmiş metin
-        final_result = ''.join(results)
-        self.steps.append({
-            'type': 'finish',
-            'result': final_result,
-            'message': f"Şifreleme tamamlandı. Sonuç: {final_result}"
-        })
-
         # İlk adımı göster
         if self.steps:
             self.show_step(0)
             self.update_progress()
 
-    def add_decryption_steps(self, input_text, coordinates, shifted_letters,
-                             original_letters, results):
+    def add_decryption_steps(self, cipher, input_text):
         """
         Deşifreleme adımlarını animasyon için ekler
 
+        Adımlar önceden oluşturulmaz; DecryptionSteps modeli her adımı
+        gösterildiğinde üretir.
+
         Parameters:
         -----------
+        cipher : PeriodicCipher
+            Adımları üretecek şifreleyici
         input_text : str
             Şifreli giriş metni
-        coordinates : list
-            Her adım için koordinatlar
-        shifted_letters : list
-            Her adım için ötelenmiş harfler
-        original_letters : list
-            Her adım için orijinal harfler
-        results : list
-            Her adım için deşifreleme sonuçları
         """
-        self.steps = []
+        self.steps = DecryptionSteps(cipher, input_text)
         self.current_step = 0
 
-        # Başlangıç adımı
-        self.steps.append({
-            'type': 'start_decrypt',
-            'text': input_text,
-            'message': f"Deşifrelenecek metin: {input_text}"
-        })
-
-        # Her bir koordinat/karakter için deşifreleme adımları
-        i = 0
-        while i < len(input_text):
-            if i + 3 < len(input_text) and input_text[i:i + 4].isdigit():
-                coord = input_text[i:i + 4]
-
-                # Koordinat-Harf dönüşümü adımı
-                self.steps.append({
-                    'type': 'coordinate_to_letter',
-                    'coordinate': coord,
-                    'position': i,
-                    'shifted': shifted_letters[len(coordinates)],
-                    'message': f"'{coord}' koordinatı '{shifted_letters[len(coordinates)]}' harfine karşılık geliyor"
-                })
-
-                # Orijinal harfi bulma adımı
-                self.steps.append({
-                    'type': 'find_original',
-                    'shifted': shifted_letters[len(coordinates)],
-                    'position': i,
-                    'original': original_letters[len(coordinates)],
-                    'message': f"'{shifted_letters[len(coordinates)]}' harfinden geriye ötelemeyle '{original_letters[len(coordinates)]}' harfi bulundu"
-                })
-
-                coordinates.append(coord)
-                i += 4
-            else:
-                # Şifrelenmeyen karakteri geçme adımı
-                self.steps.append({
-                    'type': 'skip_decrypt',
-                    'char': input_text[i],
-                    'position': i,
-                    'message': f"'{input_text[i]}' karakteri koordinat olmadığından aynen bırakıldı"
-                })
-                i += 1
-
-        # Son adım - deşifrelenmiş metin
-        final_result = ''.join(results)
-        self.steps.append({
-            'type': 'finish_decrypt',
-            'result': final_result,
-            'message': f"Deşifreleme tamamlandı. Sonuç: {final_result}"
-        })
-
         # İlk adımı göster
         if self.steps:
             self.show_step(0)
@@ -311,18 +571,16 @@ class EncryptionAnimator:
         if not self.steps or step_index < 0 or step_index >= len(self.steps):
             return
 
-        # Canvas'ı temizle
-        self.canvas.delete("all")
-
         # Adım bilgisini güncelle
         self.current_step = step_index
         self.step_info.config(text=f"Adım: {step_index + 1}/{len(self.steps)}")
 
-        # İlgili adımı göster
+        # İlgili adımı göster; aynı tipteki adımlar sahne öğelerini yeniden kullanır
         step = self.steps[step_index]
+        self.scene.begin(step['type'])
 
         # Adım mesajını göster
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 30,
             text=step['message'],
             font=("Arial", 12),
@@ -357,6 +615,7 @@ class EncryptionAnimator:
             self._draw_skip_decrypt_step(step)
         elif step['type'] == 'finish_decrypt':
             self._draw_finish_decrypt_step(step)
+        self.scene.end()
 
         # İlerleme çubuğunu güncelle
         self.update_progress()
@@ -366,13 +625,13 @@ class EncryptionAnimator:
         Başlangıç adımını çizer
         """
         # Metin kutusu
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(
             150, 100, 650, 200,
             fill="white", outline="#999999"
         )
 
         # Metin
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 150,
             text=step['text'],
             font=("Arial", 18, "bold"),
@@ -380,7 +639,7 @@ class EncryptionAnimator:
         )
 
         # Başlık
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 80,
             text="Şifrelenecek Metin",
             font=("Arial", 14),
@@ -388,7 +647,7 @@ class EncryptionAnimator:
         )
 
         # Bilgi metni
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 250,
             text="Şifreleme işlemi başlıyor. İleri düğmesine basarak adımları izleyebilirsiniz.",
             font=("Arial", 12),
@@ -400,7 +659,7 @@ class EncryptionAnimator:
         Atlama adımını çizer
         """
         # Karakteri göster
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 150,
             text=step['char'],
             font=("Arial", 72, "bold"),
@@ -408,7 +667,7 @@ class EncryptionAnimator:
         )
 
         # Çarpı işareti
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 150,
             text="✕",
             font=("Arial", 100),
@@ -416,7 +675,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 250,
             text=f"Bu karakter Türkçe alfabede yer almadığı için şifrelenmeden geçildi.",
             font=("Arial", 12),
@@ -428,7 +687,7 @@ class EncryptionAnimator:
         Harf-Element eşleşmesi adımını çizer
         """
         # Sol tarafta harf
-        self.canvas.create_text(
+        self.scene.create_text(
             250, 150,
             text=step['char'],
             font=("Arial", 72, "bold"),
@@ -436,7 +695,7 @@ class EncryptionAnimator:
         )
 
         # Ok
-        self.canvas.create_line(
+        self.scene.create_line(
             300, 150, 400, 150,
             fill=self.colors['arrow'],
             width=3,
@@ -444,12 +703,12 @@ class EncryptionAnimator:
         )
 
         # Sağ tarafta element
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(
             430, 110, 490, 190,
             fill="#ffffcc", outline="#333333"
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             460, 150,
             text=step['element'],
             font=("Arial", 28, "bold"),
@@ -457,7 +716,7 @@ class EncryptionAnimator:
         )
 
         # Kullanım sayısını göster
-        self.canvas.create_text(
+        self.scene.create_text(
             250, 210,
             text=f"{step['count']}. kullanım",
             font=("Arial", 12),
@@ -465,7 +724,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 250,
             text=f"Bu harf {step['count']}. kez kullanıldığı için {step['count'] % 3 + 1}. katmandaki element seçildi.",
             font=("Arial", 12),
@@ -477,12 +736,12 @@ class EncryptionAnimator:
         Orbital dizilimi adımını çizer
         """
         # Elementi göster
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(
             370, 110, 430, 190,
             fill="#ffffcc", outline="#333333"
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 150,
             text=step['element'],
             font=("Arial", 28, "bold"),
@@ -490,12 +749,12 @@ class EncryptionAnimator:
         )
 
         # Orbital dizilimini göster
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(
             250, 220, 550, 280,
             fill="#eeffee", outline="#333333"
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 250,
             text=step['orbital'],
             font=("Arial", 16, "bold"),
@@ -503,7 +762,7 @@ class EncryptionAnimator:
         )
 
         # Başlık
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 80,
             text="Element Orbital Dizilimi",
             font=("Arial", 14),
@@ -523,7 +782,7 @@ class EncryptionAnimator:
 
         explanation = explanation.rstrip(", ")
 
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 320,
             text=explanation,
             font=("Arial", 12),
@@ -547,7 +806,7 @@ class EncryptionAnimator:
         son_katman = int(self.steps[self.current_step - 2]['count']) % 3 + 1
 
         # Öteleme formülü gösterimi
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 120,
             text=f"Öteleme = (Orbital Sayılarının Toplamı) × (Son Katman Elektron Sayısı)",
             font=("Arial", 12),
@@ -555,7 +814,7 @@ class EncryptionAnimator:
         )
 
         # Formül detayları
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 150,
             text=f"Öteleme = ({' + '.join(map(str, numbers))}) × {son_katman}",
             font=("Arial", 16),
@@ -563,7 +822,7 @@ class EncryptionAnimator:
         )
 
         # Sonuç
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 190,
             text=f"Öteleme = {sum_numbers} × {son_katman} = {step['shift']}",
             font=("Arial", 22, "bold"),
@@ -571,7 +830,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 250,
             text=f"Bu öteleme değeri kullanılarak harf Türkçe alfabede {step['shift']} adım ilerletilecek.",
             font=("Arial", 12),
@@ -588,12 +847,12 @@ class EncryptionAnimator:
         for i, letter in enumerate(alphabet):
             x = start_x + i * box_width
 
-            self.canvas.create_rectangle(
+            self.scene.create_rectangle(
                 x, 300, x + box_width, 330,
                 fill="#f0f0f0", outline="#cccccc"
             )
 
-            self.canvas.create_text(
+            self.scene.create_text(
                 x + box_width / 2, 315,
                 text=letter,
                 font=("Arial", 10)
@@ -631,12 +890,12 @@ class EncryptionAnimator:
             else:
                 fill_color = "#f0f0f0"
 
-            self.canvas.create_rectangle(
+            self.scene.create_rectangle(
                 x, 200, x + box_width, 230,
                 fill=fill_color, outline="#cccccc"
             )
 
-            self.canvas.create_text(
+            self.scene.create_text(
                 x + box_width / 2, 215,
                 text=letter,
                 font=("Arial", 10),
@@ -647,7 +906,7 @@ class EncryptionAnimator:
         arrow_start_x = start_x + start_index * box_width + box_width / 2
         arrow_end_x = start_x + end_index * box_width + box_width / 2
 
-        self.canvas.create_line(
+        self.scene.create_line(
             arrow_start_x, 240, arrow_end_x, 240,
             fill=self.colors['arrow'],
             width=2,
@@ -655,35 +914,35 @@ class EncryptionAnimator:
         )
 
         # Başlangıç ve hedef harfleri
-        self.canvas.create_text(
+        self.scene.create_text(
             250, 150,
             text=step['char'],
             font=("Arial", 72, "bold"),
             fill=self.colors['letter']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             350, 150,
             text="+",
             font=("Arial", 36),
             fill=self.colors['text']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 150,
             text=str(self.steps[self.current_step - 1]['shift']),
             font=("Arial", 36, "bold"),
             fill=self.colors['shift']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             450, 150,
             text="→",
             font=("Arial", 36),
             fill=self.colors['arrow']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             550, 150,
             text=step['shifted'],
             font=("Arial", 72, "bold"),
@@ -691,7 +950,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 300,
             text=f"'{step['char']}' harfi {self.steps[self.current_step - 1]['shift']} birim ötelenerek '{step['shifted']}' harfine dönüştürüldü.",
             font=("Arial", 12),
@@ -707,17 +966,20 @@ class EncryptionAnimator:
         table_start_y = 240
         cell_size = 30
 
+        target_row = int(step['result'][0:2])
+        target_col = int(step['result'][2:4])
+
         # Tablo arka planı
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(
             table_start_x, table_start_y,
-            table_start_x + 9 * cell_size, table_start_y + a5 * cell_size,
+            table_start_x + 9 * cell_size, table_start_y + 5 * cell_size,
             fill="#f8f8f8", outline="#666666"
         )
 
         # Tablo ızgarası
         for i in range(9):
             # Dikey çizgiler
-            self.canvas.create_line(
+            self.scene.create_line(
                 table_start_x + i * cell_size, table_start_y,
                 table_start_x + i * cell_size, table_start_y + 5 * cell_size,
                 fill="#cccccc"
@@ -725,70 +987,49 @@ class EncryptionAnimator:
 
         for i in range(6):
             # Yatay çizgiler
-            self.canvas.create_line(
+            self.scene.create_line(
                 table_start_x, table_start_y + i * cell_size,
                                table_start_x + 9 * cell_size, table_start_y + i * cell_size,
                 fill="#cccccc"
             )
 
-        # Hedef hücreyi işaretle (burada basit bir örnek)
-        target_row = int(step['result'][0:2])
-        target_col = int(step['result'][2:4])
-
-        if 1 <= target_row <= 5 and 1 <= target_col <= 9:
-            cell_x = table_start_x + (target_col - 1) * cell_size
-            cell_y = table_start_y + (target_row - 1) * cell_size
-
-            self.canvas.create_rectangle(
-                cell_x, cell_y,
-                cell_x + cell_size, cell_y + cell_size,
-                fill=self.colors['result'], outline="#333333"
-            )
-
-            self.canvas.create_text(
-                cell_x + cell_size / 2, cell_y + cell_size / 2,
-                text=step['char'],
-                font=("Arial", 12, "bold"),
-                fill="white"
-            )
-
         # Harf ve koordinat bağlantısı
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 120,
             text=f"'{step['char']}' harfi periyodik tablo koordinatına dönüştürülüyor",
             font=("Arial", 14),
             fill=self.colors['text']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             250, 170,
             text=step['char'],
             font=("Arial", 48, "bold"),
             fill=self.colors['letter']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             350, 170,
             text="→",
             font=("Arial", 36),
             fill=self.colors['arrow']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             450, 170,
             text=f"({target_row},{target_col})",
             font=("Arial", 24, "bold"),
             fill=self.colors['text']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             550, 170,
             text="→",
             font=("Arial", 36),
             fill=self.colors['arrow']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             600, 170,
             text=step['result'],
             font=("Arial", 36, "bold"),
@@ -796,7 +1037,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 400,
             text=f"Ötelenmiş harf '{step['char']}' için periyodik tablodaki konumu ({target_row},{target_col}) alınarak '{step['result']}' koordinatı elde edildi.",
             font=("Arial", 12),
@@ -804,18 +1045,36 @@ class EncryptionAnimator:
             width=600
         )
 
+        # Hedef hücreyi işaretle (isteğe bağlı öğeler sahne sırası kaymasın diye en sonda çizilir)
+        if 1 <= target_row <= 5 and 1 <= target_col <= 9:
+            cell_x = table_start_x + (target_col - 1) * cell_size
+            cell_y = table_start_y + (target_row - 1) * cell_size
+
+            self.scene.create_rectangle(
+                cell_x, cell_y,
+                cell_x + cell_size, cell_y + cell_size,
+                fill=self.colors['result'], outline="#333333"
+            )
+
+            self.scene.create_text(
+                cell_x + cell_size / 2, cell_y + cell_size / 2,
+                text=step['char'],
+                font=("Arial", 12, "bold"),
+                fill="white"
+            )
+
     def _draw_finish_step(self, step):
         """
         Bitiş adımını çizer
         """
         # Sonuç kutusu
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(
             150, 150, 650, 250,
             fill="#eeffee", outline="#009900", width=2
         )
 
         # Sonuç metni
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 200,
             text=step['result'],
             font=("Arial", 18, "bold"),
@@ -823,7 +1082,7 @@ class EncryptionAnimator:
         )
 
         # Başlık
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 120,
             text="Şifreleme İşlemi Tamamlandı",
             font=("Arial", 16, "bold"),
@@ -831,7 +1090,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 300,
             text="Metin başarıyla şifrelendi. Sonucu kopyalayabilir veya başa dönerek adımları tekrar izleyebilirsiniz.",
             font=("Arial", 12),
@@ -844,7 +1103,7 @@ class EncryptionAnimator:
             x = 150 + i * 25
             y = 350 + (i % 3) * 20
 
-            self.canvas.create_text(
+            self.scene.create_text(
                 x, y,
                 text="✓",
                 font=("Arial", 18),
@@ -856,13 +1115,13 @@ class EncryptionAnimator:
         Deşifreleme başlangıç adımını çizer
         """
         # Metin kutusu
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(
             150, 100, 650, 200,
             fill="white", outline="#999999"
         )
 
         # Metin
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 150,
             text=step['text'],
             font=("Arial", 18, "bold"),
@@ -870,7 +1129,7 @@ class EncryptionAnimator:
         )
 
         # Başlık
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 80,
             text="Deşifrelenecek Metin",
             font=("Arial", 14),
@@ -878,7 +1137,7 @@ class EncryptionAnimator:
         )
 
         # Bilgi metni
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 250,
             text="Deşifreleme işlemi başlıyor. İleri düğmesine basarak adımları izleyebilirsiniz.",
             font=("Arial", 12),
@@ -890,7 +1149,7 @@ class EncryptionAnimator:
         Koordinat-Harf dönüşüm adımını çizer
         """
         # Koordinat gösterimi
-        self.canvas.create_text(
+        self.scene.create_text(
             250, 150,
             text=step['coordinate'],
             font=("Arial", 36, "bold"),
@@ -898,7 +1157,7 @@ class EncryptionAnimator:
         )
 
         # Ok
-        self.canvas.create_text(
+        self.scene.create_text(
             350, 150,
             text="→",
             font=("Arial", 36),
@@ -911,28 +1170,14 @@ class EncryptionAnimator:
         cell_size = 30
 
         # Tablo arka planı
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(
             table_start_x, table_start_y,
             table_start_x + 9 * cell_size, table_start_y + 5 * cell_size,
             fill="#f8f8f8", outline="#666666"
         )
 
-        # Koordinattaki hücreyi işaretle
-        target_row = int(step['coordinate'][0:2])
-        target_col = int(step['coordinate'][2:4])
-
-        if 1 <= target_row <= 5 and 1 <= target_col <= 9:
-            cell_x = table_start_x + (target_col - 1) * cell_size
-            cell_y = table_start_y + (target_row - 1) * cell_size
-
-            self.canvas.create_rectangle(
-                cell_x, cell_y,
-                cell_x + cell_size, cell_y + cell_size,
-                fill=self.colors['result'], outline="#333333"
-            )
-
         # Sonuç harfi
-        self.canvas.create_text(
+        self.scene.create_text(
             450, 150,
             text=step['shifted'],
             font=("Arial", 48, "bold"),
@@ -940,7 +1185,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 400,
             text=f"Koordinat '{step['coordinate']}' periyodik tablodaki konumu kullanılarak '{step['shifted']}' harfine dönüştürüldü.",
             font=("Arial", 12),
@@ -948,6 +1193,20 @@ class EncryptionAnimator:
             width=600
         )
 
+        # Koordinattaki hücreyi işaretle (isteğe bağlı öğe sahne sırası kaymasın diye en sonda çizilir)
+        target_row = int(step['coordinate'][0:2])
+        target_col = int(step['coordinate'][2:4])
+
+        if 1 <= target_row <= 5 and 1 <= target_col <= 9:
+            cell_x = table_start_x + (target_col - 1) * cell_size
+            cell_y = table_start_y + (target_row - 1) * cell_size
+
+            self.scene.create_rectangle(
+                cell_x, cell_y,
+                cell_x + cell_size, cell_y + cell_size,
+                fill=self.colors['result'], outline="#333333"
+            )
+
     def _draw_find_original_step(self, step):
         """
         Orijinal harfi bulma adımını çizer
@@ -980,12 +1239,12 @@ class EncryptionAnimator:
             else:
                 fill_color = "#f0f0f0"
 
-            self.canvas.create_rectangle(
+            self.scene.create_rectangle(
                 x, 200, x + box_width, 230,
                 fill=fill_color, outline="#cccccc"
             )
 
-            self.canvas.create_text(
+            self.scene.create_text(
                 x + box_width / 2, 215,
                 text=letter,
                 font=("Arial", 10),
@@ -996,7 +1255,7 @@ class EncryptionAnimator:
         arrow_start_x = start_x + shifted_index * box_width + box_width / 2
         arrow_end_x = start_x + original_index * box_width + box_width / 2
 
-        self.canvas.create_line(
+        self.scene.create_line(
             arrow_start_x, 240, arrow_end_x, 240,
             fill=self.colors['arrow'],
             width=2,
@@ -1004,21 +1263,21 @@ class EncryptionAnimator:
         )
 
         # Ötelenmiş ve orijinal harfler
-        self.canvas.create_text(
+        self.scene.create_text(
             250, 150,
             text=step['shifted'],
             font=("Arial", 72, "bold"),
             fill=self.colors['letter']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             350, 150,
             text="→",
             font=("Arial", 36),
             fill=self.colors['arrow']
         )
 
-        self.canvas.create_text(
+        self.scene.create_text(
             450, 150,
             text=step['original'],
             font=("Arial", 72, "bold"),
@@ -1026,7 +1285,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 300,
             text=f"Ötelenmiş harf '{step['shifted']}' geriye ötelenerek orijinal harf '{step['original']}' bulundu.",
             font=("Arial", 12),
@@ -1038,7 +1297,7 @@ class EncryptionAnimator:
         Deşifrelemede atlanacak karakter adımını çizer
         """
         # Karakteri göster
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 150,
             text=step['char'],
             font=("Arial", 72, "bold"),
@@ -1046,7 +1305,7 @@ class EncryptionAnimator:
         )
 
         # Ok işareti
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 230,
             text="↓",
             font=("Arial", 48),
@@ -1054,7 +1313,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 300,
             text=f"Bu karakter 4 haneli bir koordinat olmadığı için doğrudan aktarılıyor.",
             font=("Arial", 12),
@@ -1066,13 +1325,13 @@ class EncryptionAnimator:
         Deşifreleme bitiş adımını çizer
         """
         # Sonuç kutusu
-        self.canvas.create_rectangle(
+        self.scene.create_rectangle(
             150, 150, 650, 250,
             fill="#eeffee", outline="#009900", width=2
         )
 
         # Sonuç metni
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 200,
             text=step['result'],
             font=("Arial", 18, "bold"),
@@ -1080,7 +1339,7 @@ class EncryptionAnimator:
         )
 
         # Başlık
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 120,
             text="Deşifreleme İşlemi Tamamlandı",
             font=("Arial", 16, "bold"),
@@ -1088,7 +1347,7 @@ class EncryptionAnimator:
         )
 
         # Açıklama
-        self.canvas.create_text(
+        self.scene.create_text(
             400, 300,
             text="Metin başarıyla deşifrelendi. Sonucu kopyalayabilir veya başa dönerek adımları tekrar izleyebilirsiniz.",
             font=("Arial", 12),
@@ -1135,30 +1394,52 @@ class EncryptionAnimator:
             self.play_button.config(text="⏸ Duraklat")
             self.play_animation()
         else:
-            self.play_button.config(text="▶ Oynat")
+            self._stop_playing()
 
     def play_animation(self):
         """
-        Animasyonu otomatik oynatır
+        Animasyonu ortak kare zamanlayıcısıyla otomatik oynatır
+
+        Pencere simge durumuna küçültüldüğünde oynatma kendiliğinden bekler.
         """
         if not self.is_playing:
             return
 
+        if self._play_job is not None:
+            self._play_job.cancel()
+        self._play_job = FrameScheduler.for_widget(self.canvas).add(
+            self._play_frame, self.canvas, interval_ms=self._play_interval())
+
+    def _play_interval(self):
+        return 1500 / self.animation_speed  # Hıza göre gecikme
+
+    def _play_frame(self, gecen_ms):
+        """
+        Oynatma sırasında bir sonraki adımı gösterir
+        """
+        if not self.is_playing:
+            return False
+
         if self.current_step < len(self.steps) - 1:
             self.next_step()
-            delay = int(1500 / self.animation_speed)  # Hıza göre gecikme
-            self.animation_window.after(delay, self.play_animation)
-        else:
-            # Son adıma gelindiğinde oynatmayı durdur
-            self.is_playing = False
-            self.play_button.config(text="▶ Oynat")
+            return True
+
+        # Son adıma gelindiğinde oynatmayı durdur
+        self._stop_playing()
+        return False
+
+    def _stop_playing(self):
+        self.is_playing = False
+        if self._play_job is not None:
+            self._play_job.cancel()
+            self._play_job = None
+        self.play_button.config(text="▶ Oynat")
 
     def restart_animation(self):
         """
         Animasyonu baştan başlatır
         """
-        self.is_playing = False
-        self.play_button.config(text="▶ Oynat")
+        self._stop_playing()
         self.show_step(0)
 
     def set_speed(self, value):
@@ -1171,11 +1452,16 @@ class EncryptionAnimator:
             Hız faktörü (0.5-3.0)
         """
         self.animation_speed = float(value)
+        if self._play_job is not None:
+            self._play_job.interval_ms = self._play_interval()
 
     def close_animation(self):
         """
         Animasyon penceresini kapatır
         """
         self.is_playing = False
+        if self._play_job is not None:
+            self._play_job.cancel()
+            self._play_job = None
         if self.animation_window:
-            self.animation_window.destroy()
\ No newline at end of file
+            self.animation_window.destroy()
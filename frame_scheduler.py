@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Ortak Kare Zamanlayıcısı
+
+Uygulamadaki tüm animasyonlar (elektron yörüngeleri, parçacıklar, yol ve
+harf dönüşüm animasyonları, adım oynatma, satır vurguları) kendi after()
+zincirlerini kurmak yerine Tk kökü başına tek bir zamanlayıcıya kaydolur.
+Zamanlayıcı tek bir saatle çalışır, her karede sınırlı bir süre harcar,
+geride kalan animasyonların kaçırılan karelerini tek karede birleştirir ve
+penceresi gizlenmiş ya da kapatılmış animasyonları bekletir.
+"""
+
+import time
+import tkinter as tk
+
+
+def _simdi_ms():
+    return time.perf_counter() * 1000
+
+
+class ScheduledAnimation:
+    """
+    Zamanlayıcıya kayıtlı tek bir animasyon
+
+    Geri çağırma callback(gecen_ms) biçimindedir; gecen_ms bir önceki
+    çağrıdan (ilk çağrıda kayıttan) bu yana geçen süredir. Geri çağırma True
+    döndürdüğü sürece animasyon devam eder.
+    """
+
+    def __init__(self, scheduler, callback, widget, interval_ms, delay_ms):
+        self.scheduler = scheduler
+        self.callback = callback
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self.active = True
+        simdi = _simdi_ms()
+        self._son = simdi
+        self._sonraki = simdi + delay_ms
+        self._eklenme = simdi
+        self._goruldu = False
+
+    def cancel(self):
+        """
+        Animasyonu durdurur ve zamanlayıcıdan çıkarır
+        """
+        if self.active:
+            self.active = False
+            self.scheduler._remove(self)
+
+
+class FrameScheduler:
+    """
+    Tüm animasyonları tek bir after() döngüsüyle çalıştıran zamanlayıcı
+
+    Her kare en fazla budget_ms sürer; bütçe dolduğunda sırası gelmeyen
+    animasyonlar bir sonraki karede ilk sırada çalışır. Geride kalan bir
+    animasyon kaçırdığı kareler için tekrar tekrar çağrılmaz, tek çağrıda
+    geçen sürenin tamamını alır. Widget'ı görünür olmayan animasyonlar
+    bekletilir, widget'ı yok edilmiş animasyonlar kaldırılır. Kayıtlı
+    animasyon kalmadığında döngü durur.
+    """
+
+    # Tk kökü başına tek zamanlayıcı
+    _zamanlayicilar = {}
+
+    def __init__(self, root, frame_ms=16, budget_ms=10, hidden_poll_ms=250):
+        """
+        Parameters:
+        -----------
+        root : tk.Tk
+            Döngünün çalışacağı Tk kökü
+        frame_ms : int, optional
+            İki kare arasındaki en kısa süre (milisaniye)
+        budget_ms : int, optional
+            Bir karede animasyonlara ayrılan en uzun süre (milisaniye)
+        hidden_poll_ms : int, optional
+            Bekletilen animasyonların görünürlüğünün yeniden kontrol aralığı
+        """
+        self.root = root
+        self.frame_ms = frame_ms
+        self.budget_ms = budget_ms
+        self.hidden_poll_ms = hidden_poll_ms
+        self._animasyonlar = []
+        self._siradaki = 0
+        self._zamanlayici = None
+        self._zamanlayici_hedef = 0.0
+
+    @classmethod
+    def for_widget(cls, widget):
+        """
+        Widget'ın bağlı olduğu Tk kökünün zamanlayıcısını döndürür
+        """
+        root = widget._root()
+        scheduler = cls._zamanlayicilar.get(id(root))
+        if scheduler is None or scheduler.root is not root:
+            scheduler = cls(root)
+            cls._zamanlayicilar[id(root)] = scheduler
+        return scheduler
+
+    def add(self, callback, widget, interval_ms=None, delay_ms=0):
+        """
+        Yeni bir animasyon kaydeder
+
+        Parameters:
+        -----------
+        callback : callable
+            callback(gecen_ms) biçiminde kare fonksiyonu; True döndürdükçe sürer
+        widget : tk.Widget
+            Animasyonun çizildiği widget; görünmezken animasyon bekletilir
+        interval_ms : float, optional
+            Animasyonun kareleri arasındaki süre (varsayılan: zamanlayıcı karesi)
+        delay_ms : float, optional
+            İlk kareden önceki bekleme
+
+        Returns:
+        --------
+        ScheduledAnimation
+            Animasyonu durdurmak için kullanılabilecek kayıt
+        """
+        if interval_ms is None:
+            interval_ms = self.frame_ms
+        animation = ScheduledAnimation(self, callback, widget, interval_ms, delay_ms)
+        self._animasyonlar.append(animation)
+        self._schedule(delay_ms)
+        return animation
+
+    def _remove(self, animation):
+        try:
+            index = self._animasyonlar.index(animation)
+        except ValueError:
+            return
+        del self._animasyonlar[index]
+        if index < self._siradaki:
+            self._siradaki -= 1
+        if not self._animasyonlar and self._zamanlayici is not None:
+            try:
+                self.root.after_cancel(self._zamanlayici)
+            except tk.TclError:
+                pass
+            self._zamanlayici = None
+
+    def _schedule(self, bekleme_ms):
+        """
+        Bir sonraki kareyi zamanlar (daha erken bir kare zaten zamanlanmadıysa)
+        """
+        hedef = _simdi_ms() + bekleme_ms
+        if self._zamanlayici is not None:
+            if self._zamanlayici_hedef <= hedef:
+                return
+            self.root.after_cancel(self._zamanlayici)
+        self._zamanlayici_hedef = hedef
+        self._zamanlayici = self.root.after(max(1, int(bekleme_ms)), self._tick)
+
+    def _tick(self):
+        """
+        Zamanı gelen animasyonları kare bütçesi içinde çalıştırır
+        """
+        self._zamanlayici = None
+        baslangic = _simdi_ms()
+        bitis = baslangic + self.budget_ms
+        animasyonlar = list(self._animasyonlar)
+        n = len(animasyonlar)
+        ilk = self._siradaki % n if n else 0
+        self._siradaki = 0
+        calisan = 0
+
+        for k in range(n):
+            animation = animasyonlar[(ilk + k) % n]
+            if not animation.active:
+                continue
+            simdi = _simdi_ms()
+            if simdi < animation._sonraki:
+                continue
+            if calisan and simdi >= bitis:
+                # Bütçe doldu; kalanlar sonraki karede ilk sırada çalışır
+                self._siradaki = self._animasyonlar.index(animation)
+                break
+            self._run(animation, simdi)
+            calisan += 1
+
+        if self._animasyonlar:
+            simdi = _simdi_ms()
+            en_yakin = min(animation._sonraki for animation in self._animasyonlar)
+            self._schedule(max(self.frame_ms - (simdi - baslangic), en_yakin - simdi, 1))
+
+    def _run(self, animation, simdi):
+        try:
+            if not animation.widget.winfo_exists():
+                animation.cancel()
+                return
+            if not animation.widget.winfo_viewable():
+                # Gizli pencerelerin animasyonu bekletilir; geçen süre sayılmaz.
+                # Yeni oluşturulan widget'lar Tk onları yerleştirene kadar kısa
+                # bir süre görünmez olduğundan, ilk gösterimden önce her karede
+                # yeniden bakılır.
+                animation._son = simdi
+                if animation._goruldu or simdi - animation._eklenme >= self.hidden_poll_ms:
+                    animation._sonraki = simdi + self.hidden_poll_ms
+                else:
+                    animation._sonraki = simdi + self.frame_ms
+                return
+            animation._goruldu = True
+
+            gecen = simdi - animation._son
+            animation._son = simdi
+            animation._sonraki += animation.interval_ms
+            if animation._sonraki <= simdi:
+                # Geride kalındı; kaçırılan kareler bu karede birleştirildi
+                animation._sonraki = simdi + animation.interval_ms
+
+            if not animation.callback(gecen):
+                animation.cancel()
+        except tk.TclError:
+            # Widget çizim sırasında kapatıldıysa animasyon sessizce biter
+            animation.cancel()
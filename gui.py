@@ -14,8 +14,14 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.append(current_dir)
 
-from data import TURKCE_ALFABE, KATMAN1_ELEMENTLER, KATMAN2_ELEMENTLER, KATMAN3_ELEMENTLER
-from cipher import PeriodicCipher
+from data import TURKCE_ALFABE
+from element_registry import REGISTRY
+from cipher import PeriodicCipher, MatchTable
+from language_model import LanguageScorer
+from log_sink import BufferedLogSink
+from log_view import VirtualLogView
+from virtual_table import VirtualTable
+from background import BackgroundJob
 
 # Animasyon modüllerini import etmeyi dene
 try:
@@ -30,13 +36,45 @@ except ImportError as e:
     ANIMATIONS_AVAILABLE = False
 
 
+class _SearchBudgetExceeded(Exception):
+    """
+    Olası deşifre sonuçlarının bir sayfası için arama sınırı aşıldığında yükseltilir
+    """
+
+
 class PeriodicCipherGUI:
     """
     Periyodik tablo şifreleme uygulaması arayüzü
     """
 
+    # Olası deşifre sonuçları penceresinde bir seferde gösterilen sonuç sayısı
+    ALTERNATIF_SAYFA_BOYUTU = 50
+
+    # Olası deşifre sonuçlarının bir sayfası için aramada ziyaret edilen en
+    # fazla düğüm (yaklaşık birkaç saniyelik iş); aşılırsa arama durur
+    ALTERNATIF_ARAMA_BUTCESI = 50000
+
+    # Dil modeline göre sıralanıp en başta gösterilen sonuç sayısı
+    EN_OLASI_SONUC_SAYISI = 10
+
+    # Arka plan işlerinde metnin işlendiği parça boyutu (ilerleme ve iptal aralığı)
+    IS_PARCA_BOYUTU = 4096
+
+    # Bu uzunluğu aşan metinler adım logu üretilmeden hızlı yolla işlenir; harf
+    # başına yaklaşık altı log satırı oluştuğundan log görünümünün tutabildiği
+    # satırların (200.000) ötesi zaten atılırdı
+    ADIM_LOGU_SINIRI = 30000
+
     def __init__(self):
         self.cipher = PeriodicCipher()
+
+        # Dil modeli yerel kelime listesinden yüklenir; liste yoksa devre dışıdır
+        try:
+            self.language_scorer = LanguageScorer.from_file()
+        except OSError as e:
+            print(f"Dil modeli yüklenemedi: {e}")
+            self.language_scorer = None
+
         self.root = tk.Tk()  # Root'u önce oluştur
 
         # Animasyon ve görselleştirme sınıflarını başlat
@@ -97,36 +135,37 @@ class PeriodicCipherGUI:
                                font=("Arial", 10, "italic"))
         hint_label.pack(pady=5)
 
-        try:
-            # Element bilgilerini import etmeye çalış
-            from element_info import ELEMENT_INFO
-            self.element_info = ELEMENT_INFO
-        except ImportError as e:
-            print(f"Element bilgileri yüklenemedi: {e}")
-            # Dosya bulunamazsa boş sözlük kullan
-            self.element_info = {}
-
-        for katman_num, katman_dict in [("Katman 1", KATMAN1_ELEMENTLER),
-                                        ("Katman 2", KATMAN2_ELEMENTLER),
-                                        ("Katman 3", KATMAN3_ELEMENTLER)]:
-            frame = ttk.LabelFrame(self.periodic_table_frame, text=katman_num)
+        # Sembol → düğme kaydı; tıklamalarda widget'lar taranmadan doğrudan
+        # bulunur. Katman, harf ve ayrıntılar element kayıt defterindedir.
+        self.element_buttons = {}
+
+        for katman in range(1, REGISTRY.layer_count() + 1):
+            frame = ttk.LabelFrame(self.periodic_table_frame, text=f"Katman {katman}")
             frame.pack(padx=10, pady=5, fill="x")
-            for letter, info in katman_dict.items():
-                r, c = info.get('konum', (0, 0))
-                element_symbol = info['element']
+            for kayit in REGISTRY.layer(katman):
+                r, c = kayit.konum or (0, 0)
+                element_symbol = kayit.sembol
                 btn = ttk.Button(frame, text=element_symbol, width=4)
+                self.element_buttons[element_symbol] = btn
 
                 # Element bilgisi varsa tıklama fonksiyonu ekle
-                if ANIMATIONS_AVAILABLE and hasattr(self, 'element_info') and element_symbol in self.element_info:
-                    btn.config(command=lambda sym=element_symbol: self.show_element_visualization(sym))
+                if ANIMATIONS_AVAILABLE and kayit.has_details:
+                    btn.config(command=lambda sym=element_symbol, b=btn: self.show_element_visualization(sym, b))
                 else:
                     btn.config(command=lambda sym=element_symbol: self.show_basic_element_info(sym))
 
                 btn.grid(row=r, column=c, padx=2, pady=2)
 
-    def show_element_visualization(self, element_symbol):
+    def show_element_visualization(self, element_symbol, button=None):
         """
         Element için animasyonlu gösterim penceresini açar
+
+        Parameters:
+        -----------
+        element_symbol : str
+            Gösterilecek elementin sembolü
+        button : ttk.Button, optional
+            Tıklanan düğme (verilmezse sembol kaydından bulunur)
         """
         if not ANIMATIONS_AVAILABLE:
             self.show_basic_element_info(element_symbol)
@@ -136,28 +175,27 @@ class PeriodicCipherGUI:
         if self.element_visualizer is None:
             self.element_visualizer = ElementVisualizer(self.root)
 
-        if element_symbol in self.element_info:
+        kayit = REGISTRY.by_symbol(element_symbol)
+        if kayit is not None and kayit.has_details:
             # Düğmeyi vurgula
-            for frame in self.periodic_table_frame.winfo_children():
-                if isinstance(frame, ttk.LabelFrame):
-                    for button in frame.winfo_children():
-                        if isinstance(button, ttk.Button) and button['text'] == element_symbol:
-                            try:
-                                # Animasyon sınıfını kullanarak parçacık efekti oluştur
-                                button_x = button.winfo_rootx() - self.root.winfo_rootx() + button.winfo_width() // 2
-                                button_y = button.winfo_rooty() - self.root.winfo_rooty() + button.winfo_height() // 2
-                                self.animations.create_particle_effect(
-                                    self.periodic_table_frame,
-                                    button_x, button_y,
-                                    colors=['#3399ff', '#66ccff', '#99ddff']
-                                )
-                            except Exception as e:
-                                print(f"Parçacık efekti oluşturulamadı: {e}")
-                            break
+            if button is None:
+                button = self.element_buttons.get(element_symbol)
+            if button is not None:
+                try:
+                    # Animasyon sınıfını kullanarak parçacık efekti oluştur
+                    button_x = button.winfo_rootx() - self.root.winfo_rootx() + button.winfo_width() // 2
+                    button_y = button.winfo_rooty() - self.root.winfo_rooty() + button.winfo_height() // 2
+                    self.animations.create_particle_effect(
+                        self.periodic_table_frame,
+                        button_x, button_y,
+                        colors=['#3399ff', '#66ccff', '#99ddff']
+                    )
+                except Exception as e:
+                    print(f"Parçacık efekti oluşturulamadı: {e}")
 
             try:
                 # ElementVisualizer ile detaylı bilgiyi göster
-                self.element_visualizer.show_element_details(self.element_info[element_symbol])
+                self.element_visualizer.show_element_details(kayit)
             except Exception as e:
                 print(f"Element detayları gösterilemedi: {e}")
                 self.show_basic_element_info(element_symbol)
@@ -168,29 +206,15 @@ class PeriodicCipherGUI:
         """
         ELEMENT_INFO'da olmayan elementler için temel bilgi gösterir
         """
-        # Tüm katmanlarda elementi ara
-        element_info = None
-        harf = None
-        katman = None
-
-        for katman_num, layer_dict in [(1, KATMAN1_ELEMENTLER),
-                                       (2, KATMAN2_ELEMENTLER),
-                                       (3, KATMAN3_ELEMENTLER)]:
-            for letter, info in layer_dict.items():
-                if info['element'] == element_symbol:
-                    element_info = info
-                    harf = letter
-                    katman = katman_num
-                    break
-            if element_info:
-                break
-
-        if element_info:
+        # Elementi kayıt defterinden bul
+        kayit = REGISTRY.by_symbol(element_symbol)
+
+        if kayit is not None and kayit.katman is not None:
             info_text = f"Element: {element_symbol}\n"
-            info_text += f"Türkçe Alfabe Karşılığı: {harf} (Katman {katman})\n"
-            info_text += f"Orbital Dizilimi: {element_info['orbital']}\n"
-            info_text += f"Son Katman Elektron Sayısı: {element_info['son_katman']}\n"
-            info_text += f"Periyodik Tablo Konumu: Satır {element_info['konum'][0]}, Sütun {element_info['konum'][1]}"
+            info_text += f"Türkçe Alfabe Karşılığı: {kayit.harf} (Katman {kayit.katman})\n"
+            info_text += f"Orbital Dizilimi: {kayit.orbital}\n"
+            info_text += f"Son Katman Elektron Sayısı: {kayit.son_katman}\n"
+            info_text += f"Periyodik Tablo Konumu: Satır {kayit.konum[0]}, Sütun {kayit.konum[1]}"
 
             messagebox.showinfo(f"{element_symbol} Hakkında", info_text)
         else:
@@ -236,9 +260,9 @@ class PeriodicCipherGUI:
         self.matches_reference_frame.grid_columnconfigure(0, weight=1)
 
         for harf in TURKCE_ALFABE:
-            element1 = KATMAN1_ELEMENTLER.get(harf, {})
-            element2 = KATMAN2_ELEMENTLER.get(harf, {})
-            element3 = KATMAN3_ELEMENTLER.get(harf, {})
+            element1 = REGISTRY.by_letter(harf, 1) or {}
+            element2 = REGISTRY.by_letter(harf, 2) or {}
+            element3 = REGISTRY.by_letter(harf, 3) or {}
 
             tree.insert("", "end", values=(
                 harf,
@@ -275,6 +299,10 @@ class PeriodicCipherGUI:
         self.clear_button = ttk.Button(self.button_frame, text="Temizle", command=self.clear_text)
         self.clear_button.pack(side=tk.LEFT, padx=5)
 
+        self.cancel_button = ttk.Button(self.button_frame, text="İptal", command=self.cancel_encryption,
+                                        state="disabled")
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+
         # Animasyon gösterme düğmesi (eğer animasyonlar mevcutsa)
         if ANIMATIONS_AVAILABLE:
             self.animation_button = ttk.Button(self.button_frame, text="Animasyonu Göster",
@@ -283,6 +311,9 @@ class PeriodicCipherGUI:
             # Başlangıçta devre dışı bırak (şifreleme yapılmadığı için)
             self.animation_button.config(state="disabled")
 
+        self.progress_bar = ttk.Progressbar(self.encryption_frame, mode="determinate", maximum=1.0)
+        self.progress_bar.pack(padx=10, fill="x")
+
         self.result_frame = ttk.LabelFrame(self.encryption_frame, text="Sonuç")
         self.result_frame.pack(padx=10, pady=5, fill="x")
 
@@ -295,26 +326,21 @@ class PeriodicCipherGUI:
         self.log_frame = ttk.LabelFrame(self.encryption_frame, text="Şifreleme Adımları")
         self.log_frame.pack(padx=10, pady=5, fill="both", expand=True)
 
-        self.log_text = tk.Text(self.log_frame, height=10)
+        self.log_text = VirtualLogView(self.log_frame, height=10)
+        self.log_sink = BufferedLogSink(self.log_text)
         self.log_text.pack(padx=5, pady=5, fill="both", expand=True)
 
         self.matches_frame = ttk.LabelFrame(self.encryption_frame, text="Harf-Element Eşleşmeleri")
         self.matches_frame.pack(padx=10, pady=5, fill="x")
 
-        self.matches_table = ttk.Treeview(self.matches_frame,
-                                          columns=("harf", "element", "orbital", "son_katman", "oteleme"),
-                                          show="headings",
-                                          height=5)
-        self.matches_table.heading("harf", text="Harf")
-        self.matches_table.heading("element", text="Element")
-        self.matches_table.heading("orbital", text="Orbital")
-        self.matches_table.heading("son_katman", text="Son Katman")
-        self.matches_table.heading("oteleme", text="Öteleme")
-        self.matches_table.column("harf", width=50)
-        self.matches_table.column("element", width=100)
-        self.matches_table.column("orbital", width=100)
-        self.matches_table.column("son_katman", width=100)
-        self.matches_table.column("oteleme", width=100)
+        self.matches_table = VirtualTable(
+            self.matches_frame,
+            columns=("harf", "element", "orbital", "son_katman", "oteleme"),
+            headings={"harf": "Harf", "element": "Element", "orbital": "Orbital",
+                      "son_katman": "Son Katman", "oteleme": "Öteleme"},
+            widths={"harf": 50, "element": 100, "orbital": 100, "son_katman": 100, "oteleme": 100},
+            height=5
+        )
         self.matches_table.pack(padx=5, pady=5, fill="x")
 
     def setup_decryption_interface(self):
@@ -337,6 +363,18 @@ class PeriodicCipherGUI:
                                                command=self.clear_decrypt_text)
         self.decrypt_clear_button.pack(side=tk.LEFT, padx=5)
 
+        self.decrypt_cancel_button = ttk.Button(self.decrypt_button_frame, text="İptal",
+                                                command=self.cancel_decryption, state="disabled")
+        self.decrypt_cancel_button.pack(side=tk.LEFT, padx=5)
+
+        # Birden fazla adaylı koordinatlarda dil modeliyle seçim
+        self.use_language_model = tk.BooleanVar(value=self.language_scorer is not None)
+        self.language_model_check = ttk.Checkbutton(self.decrypt_button_frame, text="Dil Modeliyle Seç",
+                                                    variable=self.use_language_model)
+        self.language_model_check.pack(side=tk.LEFT, padx=5)
+        if self.language_scorer is None:
+            self.language_model_check.config(state="disabled")
+
         # Animasyon gösterme düğmesi (eğer animasyonlar mevcutsa)
         if ANIMATIONS_AVAILABLE:
             self.decrypt_animation_button = ttk.Button(self.decrypt_button_frame, text="Animasyonu Göster",
@@ -345,6 +383,9 @@ class PeriodicCipherGUI:
             # Başlangıçta devre dışı bırak (deşifreleme yapılmadığı için)
             self.decrypt_animation_button.config(state="disabled")
 
+        self.decrypt_progress_bar = ttk.Progressbar(self.decryption_frame, mode="determinate", maximum=1.0)
+        self.decrypt_progress_bar.pack(padx=10, fill="x")
+
         self.decrypt_result_frame = ttk.LabelFrame(self.decryption_frame, text="Sonuç")
         self.decrypt_result_frame.pack(padx=10, pady=5, fill="x")
 
@@ -358,7 +399,8 @@ class PeriodicCipherGUI:
         self.decrypt_log_frame = ttk.LabelFrame(self.decryption_frame, text="Deşifreleme Adımları")
         self.decrypt_log_frame.pack(padx=10, pady=5, fill="both", expand=True)
 
-        self.decrypt_log_text = tk.Text(self.decrypt_log_frame, height=10)
+        self.decrypt_log_text = VirtualLogView(self.decrypt_log_frame, height=10)
+        self.decrypt_log_sink = BufferedLogSink(self.decrypt_log_text)
         self.decrypt_log_text.pack(padx=5, pady=5, fill="both", expand=True)
 
         # Alternatif çözümlerin gösterileceği bölüm - geliştirilmiş:
@@ -366,20 +408,14 @@ class PeriodicCipherGUI:
         self.alternatives_frame.pack(padx=10, pady=5, fill="both", expand=True)
 
         # Alternatifler tablosu - fotodaki tasarıma göre düzenlendi
-        self.alternatives_table = ttk.Treeview(
+        self.alternatives_table = VirtualTable(
             self.alternatives_frame,
             columns=("koordinat", "aday_harfler", "katmanlar", "secilen_harf"),
-            show="headings",
+            headings={"koordinat": "Koordinat", "aday_harfler": "Aday Harfler",
+                      "katmanlar": "Katmanlar", "secilen_harf": "Seçilen Harf"},
+            widths={"koordinat": 80, "aday_harfler": 250, "katmanlar": 100, "secilen_harf": 100},
             height=5
         )
-        self.alternatives_table.heading("koordinat", text="Koordinat")
-        self.alternatives_table.heading("aday_harfler", text="Aday Harfler")
-        self.alternatives_table.heading("katmanlar", text="Katmanlar")
-        self.alternatives_table.heading("secilen_harf", text="Seçilen Harf")
-        self.alternatives_table.column("koordinat", width=80)
-        self.alternatives_table.column("aday_harfler", width=250)
-        self.alternatives_table.column("katmanlar", width=100)
-        self.alternatives_table.column("secilen_harf", width=100)
         self.alternatives_table.pack(padx=5, pady=5, fill="both", expand=True)
 
         # Alternatif seçme düğmeleri
@@ -404,9 +440,9 @@ class PeriodicCipherGUI:
         Şifreleme işlemini başlatır ve animasyon oluşturur
         """
         self.result_text.delete("1.0", "end")
+        self.log_sink.discard()
         self.log_text.delete("1.0", "end")
-        for item in self.matches_table.get_children():
-            self.matches_table.delete(item)
+        self.matches_table.clear()
 
         input_text = self.input_text.get("1.0", "end-1c")
 
@@ -427,8 +463,52 @@ class PeriodicCipherGUI:
         else:
             self.add_to_log("Şifreleme işlemi başlatılıyor...\n" + "=" * 50 + "\n")
 
-        # Şifreleme işlemini gerçekleştir
-        result, log_messages, matches = self.cipher.encrypt(input_text, self.add_to_log)
+        # Şifreleme işlemini arka planda gerçekleştir
+        self._set_encryption_running(True)
+        self.encryption_job = BackgroundJob(
+            self.root,
+            lambda log, progress, check_cancelled: self._encrypt_job(input_text, log, progress),
+            on_done=self._on_encryption_done,
+            on_log=self.log_sink.extend,
+            on_progress=lambda oran: self.progress_bar.config(value=oran),
+            on_error=self._on_encryption_error,
+            on_cancelled=self._on_encryption_cancelled
+        )
+        self.encryption_job.start()
+
+    def _encrypt_job(self, text, log, progress):
+        """
+        Şifreleme işi (arka plan iş parçacığında çalışır)
+
+        Metin parçalar halinde şifrelenir; her parçada ilerleme bildirilir ve
+        iptal kontrol edilir. Sonuç encrypt çağrısıyla aynıdır. Eşleşmeler
+        tabloya doğrudan verilecek sıkıştırılmış bir MatchTable'da toplanır.
+        ADIM_LOGU_SINIRI'nı aşan metinlerde adımlar üretilmez, yalnızca özet
+        loglanır.
+        """
+        text = text.upper()
+        matches = MatchTable(self.cipher)
+        if len(text) > self.ADIM_LOGU_SINIRI:
+            log(f"Metin {len(text)} karakter uzunluğunda; adımlar loglanmadan şifreleniyor.")
+            result = "".join(self.cipher.encrypt_stream(self._job_chunks(text, progress), matches=matches))
+            log(f"\nSonuç {len(result)} karakter (sonuç alanında gösteriliyor).")
+            return result, matches
+
+        log(f"Girilen metin: {text}")
+        result = "".join(self.cipher.encrypt_stream(self._job_chunks(text, progress),
+                                                    callback=log, matches=matches))
+        log(f"\nSonuç: {result}")
+        return result, matches
+
+    def _on_encryption_done(self, sonuc):
+        """
+        Şifreleme işi bittiğinde sonucu ve eşleşmeleri gösterir
+        """
+        result, matches = sonuc
+        self.log_sink.flush()
+        self._set_encryption_running(False)
+        if hasattr(self, 'animation_button'):
+            self.animation_button.config(state="normal")
 
         # Sonucu göster (animasyonlu veya normal)
         if ANIMATIONS_AVAILABLE and self.animations is not None:
@@ -440,31 +520,58 @@ class PeriodicCipherGUI:
         else:
             self.result_text.insert("1.0", result)
 
-        # Eşleşmeleri tabloya ekle ve vurgulamalı göster
-        for i, match in enumerate(matches):
-            item_id = self.matches_table.insert("", "end", values=(
-                match['harf'],
-                match['element'],
-                match['orbital'],
-                match['son_katman'],
-                match['oteleme']
-            ))
+        # Eşleşme tablosu kopyalanmadan verilir; ekrandaki satırlar vurgulanır
+        self.matches_table.set_rows(matches)
+        if ANIMATIONS_AVAILABLE:
+            self.matches_table.highlight_visible(delay=500, interval=300)
 
-            # Animasyonlar mevcutsa vurgula
-            if ANIMATIONS_AVAILABLE:
-                try:
-                    self.root.after(i * 300 + 500, lambda id=item_id: self._highlight_table_row(self.matches_table, id))
-                except Exception as e:
-                    print(f"Tablo satırı vurgulanamadı: {e}")
+    def _on_encryption_error(self, error):
+        """
+        Şifreleme işi hata ile bittiğinde kullanıcıyı bilgilendirir
+        """
+        self.log_sink.flush()
+        self._set_encryption_running(False)
+        messagebox.showerror("Hata", f"Şifreleme başarısız oldu: {error}")
+
+    def _on_encryption_cancelled(self):
+        """
+        Şifreleme işi iptal edildiğinde log'a not düşer
+        """
+        self.add_to_log("\nŞifreleme işlemi iptal edildi.")
+        self.log_sink.flush()
+        self._set_encryption_running(False)
+
+    def cancel_encryption(self):
+        """
+        Çalışan şifreleme işini iptal eder
+        """
+        job = getattr(self, 'encryption_job', None)
+        if job is not None and job.running:
+            job.cancel()
+
+    def _set_encryption_running(self, running):
+        """
+        Şifreleme işi çalışırken kontrolleri devre dışı bırakır, bitince açar
+        """
+        state = "disabled" if running else "normal"
+        self.encrypt_button.config(state=state)
+        self.clear_button.config(state=state)
+        self.input_text.config(state=state)
+        if running and hasattr(self, 'animation_button'):
+            # Yalnızca başarıyla biten iş sonrası tekrar açılır
+            self.animation_button.config(state="disabled")
+        self.cancel_button.config(state="normal" if running else "disabled")
+        if running:
+            self.progress_bar.config(value=0)
 
     def decrypt_text(self):
         """
         Deşifreleme işlemini başlatır ve animasyon oluşturur
         """
         self.decrypt_result_text.delete("1.0", "end")
+        self.decrypt_log_sink.discard()
         self.decrypt_log_text.delete("1.0", "end")
-        for item in self.alternatives_table.get_children():
-            self.alternatives_table.delete(item)
+        self.alternatives_table.clear()
 
         input_text = self.decrypt_input_text.get("1.0", "end-1c").strip()
 
@@ -485,11 +592,64 @@ class PeriodicCipherGUI:
         else:
             self.add_to_decrypt_log("Deşifreleme işlemi başlatılıyor...\n" + "=" * 50 + "\n")
 
-        # Deşifreleme işlemini gerçekleştir
-        result, log_messages, alternatives = self.cipher.decrypt(input_text, self.add_to_decrypt_log)
+        # Deşifreleme işlemini arka planda gerçekleştir
+        scorer = self.language_scorer if self.use_language_model.get() else None
+        self._set_decryption_running(True)
+        self.decryption_job = BackgroundJob(
+            self.root,
+            lambda log, progress, check_cancelled: self._decrypt_job(input_text, scorer, log, progress),
+            on_done=lambda sonuc: self._on_decryption_done(input_text, sonuc),
+            on_log=self.decrypt_log_sink.extend,
+            on_progress=lambda oran: self.decrypt_progress_bar.config(value=oran),
+            on_error=self._on_decryption_error,
+            on_cancelled=self._on_decryption_cancelled
+        )
+        self.decryption_job.start()
+
+    def _decrypt_job(self, text, scorer, log, progress):
+        """
+        Deşifreleme işi (arka plan iş parçacığında çalışır)
 
-        # Alternatifler listesini global olarak sakla
+        Dil modeli kullanılmıyorsa metin parçalar halinde çözülür ve her
+        parçada ilerleme bildirilir; dil modeliyle aramada ilerleme ve iptal
+        arama sırasında düzenli aralıklarla kontrol edilir. ADIM_LOGU_SINIRI'nı
+        aşan metinlerde adımlar ve alternatifler üretilmez, yalnızca özet loglanır.
+        """
+        if len(text) > self.ADIM_LOGU_SINIRI:
+            log(f"Şifreli metin {len(text)} karakter uzunluğunda; adımlar loglanmadan çözülüyor.")
+            if scorer is not None:
+                result = self.cipher.decrypt(text, trace=False, scorer=scorer, progress=progress)[0]
+                progress(1.0)
+            else:
+                result = "".join(self.cipher.decrypt_stream(self._job_chunks(text, progress)))
+            log(f"\nSonuç {len(result)} karakter (sonuç alanında gösteriliyor).")
+            return result, []
+
+        if scorer is not None:
+            result, _, alternatives = self.cipher.decrypt(text, log, scorer=scorer, progress=progress)
+            progress(1.0)
+            return result, alternatives
+
+        log(f"Şifreli metin: {text}")
+        alternatives = []
+        result = "".join(self.cipher.decrypt_stream(self._job_chunks(text, progress),
+                                                    callback=log, alternatives=alternatives))
+        log(f"\nSonuç: {result}")
+        return result, alternatives
+
+    def _on_decryption_done(self, input_text, sonuc):
+        """
+        Deşifreleme işi bittiğinde sonucu ve alternatifleri gösterir
+        """
+        result, alternatives = sonuc
+        self.decrypt_log_sink.flush()
+        self._set_decryption_running(False)
+        if hasattr(self, 'decrypt_animation_button'):
+            self.decrypt_animation_button.config(state="normal")
+
+        # Alternatifler listesini ve şifreli metni global olarak sakla
         self.current_alternatives = alternatives
+        self.current_ciphertext = input_text
 
         # Sonucu göster (animasyonlu veya normal)
         if ANIMATIONS_AVAILABLE and self.animations is not None:
@@ -504,14 +664,62 @@ class PeriodicCipherGUI:
         # Alternatifleri tabloya ekle
         self.process_alternatives(alternatives)
 
+    def _on_decryption_error(self, error):
+        """
+        Deşifreleme işi hata ile bittiğinde kullanıcıyı bilgilendirir
+        """
+        self.decrypt_log_sink.flush()
+        self._set_decryption_running(False)
+        messagebox.showerror("Hata", f"Deşifreleme başarısız oldu: {error}")
+
+    def _on_decryption_cancelled(self):
+        """
+        Deşifreleme işi iptal edildiğinde log'a not düşer
+        """
+        self.add_to_decrypt_log("\nDeşifreleme işlemi iptal edildi.")
+        self.decrypt_log_sink.flush()
+        self._set_decryption_running(False)
+
+    def cancel_decryption(self):
+        """
+        Çalışan deşifreleme işini iptal eder
+        """
+        job = getattr(self, 'decryption_job', None)
+        if job is not None and job.running:
+            job.cancel()
+
+    def _set_decryption_running(self, running):
+        """
+        Deşifreleme işi çalışırken kontrolleri devre dışı bırakır, bitince açar
+        """
+        state = "disabled" if running else "normal"
+        self.decrypt_button.config(state=state)
+        self.decrypt_clear_button.config(state=state)
+        self.decrypt_input_text.config(state=state)
+        self.use_alternative_button.config(state=state)
+        self.try_all_alternatives_button.config(state=state)
+        if running and hasattr(self, 'decrypt_animation_button'):
+            # Yalnızca başarıyla biten iş sonrası tekrar açılır
+            self.decrypt_animation_button.config(state="disabled")
+        if self.language_scorer is not None:
+            self.language_model_check.config(state=state)
+        self.decrypt_cancel_button.config(state="normal" if running else "disabled")
+        if running:
+            self.decrypt_progress_bar.config(value=0)
+
+    def _job_chunks(self, text, progress):
+        """
+        Metni arka plan işi için parçalara böler ve her parçada ilerleme bildirir
+        """
+        for i in range(0, len(text), self.IS_PARCA_BOYUTU):
+            progress(i / len(text))
+            yield text[i:i + self.IS_PARCA_BOYUTU]
+        progress(1.0)
+
     def process_alternatives(self, alternatives):
         """
         Alternatif çözümleri işler ve tabloya ekler
         """
-        # Tablo temizle
-        for item in self.alternatives_table.get_children():
-            self.alternatives_table.delete(item)
-
         # Koordinatlara göre gruplandır
         coord_dict = {}
         for alt in alternatives:
@@ -530,28 +738,22 @@ class PeriodicCipherGUI:
                     coord_dict[coord]['katmanlar'].append(str(candidate['katman']))
 
         # Tabloya ekle
-        for coord, data in coord_dict.items():
-            aday_harfler_str = ", ".join(data['aday_harfler'])
-            katmanlar_str = ", ".join(data['katmanlar'])
-
-            self.alternatives_table.insert("", "end", values=(
-                coord,
-                aday_harfler_str,
-                katmanlar_str,
-                data['secilen']
-            ))
+        self.alternatives_table.set_rows(
+            (coord, ", ".join(data['aday_harfler']), ", ".join(data['katmanlar']), data['secilen'])
+            for coord, data in coord_dict.items()
+        )
 
     def use_selected_alternative(self):
         """
         Tabloda seçilen alternatifi kullanır
         """
-        selection = self.alternatives_table.selection()
-        if not selection:
+        selection = self.alternatives_table.selected_index()
+        if selection is None:
             messagebox.showinfo("Uyarı", "Lütfen bir alternatif seçin.")
             return
 
         # Seçilen satırın değerlerini al
-        values = self.alternatives_table.item(selection[0], "values")
+        values = self.alternatives_table.get_row(selection)
         koordinat = values[0]
         aday_harfler = values[1].split(", ")
         secilen_harf = values[3]
@@ -581,7 +783,7 @@ class PeriodicCipherGUI:
         self.decrypt_result_text.insert("1.0", modified_result)
 
         # Tabloda seçilen harfi güncelle
-        self.alternatives_table.item(selection[0], values=(
+        self.alternatives_table.set_row(selection, (
             koordinat,
             values[1],
             values[2],
@@ -676,7 +878,7 @@ class PeriodicCipherGUI:
             selected_text = results_listbox.get(selected_idx[0])
             # Sonuç metnini ayıkla
             if ": " in selected_text:
-                selected_text = selected_text.split(": ")[1]
+                selected_text = selected_text.split(": ", 1)[1]
 
             # Ana sonucu güncelle
             self.decrypt_result_text.delete("1.0", "end")
@@ -686,60 +888,128 @@ class PeriodicCipherGUI:
             self.add_to_decrypt_log(f"\nAlternatif sonuç seçildi: {selected_text}")
 
             # Pencereyi kapat
-            results_window.destroy()
+            close_window()
+
+        # Dil modeli varsa en olası sonuçlar ilk sayfa işinde bulunup başta
+        # gösterilir; kalan sonuçlar sayfa sayfa, ihtiyaç oldukça arka planda
+        # üretilir ve her sayfanın araması ALTERNATIF_ARAMA_BUTCESI düğümle sınırlıdır
+        sayac = [0]
+        gosterilen = set()
+        scorer = self.language_scorer
+        arama = {'ilerleme': None, 'dugum': 0, 'is': None, 'sayfa': 0}
+        sonuclar = self.cipher.iter_decryptions(self.current_ciphertext,
+                                                progress=lambda dugum: arama['ilerleme'](dugum))
+
+        def sayfa_isi(progress):
+            siralanmis = []
+            if scorer is not None and arama['sayfa'] == 0:
+                siralanmis = [result for result, _ in self.cipher.rank_decryptions(
+                    self.current_ciphertext, scorer, count=self.EN_OLASI_SONUC_SAYISI, progress=progress)]
+
+            baslangic = arama['dugum']
+
+            def sayfa_ilerlemesi(dugum):
+                arama['dugum'] = dugum
+                harcanan = dugum - baslangic
+                progress(min(harcanan / self.ALTERNATIF_ARAMA_BUTCESI, 1.0))
+                if harcanan >= self.ALTERNATIF_ARAMA_BUTCESI:
+                    raise _SearchBudgetExceeded()
+
+            arama['ilerleme'] = sayfa_ilerlemesi
+            sayfa = []
+            try:
+                for result in sonuclar:
+                    sayfa.append(result)
+                    if len(sayfa) == self.ALTERNATIF_SAYFA_BOYUTU:
+                        return siralanmis, sayfa, "devam"
+            except _SearchBudgetExceeded:
+                return siralanmis, sayfa, "sinir"
+            return siralanmis, sayfa, "bitti"
+
+        def sayfa_geldi(sonuc):
+            if not results_window.winfo_exists():
+                return
+            siralanmis, sayfa, durum = sonuc
+            arama['sayfa'] += 1
+            cancel_button.config(state="disabled")
+            for result in siralanmis:
+                sayac[0] += 1
+                gosterilen.add(result)
+                results_listbox.insert("end", f"{sayac[0]}: {result}")
+            for result in sayfa:
+                if result in gosterilen:
+                    continue
+                sayac[0] += 1
+                results_listbox.insert("end", f"{sayac[0]}: {result}")
+            progress_bar.config(value=0)
+            if durum == "devam":
+                more_button.config(state="normal")
+                status_label.config(text="")
+            elif durum == "sinir":
+                status_label.config(text="Arama sınırına ulaşıldı; daha fazla sonuç aranmadı.")
+            else:
+                status_label.config(text="Tüm sonuçlar gösterildi.")
+
+            # Eğer hiç alternatif yoksa bilgi mesajı göster
+            if arama['sayfa'] == 1 and durum != "devam" and sayac[0] <= 1:
+                results_listbox.insert("end", "Başka alternatif bulunamadı.")
+
+        def sayfa_hatasi(error):
+            if results_window.winfo_exists():
+                cancel_button.config(state="disabled")
+                status_label.config(text="")
+                messagebox.showerror("Hata", f"Sonuçlar üretilemedi: {error}", parent=results_window)
+
+        def sayfa_iptal_edildi():
+            # İptal edilen arama kaldığı yerden sürdürülemez
+            if results_window.winfo_exists():
+                cancel_button.config(state="disabled")
+                progress_bar.config(value=0)
+                status_label.config(text="Arama iptal edildi.")
+
+        def sayfa_ilerledi(oran):
+            if results_window.winfo_exists():
+                progress_bar.config(value=oran)
+
+        def load_next_page():
+            more_button.config(state="disabled")
+            cancel_button.config(state="normal")
+            status_label.config(text="Sonuçlar aranıyor...")
+            arama['is'] = BackgroundJob(
+                self.root,
+                lambda log, progress, check_cancelled: sayfa_isi(progress),
+                on_done=sayfa_geldi,
+                on_progress=sayfa_ilerledi,
+                on_error=sayfa_hatasi,
+                on_cancelled=sayfa_iptal_edildi
+            )
+            arama['is'].start()
 
-        tk.Button(results_window, text="Seçilen Sonucu Kullan", command=use_selected_result).pack(pady=10)
+        def cancel_search():
+            # Çalışan arama bir sonraki ilerleme bildiriminde durur
+            job = arama['is']
+            if job is not None and job.running:
+                job.cancel()
 
-        # Mevcut sonucu al
-        current_result = self.decrypt_result_text.get("1.0", "end-1c")
+        def close_window():
+            cancel_search()
+            results_window.destroy()
 
-        # İlk sonuç olarak mevcut sonucu ekle
-        results_listbox.insert("end", f"1: {current_result} (Mevcut)")
+        button_frame = tk.Frame(results_window)
+        button_frame.pack(pady=10)
+        tk.Button(button_frame, text="Seçilen Sonucu Kullan", command=use_selected_result).pack(side="left", padx=5)
+        more_button = tk.Button(button_frame, text="Daha Fazla Göster", command=load_next_page)
+        more_button.pack(side="left", padx=5)
+        cancel_button = tk.Button(button_frame, text="İptal", command=cancel_search, state="disabled")
+        cancel_button.pack(side="left", padx=5)
 
-        # Alternatif koordinat ve harfleri topla
-        alternatives_by_coord = {}
-        for alt in self.current_alternatives:
-            coord = alt['koordinat']
-            if coord not in alternatives_by_coord:
-                alternatives_by_coord[coord] = []
+        progress_bar = ttk.Progressbar(results_window, mode="determinate", maximum=1.0)
+        progress_bar.pack(padx=10, fill="x")
+        status_label = tk.Label(results_window, text="", font=("Arial", 10))
+        status_label.pack(pady=5)
 
-            for candidate in alt['adaylar']:
-                if candidate['harf'] not in alternatives_by_coord[coord]:
-                    alternatives_by_coord[coord].append(candidate['harf'])
-
-        # Basit kombinasyonlar oluştur (ilk birkaç koordinat için)
-        # Tüm kombinasyonları hesaplamak çok fazla olabilir, bu yüzden sadece birkaçını gösteriyoruz
-        results = [current_result]
-        count = 1
-
-        # Her koordinat için alternatifler dene
-        for coord, alternatives in alternatives_by_coord.items():
-            # Her karakter için arama
-            for i, char in enumerate(current_result):
-                # Mevcut koordinatta kullanılmış bir karakter mi?
-                for alt in self.current_alternatives:
-                    if alt['koordinat'] == coord and alt['secilen'] == char:
-                        # Bu karakterin olası alternatifleri
-                        for alt_char in alternatives:
-                            if alt_char != char:  # Kendisini hariç tut
-                                # Yeni sonuç oluştur
-                                new_result = current_result[:i] + alt_char + current_result[i + 1:]
-                                if new_result not in results:
-                                    count += 1
-                                    results.append(new_result)
-                                    results_listbox.insert("end", f"{count}: {new_result}")
-
-                                    # Maksimum 20 sonuç göster
-                                    if count >= 20:
-                                        break
-
-            # Maksimum sonuç sayısına ulaşıldıysa döngüyü bitir
-            if count >= 20:
-                break
-
-        # Eğer hiç alternatif yoksa bilgi mesajı göster
-        if count == 1:
-            results_listbox.insert("end", "Başka alternatif bulunamadı.")
+        results_window.protocol("WM_DELETE_WINDOW", close_window)
+        load_next_page()
 
     # Yardımcı fonksiyonlar
 
@@ -749,9 +1019,9 @@ class PeriodicCipherGUI:
         """
         self.input_text.delete("1.0", "end")
         self.result_text.delete("1.0", "end")
+        self.log_sink.discard()
         self.log_text.delete("1.0", "end")
-        for item in self.matches_table.get_children():
-            self.matches_table.delete(item)
+        self.matches_table.clear()
 
         # Animasyon butonu varsa devre dışı bırak
         if ANIMATIONS_AVAILABLE and hasattr(self, 'animation_button'):
@@ -763,9 +1033,9 @@ class PeriodicCipherGUI:
         """
         self.decrypt_input_text.delete("1.0", "end")
         self.decrypt_result_text.delete("1.0", "end")
+        self.decrypt_log_sink.discard()
         self.decrypt_log_text.delete("1.0", "end")
-        for item in self.alternatives_table.get_children():
-            self.alternatives_table.delete(item)
+        self.alternatives_table.clear()
 
         # Animasyon butonu varsa devre dışı bırak
         if ANIMATIONS_AVAILABLE and hasattr(self, 'decrypt_animation_button'):
@@ -793,30 +1063,16 @@ class PeriodicCipherGUI:
         """
         Şifreleme log'una mesaj ekler
         """
-        self.log_text.insert("end", message + "\n")
-        self.log_text.see("end")
+        self.log_sink(message)
 
     def add_to_decrypt_log(self, message):
         """
         Deşifreleme log'una mesaj ekler
         """
-        self.decrypt_log_text.insert("end", message + "\n")
-        self.decrypt_log_text.see("end")
+        self.decrypt_log_sink(message)
 
     # Animasyon ile ilgili yardımcı metodlar
 
-    def _highlight_table_row(self, table, item_id):
-        """
-        Tablo satırını vurgular ve sonra normal hale getirir
-        """
-        if ANIMATIONS_AVAILABLE:
-            try:
-                table.selection_set(item_id)
-                table.see(item_id)
-                self.root.after(1000, lambda: table.selection_remove(item_id))
-            except Exception as e:
-                print(f"Satır vurgulanırken hata: {e}")
-
     def show_encryption_animation(self):
         """
         Şifreleme animasyonu penceresini açar
@@ -836,49 +1092,8 @@ class PeriodicCipherGUI:
             # Şifreleme adımlarını al
             input_text = self.input_text.get("1.0", "end-1c").upper()
 
-            letter_counts = {}
-            element_infos = []
-            shifts = []
-            shifted_letters = []
-            results = []
-
-            for letter in input_text:
-                if letter not in self.cipher.turkce_alfabe:
-                    continue
-
-                letter_counts[letter] = letter_counts.get(letter, 0) + 1
-                count = letter_counts[letter]
-
-                element_info = self.cipher.get_element_for_letter(letter, count)
-                if element_info is None:
-                    continue
-
-                element_infos.append(element_info)
-
-                shift = self.cipher.orbital_to_shift(element_info['orbital'], element_info['son_katman'])
-                shifts.append(shift)
-
-                shifted_letter = self.cipher.shift_letter(letter, shift)
-                shifted_letters.append(shifted_letter)
-
-                shifted_element = None
-                for katman_dict in [self.cipher.katman1_elementler,
-                                    self.cipher.katman2_elementler,
-                                    self.cipher.katman3_elementler]:
-                    if shifted_letter in katman_dict:
-                        shifted_element = katman_dict[shifted_letter]
-                        break
-
-                if shifted_element:
-                    coord = f"{shifted_element['konum'][0]:02d}{shifted_element['konum'][1]:02d}"
-                    results.append(coord)
-                else:
-                    results.append(shifted_letter)
-
             # Animasyon adımlarını ekle
-            self.encryption_animator.add_encryption_steps(
-                input_text, letter_counts, element_infos, shifts, shifted_letters, results
-            )
+            self.encryption_animator.add_encryption_steps(self.cipher, input_text)
         except Exception as e:
             print(f"Şifreleme animasyonu gösterilirken hata: {e}")
             messagebox.showerror("Hata", f"Animasyon oluşturulurken bir hata oluştu: {e}")
@@ -902,62 +1117,8 @@ class PeriodicCipherGUI:
             # Deşifreleme adımlarını al
             input_text = self.decrypt_input_text.get("1.0", "end-1c").strip()
 
-            coordinates = []
-            shifted_letters = []
-            original_letters = []
-            results = []
-
-            # Deşifreleme işlemini taklit ederek adımları oluştur
-            i = 0
-            while i < len(input_text):
-                if i + 3 < len(input_text) and input_text[i:i + 4].isdigit():
-                    coord = input_text[i:i + 4]
-
-                    shifted_letter = self.cipher.get_letter_from_coordinates(coord)
-                    if shifted_letter:
-                        shifted_letters.append(shifted_letter)
-
-                        # En olası orijinal harfi bul
-                        candidate_list = []
-                        for candidate in self.cipher.turkce_alfabe:
-                            for katman in range(1, 4):
-                                if katman == 1:
-                                    element_info = self.cipher.katman1_elementler.get(candidate)
-                                elif katman == 2:
-                                    element_info = self.cipher.katman2_elementler.get(candidate)
-                                else:
-                                    element_info = self.cipher.katman3_elementler.get(candidate)
-
-                                if not element_info:
-                                    continue
-
-                                shift = self.cipher.orbital_to_shift(element_info['orbital'],
-                                                                     element_info['son_katman'])
-                                if self.cipher.shift_letter(candidate, shift) == shifted_letter:
-                                    candidate_list.append(candidate)
-
-                        if candidate_list:
-                            original_letter = candidate_list[0]
-                            original_letters.append(original_letter)
-                            results.append(original_letter)
-                        else:
-                            original_letters.append(shifted_letter)
-                            results.append(shifted_letter)
-                    else:
-                        shifted_letters.append("?")
-                        original_letters.append("?")
-                        results.append(coord)
-
-                    coordinates.append(coord)
-                    i += 4
-                else:
-                    results.append(input_text[i])
-                    i += 1
-
             # Animasyon adımlarını ekle
-            self.encryption_animator.add_decryption_steps(
-                input_text, coordinates, shifted_letters, original_letters, results
-            )
+            self.encryption_animator.add_decryption_steps(self.cipher, input_text)
         except Exception as e:
             print(f"Deşifreleme animasyonu gösterilirken hata: {e}")
             messagebox.showerror("Hata", f"Animasyon oluşturulurken bir hata oluştu: {e}")
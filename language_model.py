@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Türkçe Dil Modeli
+
+Deşifre adaylarını Türkçe harf n-gram olasılıkları ve bir kelime listesinden
+oluşturulan kelime ağacı (trie) ile puanlar. Puanlayıcı durumu küçük ve
+değiştirilemez olduğundan, şifreleyicinin ışın (beam) aramasında aynı
+durumdaki adaylar birleştirilebilir.
+"""
+
+import math
+import os
+
+from data import TURKCE_ALFABE
+
+# Varsayılan kelime listesi (satır başına bir kelime)
+VARSAYILAN_KELIME_LISTESI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kelimeler.txt")
+
+# Harf olmayan tüm karakterler n-gram modelinde kelime sınırı olarak görülür
+_SINIR = " "
+
+_HARFLER = frozenset(TURKCE_ALFABE)
+
+# Şifreleyici str.upper() kullandığından "i" harfi şifreli metinde "I" olarak
+# kalır; kelime ağacı ve n-gramlarda "İ" ile "I" aynı harf sayılır
+_I_KATLAMA = str.maketrans("İ", "I")
+
+
+def turkish_upper(text):
+    """
+    Metni Türkçe kurallarıyla büyük harfe çevirir (i → İ, ı → I)
+    """
+    return text.replace("i", "İ").replace("ı", "I").upper()
+
+
+class WordTrie:
+    """
+    Kelime listesinden oluşturulan sıkıştırılmış kelime ağacı
+
+    Düğümler tamsayıdır (kök: 0); kenarlar tek bir (düğüm, harf) → düğüm
+    sözlüğünde, kelime sonu bilgisi ise bir bytearray içinde tutulur.
+    """
+
+    def __init__(self, words=()):
+        self._kenarlar = {}
+        self._kelime_sonu = bytearray(1)
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return len(self._kelime_sonu)
+
+    def add(self, word):
+        """
+        Kelimeyi ağaca ekler
+        """
+        node = 0
+        for harf in word:
+            child = self._kenarlar.get((node, harf))
+            if child is None:
+                child = len(self._kelime_sonu)
+                self._kenarlar[(node, harf)] = child
+                self._kelime_sonu.append(0)
+            node = child
+        self._kelime_sonu[node] = 1
+
+    def child(self, node, harf):
+        """
+        Düğümün harf ile devam eden alt düğümünü döndürür (yoksa -1)
+        """
+        return self._kenarlar.get((node, harf), -1)
+
+    def is_word(self, node):
+        """
+        Düğümde bir kelimenin bitip bitmediğini döndürür
+        """
+        return node >= 0 and self._kelime_sonu[node] == 1
+
+    def __contains__(self, word):
+        node = 0
+        for harf in word:
+            node = self.child(node, harf)
+            if node < 0:
+                return False
+        return self.is_word(node)
+
+
+class LanguageScorer:
+    """
+    Harf n-gram modeli ve kelime ağacıyla çalışan deşifre puanlayıcısı
+
+    Puan, metnin n-gram modelindeki log-olasılığı ile kelime ağacından gelen
+    ödül ve cezaların toplamıdır; büyük puan daha olası metin demektir.
+    Puanlama durumu (son n-1 karakter, ağaç düğümü) ikilisidir. Eğitimde ve
+    puanlamada "İ" harfi "I" ile birleştirilir; böylece "bir" yazılıp
+    şifrelenen "BIR" de "BİR" de aynı kelime olarak bulunur.
+    """
+
+    def __init__(self, words, order=3, word_bonus=4.0, unknown_word_penalty=2.0):
+        """
+        Parameters:
+        -----------
+        words : iterable of str
+            Modelin eğitileceği kelimeler
+        order : int, optional
+            Harf n-gram derecesi
+        word_bonus : float, optional
+            Ağaçta bulunan her tamamlanmış kelime için eklenen puan
+        unknown_word_penalty : float, optional
+            Ağaçtaki hiçbir kelimenin öneki olmayan her kelime için düşülen puan
+        """
+        self.order = order
+        self.word_bonus = word_bonus
+        self.unknown_word_penalty = unknown_word_penalty
+        self.trie = WordTrie()
+
+        # Bağlam uzunluğuna göre n-gram ve bağlam sayıları
+        self._ngram_sayilari = [{} for _ in range(order)]
+        self._baglam_sayilari = [{} for _ in range(order)]
+
+        for word in words:
+            word = turkish_upper(word.strip()).translate(_I_KATLAMA)
+            if not word or not set(word) <= _HARFLER:
+                continue
+            self.trie.add(word)
+            dolgulu = _SINIR * (order - 1) + word + _SINIR
+            for i in range(order - 1, len(dolgulu)):
+                for uzunluk in range(order):
+                    baglam = dolgulu[i - uzunluk:i]
+                    ngram = (baglam, dolgulu[i])
+                    self._ngram_sayilari[uzunluk][ngram] = self._ngram_sayilari[uzunluk].get(ngram, 0) + 1
+                    self._baglam_sayilari[uzunluk][baglam] = self._baglam_sayilari[uzunluk].get(baglam, 0) + 1
+
+        # Hesaplanan log-olasılıklar (bağlam, karakter) ile önbelleğe alınır
+        self._log_olasilik = {}
+        self._sozcuk_boyu = len(TURKCE_ALFABE) + 1
+
+    @classmethod
+    def from_file(cls, path=VARSAYILAN_KELIME_LISTESI, **kwargs):
+        """
+        Satır başına bir kelime içeren dosyadan puanlayıcı oluşturur
+
+        Parameters:
+        -----------
+        path : str, optional
+            Kelime listesi dosyası
+
+        Returns:
+        --------
+        LanguageScorer
+            Eğitilmiş puanlayıcı
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls((line for line in f if not line.startswith("#")), **kwargs)
+
+    def start_state(self):
+        """
+        Metin başındaki puanlama durumunu döndürür
+        """
+        return (_SINIR * (self.order - 1), 0)
+
+    def log_probability(self, baglam, karakter):
+        """
+        Karakterin verilen bağlamdan sonra gelme log-olasılığını döndürür
+
+        Farklı bağlam uzunluklarındaki tahminler eşit ağırlıkla karıştırılır;
+        görülmemiş karakterler için düzgün dağılım payı bırakılır.
+        """
+        anahtar = (baglam, karakter)
+        logp = self._log_olasilik.get(anahtar)
+        if logp is not None:
+            return logp
+
+        olasilik = 1.0 / self._sozcuk_boyu
+        agirlik = 1.0 / (self.order + 1)
+        for uzunluk in range(self.order):
+            alt_baglam = baglam[len(baglam) - uzunluk:]
+            toplam = self._baglam_sayilari[uzunluk].get(alt_baglam)
+            if toplam:
+                olasilik += self._ngram_sayilari[uzunluk].get((alt_baglam, karakter), 0) / toplam
+        logp = math.log(olasilik * agirlik)
+        self._log_olasilik[anahtar] = logp
+        return logp
+
+    def advance(self, state, karakter):
+        """
+        Puanlama durumunu bir karakter ilerletir
+
+        Parameters:
+        -----------
+        state : tuple
+            Mevcut puanlama durumu
+        karakter : str
+            Sıradaki karakter
+
+        Returns:
+        --------
+        tuple
+            Yeni puanlama durumu
+        float
+            Karakterin puana katkısı
+        """
+        baglam, node = state
+        if karakter not in _HARFLER:
+            if baglam[-1:] == _SINIR:
+                # Ardışık sınırlar tek sınır gibi puanlanır
+                return state, 0.0
+            puan = self.log_probability(baglam, _SINIR)
+            if self.trie.is_word(node):
+                puan += self.word_bonus
+            elif node < 0:
+                puan -= self.unknown_word_penalty
+            # Her kelime eğitimdeki gibi boş bağlamla başlar
+            return self.start_state(), puan
+
+        if karakter == "İ":
+            karakter = "I"
+        puan = self.log_probability(baglam, karakter)
+        if node >= 0:
+            node = self.trie.child(node, karakter)
+        return ((baglam + karakter)[1:] if baglam else baglam, node), puan
+
+    def score_text(self, state, text):
+        """
+        Puanlama durumunu bir metin boyunca ilerletir
+
+        Returns:
+        --------
+        tuple
+            Yeni puanlama durumu
+        float
+            Metnin puana katkısı
+        """
+        toplam = 0.0
+        advance = self.advance
+        for karakter in text:
+            state, puan = advance(state, karakter)
+            toplam += puan
+        return state, toplam
+
+    def finish(self, state):
+        """
+        Metin sonundaki yarım kelimenin puan katkısını döndürür
+        """
+        return self.advance(state, _SINIR)[1]
+
+    def score(self, text):
+        """
+        Bir metnin toplam puanını döndürür
+        """
+        state, puan = self.score_text(self.start_state(), turkish_upper(text))
+        return puan + self.finish(state)
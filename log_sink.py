@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Tamponlu Log Aktarımı
+
+Şifreleme/deşifreleme log mesajlarını toplayıp Text widget'ına toplu olarak
+yazar. Her mesaj için ayrı insert/see çağrısı yerine, tampon belirli sayıda
+mesaja ulaştığında veya belirli bir süre geçtiğinde tek bir insert yapılır.
+"""
+
+
+class BufferedLogSink:
+    """
+    Log mesajlarını tamponlayıp Text widget'ına toplu yazan geri çağırma nesnesi
+
+    Nesne doğrudan callback olarak verilebilir: sink(mesaj) tek mesaj,
+    sink.extend(mesajlar) çoklu mesaj ekler. Tampon batch_size mesaja
+    ulaşınca hemen, aksi halde interval_ms sonra boşta kalındığında
+    (after_idle) boşaltılır.
+    """
+
+    def __init__(self, text_widget, batch_size=2000, interval_ms=100):
+        """
+        Parameters:
+        -----------
+        text_widget : tk.Text
+            Mesajların yazılacağı widget
+        batch_size : int, optional
+            Tamponun hemen boşaltılacağı mesaj sayısı
+        interval_ms : int, optional
+            Tampon dolmasa da boşaltılmadan önce beklenecek en uzun süre
+        """
+        self.text_widget = text_widget
+        self.batch_size = batch_size
+        self.interval_ms = interval_ms
+        self._tampon = []
+        self._zamanlayici = None
+
+    def __call__(self, message):
+        self._tampon.append(message)
+        self._after_add()
+
+    def extend(self, messages):
+        """
+        Birden fazla mesajı tek çağrıda tampona ekler
+        """
+        self._tampon.extend(messages)
+        self._after_add()
+
+    def _after_add(self):
+        """
+        Tampon dolduysa boşaltır, dolmadıysa boşaltmayı zamanlar
+        """
+        if len(self._tampon) >= self.batch_size:
+            self.flush()
+        elif self._zamanlayici is None:
+            self._zamanlayici = self.text_widget.after(
+                self.interval_ms, lambda: self.text_widget.after_idle(self.flush))
+
+    def flush(self):
+        """
+        Tampondaki mesajları tek insert ile widget'a yazar
+        """
+        self._cancel_timer()
+        if not self._tampon:
+            return
+        metin = "\n".join(self._tampon) + "\n"
+        self._tampon = []
+        self.text_widget.insert("end", metin)
+        self.text_widget.see("end")
+
+    def discard(self):
+        """
+        Henüz yazılmamış mesajları atar (widget temizlenirken)
+        """
+        self._cancel_timer()
+        self._tampon = []
+
+    def _cancel_timer(self):
+        if self._zamanlayici is not None:
+            try:
+                self.text_widget.after_cancel(self._zamanlayici)
+            except Exception:
+                pass
+            self._zamanlayici = None
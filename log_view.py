@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Sanal Log Görünümü
+
+Şifreleme ve deşifreleme logları çok uzun olabildiğinden, satırlar sabit
+kapasiteli bir halka tamponda tutulur ve Text widget'ına yalnızca görünen
+pencere ile çevresindeki bir pay yazılır. Kaydırıldıkça ilgili bölge
+tampondan yeniden yüklenir; böylece bellek ve çizim süresi log uzunluğundan
+bağımsız kalır.
+"""
+
+import tkinter as tk
+from tkinter import ttk, font as tkfont
+
+
+class VirtualLogView(tk.Frame):
+    """
+    Halka tampon destekli, yalnızca görünen satırları çizen log görünümü
+
+    Log yazan kodlar için Text benzeri bir arayüz sunar: insert("end", metin)
+    sona ekler, delete("1.0", "end") tümünü temizler, see("end") görünümü
+    sona kilitler. Tampon dolduğunda en eski satırlar atılır.
+    """
+
+    def __init__(self, parent, height=10, max_lines=200000, margin=100, max_line_chars=2000, **text_options):
+        """
+        Parameters:
+        -----------
+        parent : tk.Widget
+            Görünümün yerleştirileceği widget
+        height : int, optional
+            Görünen satır sayısı
+        max_lines : int, optional
+            Tamponda tutulan en fazla satır sayısı
+        margin : int, optional
+            Görünen pencerenin üstünde ve altında ayrıca çizilen satır sayısı
+        max_line_chars : int, optional
+            Bir satırın çizilen en fazla karakter sayısı (fazlası kısaltılır)
+        """
+        super().__init__(parent)
+        self.max_lines = max_lines
+        self.margin = margin
+        self.max_line_chars = max_line_chars
+
+        self.text = tk.Text(self, height=height, **text_options)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.text.pack(side="left", fill="both", expand=True)
+
+        for sequence, adim in (("<Button-4>", -3), ("<Button-5>", 3), ("<Prior>", None), ("<Next>", None)):
+            self.text.bind(sequence, lambda event, adim=adim: self._on_key_scroll(event, adim))
+        self.text.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.text.bind("<Configure>", lambda event: self._schedule_render())
+
+        self._satir_yuksekligi = tkfont.Font(font=self.text.cget("font")).metrics("linespace")
+        self._reset()
+
+    def _reset(self):
+        self._satirlar = []
+        self._bas = 0
+        self._acik = ""
+        self.dropped = 0
+        self._ust = 0
+        self._takip = True
+        self._surum = 0
+        self._cizilen = None
+        self._zamanlayici = None
+
+    # Text benzeri arayüz
+
+    def insert(self, index, text):
+        """
+        Metni logun sonuna ekler (yalnızca "end" konumu desteklenir)
+        """
+        parcalar = text.split("\n")
+        self._acik += parcalar[0]
+        for parca in parcalar[1:]:
+            self._append_line(self._acik)
+            self._acik = parca
+        self._surum += 1
+        self._schedule_render()
+
+    def delete(self, start="1.0", end="end"):
+        """
+        Tüm logu temizler
+        """
+        if self._zamanlayici is not None:
+            self.after_cancel(self._zamanlayici)
+        self._reset()
+        self.text.delete("1.0", "end")
+        self.scrollbar.set(0.0, 1.0)
+
+    def see(self, index):
+        """
+        Görünümü logun sonuna kilitler
+        """
+        self._takip = True
+        self._schedule_render()
+
+    def line_count(self):
+        """
+        Tampondaki satır sayısını döndürür (yazılmakta olan son satır dahil)
+        """
+        return len(self._satirlar) + 1
+
+    def get_line(self, index):
+        """
+        Tampondaki index. satırı döndürür (0 en eski satırdır)
+        """
+        if index == len(self._satirlar):
+            return self._acik
+        return self._satirlar[(self._bas + index) % len(self._satirlar)]
+
+    # Halka tampon
+
+    def _append_line(self, line):
+        if len(self._satirlar) < self.max_lines:
+            self._satirlar.append(line)
+            return
+        self._satirlar[self._bas] = line
+        self._bas = (self._bas + 1) % self.max_lines
+        self.dropped += 1
+        if not self._takip:
+            # Kullanıcının baktığı satırlar yerinde kalsın
+            self._ust = max(0, self._ust - 1)
+
+    # Çizim
+
+    def _visible_lines(self):
+        return max(int(self.text.cget("height")), self.text.winfo_height() // max(self._satir_yuksekligi, 1))
+
+    def _schedule_render(self):
+        if self._zamanlayici is None:
+            self._zamanlayici = self.after_idle(self._render)
+
+    def _render(self):
+        """
+        Görünen pencereyi (ve payını) Text widget'ına yazar
+        """
+        self._zamanlayici = None
+        toplam = self.line_count()
+        gorunur = self._visible_lines()
+        en_ust = max(0, toplam - gorunur)
+        self._ust = en_ust if self._takip else min(self._ust, en_ust)
+
+        bas = max(0, self._ust - self.margin)
+        son = min(toplam, self._ust + gorunur + self.margin)
+        if self._cizilen != (bas, son, self._surum):
+            sinir = self.max_line_chars
+            satirlar = []
+            for i in range(bas, son):
+                satir = self.get_line(i)
+                satirlar.append(satir if len(satir) <= sinir else satir[:sinir] + "…")
+            self.text.delete("1.0", "end")
+            self.text.insert("1.0", "\n".join(satirlar))
+            self._cizilen = (bas, son, self._surum)
+
+        self.text.yview(f"{self._ust - bas + 1}.0")
+        self.scrollbar.set(self._ust / toplam, min(1.0, (self._ust + gorunur) / toplam))
+
+    # Kaydırma
+
+    def _scroll_to(self, ust):
+        en_ust = max(0, self.line_count() - self._visible_lines())
+        self._ust = max(0, min(int(ust), en_ust))
+        self._takip = self._ust >= en_ust
+        self._render()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * self.line_count())
+        elif args[0] == "scroll":
+            adim = int(args[1])
+            if args[2] == "pages":
+                adim *= self._visible_lines()
+            self._scroll_to(self._ust + adim)
+
+    def _on_mouse_wheel(self, event):
+        self._scroll_to(self._ust + (-3 if event.delta > 0 else 3))
+        return "break"
+
+    def _on_key_scroll(self, event, adim):
+        if adim is None:
+            adim = self._visible_lines() * (-1 if event.keysym == "Prior" else 1)
+        self._scroll_to(self._ust + adim)
+        return "break"
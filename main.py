@@ -4,8 +4,16 @@
 Periyodik Tablo Şifreleme Uygulaması - Ana Giriş Dosyası
 """
 
-from gui import PeriodicCipherGUI
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Argüman verilmişse arayüz yerine toplu işleme modu çalışır
+        from bulk import main
+
+        sys.exit(main(sys.argv[1:]))
+
+    from gui import PeriodicCipherGUI
+
     app = PeriodicCipherGUI()
     app.run()
\ No newline at end of file
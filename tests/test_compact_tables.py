@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Sıkıştırılmış element tablolarıyla oluşturulan şifreleyici testleri
+"""
+
+import os
+import subprocess
+import sys
+
+from cipher import PeriodicCipher
+from element_tables import CompactElementTables
+
+KOK_DIZIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# İşçi süreç gibi yalnızca tablo baytlarıyla şifreleyici kurup deşifre eder
+_ISCI_BETIGI = """
+import sys
+from cipher import PeriodicCipher
+from element_tables import CompactElementTables
+
+cipher = PeriodicCipher(tables=CompactElementTables.from_bytes(sys.stdin.buffer.read()))
+sonuc = cipher.decrypt(sys.argv[1], trace=False)[0]
+print(sonuc)
+print("element_registry" in sys.modules)
+print(hasattr(cipher, "_koordinat_indeksi"))
+"""
+
+
+def test_unknown_coordinate_in_non_ascii_text_keeps_registry_unloaded():
+    tam = PeriodicCipher()
+    blob = CompactElementTables.from_cipher(tam).to_bytes()
+    sifreli = "Ş0101 9999"
+
+    sonuc = subprocess.run(
+        [sys.executable, "-c", _ISCI_BETIGI, sifreli],
+        input=blob, capture_output=True, cwd=KOK_DIZIN, check=True,
+        env=dict(os.environ, PYTHONIOENCODING="utf-8"),
+    )
+    cozulmus, registry_yuklu, indeks_var = sonuc.stdout.decode("utf-8").splitlines()
+
+    assert cozulmus == tam.decrypt(sifreli, trace=False)[0]
+    assert registry_yuklu == "False"
+    assert indeks_var == "False"
+
+
+def test_non_ascii_digits_resolve_like_ascii_coordinates():
+    tam = PeriodicCipher()
+    compact = PeriodicCipher(tables=CompactElementTables.from_cipher(tam))
+    sifreli = tam.encrypt("MERHABA", trace=False)[0]
+    # Arapça-Hint rakamları (U+0660..U+0669) aynı koordinatları ifade eder
+    arapca = sifreli.translate({ord(str(d)): chr(0x0660 + d) for d in range(10)})
+
+    assert compact.decrypt("Ş" + arapca, trace=False)[0] == "Ş" + tam.decrypt(sifreli, trace=False)[0]
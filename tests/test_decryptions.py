@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Deşifre sonuçlarını dolaşan iter_decryptions testleri
+"""
+
+from itertools import islice
+
+import pytest
+
+from cipher import PeriodicCipher
+
+METIN = "MERHABA DÜNYA, BU BİR DENEME METNİDİR."
+
+
+@pytest.fixture(scope="module")
+def cipher():
+    return PeriodicCipher()
+
+
+def test_results_reencrypt_to_ciphertext_without_duplicates(cipher):
+    sifreli = cipher.encrypt(METIN, trace=False)[0]
+    sonuclar = list(islice(cipher.iter_decryptions(sifreli), 500))
+
+    assert len(sonuclar) > 1
+    assert len(set(sonuclar)) == len(sonuclar)
+    for sonuc in sonuclar:
+        assert cipher.encrypt(sonuc, trace=False)[0] == sifreli
+
+
+@pytest.mark.parametrize("metin", ["MERHABA DÜNYA", "PERİYODİK TABLO ŞİFRELEME", "KIRMIZI ELMA, YEŞİL ARMUT."])
+def test_first_result_matches_decrypt(cipher, metin):
+    # Bu metinlerde decrypt'in alfabetik ilk aday seçimi çıkmaza girmez
+    sifreli = cipher.encrypt(metin, trace=False)[0]
+
+    assert next(cipher.iter_decryptions(sifreli)) == cipher.decrypt(sifreli, trace=False)[0]
+
+
+def test_all_results_of_short_text_include_plaintext(cipher):
+    sifreli = cipher.encrypt("BU BİR DENEME", trace=False)[0]
+    sonuclar = list(cipher.iter_decryptions(sifreli))
+
+    assert "BU BİR DENEME" in sonuclar
+    assert len(set(sonuclar)) == len(sonuclar)
+
+
+def test_progress_exception_stops_search(cipher):
+    class Durdur(Exception):
+        pass
+
+    def progress(dugum):
+        raise Durdur()
+
+    # Uzun metinde ilk _ILERLEME_ARALIGI düğüm dolmadan sonuç bitmez
+    sifreli = cipher.encrypt(METIN * 40, trace=False)[0]
+    with pytest.raises(Durdur):
+        list(islice(cipher.iter_decryptions(sifreli, progress=progress), 5000))
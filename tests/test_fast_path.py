@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Log üretmeyen (trace=False) şifreleme ve deşifreleme testleri
+"""
+
+import pytest
+
+from cipher import PeriodicCipher
+
+KARISIK_METINLER = [
+    "merhaba dünya, çğıöşü ve ÇĞİÖŞÜ!",
+    "şifre: 2024 yılı, saat 09:45 — iyi günler?",
+    "aaaa bbbb ıııı iiii 1234 5678",
+    "",
+]
+
+
+@pytest.fixture(scope="module")
+def cipher():
+    return PeriodicCipher()
+
+
+@pytest.mark.parametrize("metin", KARISIK_METINLER)
+def test_untraced_encrypt_matches_traced(cipher, metin):
+    sonuc, adimlar, eslesmeler = cipher.encrypt(metin, trace=False)
+
+    assert sonuc == cipher.encrypt(metin)[0]
+    assert adimlar == [] and eslesmeler == []
+
+
+@pytest.mark.parametrize("metin", KARISIK_METINLER)
+def test_untraced_decrypt_matches_traced(cipher, metin):
+    sifreli = cipher.encrypt(metin, trace=False)[0]
+    sonuc, adimlar, alternatifler = cipher.decrypt(sifreli, trace=False)
+
+    assert sonuc == cipher.decrypt(sifreli)[0]
+    assert adimlar == [] and alternatifler == []
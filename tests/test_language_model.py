@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Dil modeliyle deşifre sıralaması testleri
+"""
+
+import pytest
+
+from cipher import PeriodicCipher
+from language_model import LanguageScorer
+
+
+@pytest.fixture(scope="module")
+def cipher():
+    return PeriodicCipher()
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return LanguageScorer.from_file()
+
+
+@pytest.mark.parametrize("metin", [
+    "Merhaba dünya, bugün hava çok güzel.",
+    "Bu bir deneme",
+    "bilgi iyi bir şeydir",
+    "Her şey bitti mi?",
+])
+def test_real_sentence_ranks_first(cipher, scorer, metin):
+    sifreli = cipher.encrypt(metin, trace=False)[0]
+
+    assert cipher.rank_decryptions(sifreli, scorer)[0][0] == metin.upper()
+
+
+def test_dotted_and_dotless_capital_i_find_the_same_word(scorer):
+    # encrypt str.upper() kullanır: "bir" → "BIR"
+    assert "bir".upper() in scorer.trie
+    assert scorer.score("BIR") == scorer.score("BİR")
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+encrypt_stream ve decrypt_stream testleri
+"""
+
+import io
+
+import pytest
+
+from cipher import PeriodicCipher
+
+# Aynı harfin ardışık kullanımları farklı katmanlara düştüğünden parça sınırı
+# harflerin kullanım sayısını böler
+METIN = "AAAA BABA, ŞİŞLİ'DE ÇAY 42 İÇTİK. ııı iii"
+
+
+@pytest.fixture(scope="module")
+def cipher():
+    return PeriodicCipher()
+
+
+def _parcala(metin, sinir):
+    return [metin[:sinir], metin[sinir:]]
+
+
+def test_encrypt_stream_matches_single_call_at_every_boundary(cipher):
+    beklenen = cipher.encrypt(METIN, trace=False)[0]
+    for sinir in range(len(METIN) + 1):
+        assert "".join(cipher.encrypt_stream(_parcala(METIN, sinir))) == beklenen, sinir
+
+
+def test_decrypt_stream_matches_single_call_at_every_boundary(cipher):
+    sifreli = cipher.encrypt(METIN, trace=False)[0]
+    beklenen = cipher.decrypt(sifreli, trace=False)[0]
+    # Sınırların çoğu 4 haneli bir koordinatın ortasına düşer
+    for sinir in range(len(sifreli) + 1):
+        assert "".join(cipher.decrypt_stream(_parcala(sifreli, sinir))) == beklenen, sinir
+
+
+def test_decrypt_stream_traced_matches_single_call_at_split_coordinate(cipher):
+    sifreli = cipher.encrypt(METIN, trace=False)[0]
+    beklenen = cipher.decrypt(sifreli)[0]
+    sinir = next(i for i in range(1, len(sifreli)) if sifreli[i - 1:i + 1].isdigit())
+
+    mesajlar = []
+    sonuc = "".join(cipher.decrypt_stream(_parcala(sifreli, sinir), callback=mesajlar.append))
+    assert sonuc == beklenen
+    assert mesajlar
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4, 7])
+def test_streams_read_file_objects_in_small_chunks(cipher, chunk_size):
+    sifreli = cipher.encrypt(METIN, trace=False)[0]
+
+    assert "".join(cipher.encrypt_stream(io.StringIO(METIN), chunk_size=chunk_size)) == sifreli
+    assert ("".join(cipher.decrypt_stream(io.StringIO(sifreli), chunk_size=chunk_size))
+            == cipher.decrypt(sifreli, trace=False)[0])
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Periyodik Tablo Şifreleme Uygulaması - Sanal Tablo
+
+Eşleşme ve alternatif tabloları çok satırlı olabildiğinden, satır verileri
+indeksle okunabilen bir dizide tutulur ve Treeview'da yalnızca görünen
+sayfanın öğeleri oluşturulur. Kaydırıldıkça sayfa modelden yeniden doldurulur.
+"""
+
+from collections import deque
+from tkinter import ttk
+
+from frame_scheduler import FrameScheduler
+
+
+class VirtualTable(ttk.Frame):
+    """
+    Yalnızca görünen satırlar için Treeview öğesi oluşturan tablo
+
+    Satırlar model indeksleriyle adreslenir; Treeview öğelerinin kimlikleri
+    de model indeksinin metin halidir.
+    """
+
+    def __init__(self, parent, columns, headings, widths=None, height=5):
+        """
+        Parameters:
+        -----------
+        parent : tk.Widget
+            Tablonun yerleştirileceği widget
+        columns : tuple
+            Sütun adları
+        headings : dict
+            Sütun adı → başlık metni
+        widths : dict, optional
+            Sütun adı → sütun genişliği
+        height : int, optional
+            Görünen en az satır sayısı
+        """
+        super().__init__(parent)
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=height, selectmode="browse")
+        for column in columns:
+            self.tree.heading(column, text=headings.get(column, column))
+            if widths and column in widths:
+                self.tree.column(column, width=widths[column])
+        self.tree.tag_configure("vurgu", background="#ffff99")
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", lambda event: self._scroll_by(-3 if event.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda event: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda event: self._scroll_by(3))
+        self.tree.bind("<Up>", lambda event: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda event: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda event: self._scroll_by(-self._page_size()))
+        self.tree.bind("<Next>", lambda event: self._scroll_by(self._page_size()))
+        self.tree.bind("<Configure>", lambda event: self._render())
+
+        satir_yuksekligi = ttk.Style().lookup("Treeview", "rowheight")
+        self._satir_yuksekligi = int(satir_yuksekligi) if satir_yuksekligi else 20
+
+        self._satirlar = []
+        self._ust = 0
+        self._secili = None
+        self._vurgu_zamanlayici = None
+
+    # Model
+
+    def set_rows(self, rows):
+        """
+        Tablonun tüm satırlarını değiştirir ve başa döner
+
+        len() ve indeksle okunabilen diziler (liste, MatchTable) kopyalanmadan
+        sahiplenilir; diğer yinelenebilirler bir kez listeye çevrilir. Her
+        satır bir değer dizisidir. set_row yalnızca değiştirilebilir dizilerde
+        kullanılabilir.
+        """
+        self._cancel_highlight()
+        if not (hasattr(rows, '__len__') and hasattr(rows, '__getitem__')):
+            rows = list(rows)
+        self._satirlar = rows
+        self._ust = 0
+        self._secili = None
+        self._render()
+
+    def clear(self):
+        """
+        Tüm satırları siler
+        """
+        self.set_rows([])
+
+    def row_count(self):
+        return len(self._satirlar)
+
+    def get_row(self, index):
+        """
+        index. satırın değerlerini döndürür
+        """
+        return self._satirlar[index]
+
+    def set_row(self, index, values):
+        """
+        index. satırın değerlerini günceller
+        """
+        self._satirlar[index] = tuple(values)
+        if self.tree.exists(str(index)):
+            self.tree.item(str(index), values=self._satirlar[index])
+
+    def selected_index(self):
+        """
+        Seçili satırın model indeksini döndürür (seçim yoksa None)
+        """
+        return self._secili
+
+    # Çizim
+
+    def _page_size(self):
+        baslik_payi = self._satir_yuksekligi + 5
+        sigan = (self.tree.winfo_height() - baslik_payi) // self._satir_yuksekligi
+        return max(int(self.tree.cget("height")), sigan)
+
+    def _render(self):
+        """
+        Görünen sayfanın Treeview öğelerini modelden yeniden oluşturur
+        """
+        sayfa = self._page_size()
+        self._ust = max(0, min(self._ust, len(self._satirlar) - sayfa))
+        son = min(len(self._satirlar), self._ust + sayfa)
+
+        self.tree.delete(*self.tree.get_children())
+        for index in range(self._ust, son):
+            self.tree.insert("", "end", iid=str(index), values=self._satirlar[index])
+        if self._secili is not None and self._ust <= self._secili < son:
+            self.tree.selection_set(str(self._secili))
+
+        if self._satirlar:
+            self.scrollbar.set(self._ust / len(self._satirlar), son / len(self._satirlar))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    # Kaydırma ve seçim
+
+    def _scroll_to(self, ust):
+        self._ust = max(0, min(int(ust), len(self._satirlar) - self._page_size()))
+        self._render()
+
+    def _scroll_by(self, adim):
+        self._scroll_to(self._ust + adim)
+        return "break"
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * len(self._satirlar))
+        elif args[0] == "scroll":
+            adim = int(args[1])
+            if args[2] == "pages":
+                adim *= self._page_size()
+            self._scroll_by(adim)
+
+    def _on_select(self, event):
+        secim = self.tree.selection()
+        if secim:
+            self._secili = int(secim[0])
+
+    def _move_selection(self, adim):
+        if not self._satirlar:
+            return "break"
+        secili = 0 if self._secili is None else self._secili + adim
+        self._secili = max(0, min(secili, len(self._satirlar) - 1))
+        if self._secili < self._ust:
+            self._ust = self._secili
+        elif self._secili >= self._ust + self._page_size():
+            self._ust = self._secili - self._page_size() + 1
+        self._render()
+        return "break"
+
+    # Vurgulama
+
+    def highlight_visible(self, delay=500, interval=300, duration=1000):
+        """
+        Ekrandaki satırları sırayla kısa süre vurgular
+
+        Yalnızca görünen satırlar canlandırılır ve tüm vurgu tek bir ortak
+        zamanlayıcı animasyonuyla yürütülür; satır sayısı ne olursa olsun
+        animasyon en fazla bir sayfa sürer.
+        """
+        self._cancel_highlight()
+        satirlar = list(range(self._ust, min(len(self._satirlar), self._ust + self._page_size())))
+        acik = deque()
+        gecen_sure = 0.0
+        k = 0
+
+        def kare(gecen):
+            nonlocal gecen_sure, k
+            gecen_sure += gecen
+            while k < len(satirlar) and gecen_sure >= delay + k * interval:
+                iid = str(satirlar[k])
+                if self.tree.exists(iid):
+                    self.tree.item(iid, tags=("vurgu",))
+                    acik.append((iid, delay + k * interval + duration))
+                k += 1
+            while acik and gecen_sure >= acik[0][1]:
+                iid = acik.popleft()[0]
+                if self.tree.exists(iid):
+                    self.tree.item(iid, tags=())
+            if k < len(satirlar) or acik:
+                return True
+            self._vurgu_zamanlayici = None
+            return False
+
+        self._vurgu_zamanlayici = FrameScheduler.for_widget(self).add(
+            kare, self.tree, interval_ms=min(interval, 100), delay_ms=delay)
+
+    def _cancel_highlight(self):
+        if self._vurgu_zamanlayici is not None:
+            self._vurgu_zamanlayici.cancel()
+            self._vurgu_zamanlayici = None
+        for iid in self.tree.tag_has("vurgu"):
+            self.tree.item(iid, tags=())